@@ -2205,7 +2205,7 @@ class USDViewerWindow(QMainWindow):
             # Select prims in hierarchy
             self.hierarchy_tree.clearSelection()
             for prim_path in prim_paths:
-                items = self.hierarchy_tree.findItems(prim_path, Qt.MatchFlag.MatchContains | Qt.MatchFlag.MatchRecursive, 0)
+                items = self.hierarchy_tree.findItems(str(prim_path), Qt.MatchFlag.MatchContains | Qt.MatchFlag.MatchRecursive, 0)
                 if items:
                     items[0].setSelected(True)
                     self.hierarchy_tree.scrollToItem(items[0])
@@ -95,10 +95,17 @@ class ViewportWidget(QOpenGLWidget):
         self.scale_changed.emit(self.scene_scale)
         self.update()
         
-    def update_geometry(self, time_code: float):
-        """Update geometry for current time"""
+    def update_geometry(self, time_code: float, shared_cache=None):
+        """Update geometry for current time
+        
+        shared_cache: optional SharedFrameCache so several viewports showing
+        the same stage extract geometry only once per frame.
+        """
         if self.stage_manager:
-            self.geometry_data = self.stage_manager.get_geometry_data(time_code)
+            if shared_cache is not None:
+                self.geometry_data = shared_cache.get(self.stage_manager, time_code)
+            else:
+                self.geometry_data = self.stage_manager.get_geometry_data(time_code)
             
             # Auto-frame on first load
             if 'bounds' in self.geometry_data and self.geometry_data['bounds']:
@@ -3,7 +3,7 @@ Feature managers
 """
 
 try:
-    from .animation_curves import AnimationCurveManager
+    from .animation_curves import AnimationCurveManager, Keyframe
     from .aov_manager import AOVManager, AOVInfo, AOVDisplayMode
     from .batch_operations import BatchOperationManager
     from .camera_manager import CameraManager
@@ -22,10 +22,11 @@ try:
     from .selection_sets import SelectionSetManager, SelectionSet, SelectionSetOperation
     from .stage_variables import StageVariableManager
     from .undo_redo import UndoRedoManager
-    from .variants import VariantManager
+    from .variants import VariantManager, VariantSetInfo
     
     __all__ = [
         "AnimationCurveManager",
+        "Keyframe",
         "AOVManager",
         "AOVInfo",
         "AOVDisplayMode",
@@ -53,6 +54,7 @@ try:
         "StageVariableManager",
         "UndoRedoManager",
         "VariantManager",
+        "VariantSetInfo",
     ]
 except ImportError as e:
     __all__ = []
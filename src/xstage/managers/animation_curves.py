@@ -4,7 +4,7 @@ Extracts and displays time-sampled attributes with keyframe visualization
 Based on OpenUSD 25.11 specifications
 """
 
-from typing import Optional, Dict, List, Tuple
+from typing import Any, NamedTuple, Optional, Dict, List, Tuple
 from pxr import Usd, Sdf
 
 try:
@@ -14,6 +14,12 @@ except ImportError:
     USD_AVAILABLE = False
 
 
+class Keyframe(NamedTuple):
+    """A single time sample of a curve"""
+    time: float
+    value: Any
+
+
 class AnimationCurveManager:
     """Manages animation curves and time-sampled attributes"""
     
@@ -92,13 +98,7 @@ class AnimationCurveManager:
             return {}
         
         # Get values
-        values = []
-        for time in time_samples:
-            value = attr.Get(time)
-            values.append({
-                'time': time,
-                'value': value,
-            })
+        values = [Keyframe(time, attr.Get(time)) for time in time_samples]
         
         # Get interpolation info
         interpolation = attr.GetMetadata('interpolation') if attr.HasMetadata('interpolation') else None
@@ -113,16 +113,16 @@ class AnimationCurveManager:
         }
         
         # For numeric types, calculate min/max
-        if values and isinstance(values[0]['value'], (int, float)):
-            numeric_values = [v['value'] for v in values]
+        if values and isinstance(values[0].value, (int, float)):
+            numeric_values = [v.value for v in values]
             curve_data['value_range'] = (min(numeric_values), max(numeric_values))
-        elif values and isinstance(values[0]['value'], (list, tuple)):
+        elif values and isinstance(values[0].value, (list, tuple)):
             # For vector types
             try:
                 all_values = []
                 for v in values:
-                    if isinstance(v['value'], (list, tuple)):
-                        all_values.extend(v['value'])
+                    if isinstance(v.value, (list, tuple)):
+                        all_values.extend(v.value)
                 if all_values:
                     curve_data['value_range'] = (min(all_values), max(all_values))
             except:
@@ -40,13 +40,17 @@ class AOVManager:
         self.stage = stage
         self.aovs: List[AOVInfo] = []
         self.display_mode = AOVDisplayMode.RGB
+        # Bumped whenever the AOV list, an enabled flag or the display mode changes
+        self.version = 0
+        self._stats_cache: Optional[Dict[str, any]] = None
+        self._stats_version = -1
     
     def extract_aovs(self) -> List[AOVInfo]:
         """Extract AOVs from render settings"""
         if not self.stage or not USD_AVAILABLE:
             return []
         
-        self.aovs.clear()
+        aovs = []
         
         # Find render settings prims
         for prim in self.stage.Traverse():
@@ -86,8 +90,12 @@ class AOVManager:
                                             prim_path=str(render_var_path)
                                         )
                                         
-                                        self.aovs.append(aov_info)
+                                        aovs.append(aov_info)
         
+        # Only a different result counts as a change, so re-extracting is cheap downstream
+        if aovs != self.aovs:
+            self.aovs[:] = aovs
+            self.version += 1
         return self.aovs
     
     def get_aov_list(self) -> List[AOVInfo]:
@@ -104,21 +112,37 @@ class AOVManager:
     def enable_aov(self, name: str, enabled: bool = True):
         """Enable/disable an AOV"""
         aov = self.get_aov_by_name(name)
-        if aov:
+        if aov and aov.enabled != enabled:
             aov.enabled = enabled
+            self.version += 1
+    
+    def enable_aovs(self, names: List[str], enabled: bool = True):
+        """Enable/disable several AOVs in one pass over the list"""
+        wanted = set(names)
+        changed = False
+        for aov in self.aovs:
+            if aov.name in wanted and aov.enabled != enabled:
+                aov.enabled = enabled
+                changed = True
+        if changed:
+            self.version += 1
     
     def set_display_mode(self, mode: AOVDisplayMode):
         """Set AOV display mode"""
-        self.display_mode = mode
+        if mode != self.display_mode:
+            self.display_mode = mode
+            self.version += 1
     
     def get_aov_statistics(self) -> Dict[str, any]:
-        """Get AOV statistics"""
-        enabled_count = sum(1 for aov in self.aovs if aov.enabled)
-        
-        return {
-            'total_aovs': len(self.aovs),
-            'enabled_aovs': enabled_count,
-            'disabled_aovs': len(self.aovs) - enabled_count,
-            'display_mode': self.display_mode.value,
-        }
+        """Get AOV statistics, recounted only after a change"""
+        if self._stats_version != self.version:
+            enabled_count = sum(1 for aov in self.aovs if aov.enabled)
+            self._stats_cache = {
+                'total_aovs': len(self.aovs),
+                'enabled_aovs': enabled_count,
+                'disabled_aovs': len(self.aovs) - enabled_count,
+                'display_mode': self.display_mode.value,
+            }
+            self._stats_version = self.version
+        return dict(self._stats_cache)
 
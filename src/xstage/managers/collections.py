@@ -26,18 +26,26 @@ class CollectionManager:
         collection_apis = UsdCollectionAPI.GetAllCollectionAPIs(prim)
         collections = []
         
+        # Loop-invariant: every collection lives on the same prim
+        prim_path_str = prim.GetPath().pathString
+        
         for collection_api in collection_apis:
+            # Fetch the collection and its relationship targets once
             collection = collection_api.GetCollection()
+            collection_name = collection.GetName()
+            includes_targets = collection.GetIncludesRel().GetTargets()
+            excludes_targets = collection.GetExcludesRel().GetTargets()
+            
             collection_data = {
-                'name': collection.GetName(),
-                'prim_path': prim.GetPath().pathString,
+                'name': collection_name,
+                'prim_path': prim_path_str,
                 'expansion_rule': str(collection.GetExpansionRule()),
-                'includes_paths': [str(p) for p in collection.GetIncludesRel().GetTargets()],
-                'excludes_paths': [str(p) for p in collection.GetExcludesRel().GetTargets()],
+                'includes_paths': [str(p) for p in includes_targets],
+                'excludes_paths': [str(p) for p in excludes_targets],
             }
             
             # Determine collection mode
-            if collection_api.GetCollectionName() == collection.GetName():
+            if collection_api.GetCollectionName() == collection_name:
                 collection_data['mode'] = 'relationship'
             else:
                 collection_data['mode'] = 'pattern'
@@ -46,6 +54,20 @@ class CollectionManager:
         
         return collections
     
+    @staticmethod
+    def get_all_collections(stage: Usd.Stage) -> List[Dict]:
+        """Get all collections in the stage in one pass"""
+        if not USD_AVAILABLE or not stage:
+            return []
+        
+        # HasAPI is a cheap applied-schema check; most prims carry no collections
+        return [
+            collection_data
+            for prim in stage.Traverse()
+            if prim.HasAPI(UsdCollectionAPI)
+            for collection_data in CollectionManager.get_collections(prim)
+        ]
+    
     @staticmethod
     def create_collection(prim: Usd.Prim, collection_name: str, mode: str = 'relationship') -> Optional[UsdCollectionAPI]:
         """Create a new collection on a prim"""
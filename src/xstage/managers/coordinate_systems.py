@@ -5,10 +5,10 @@ Based on OpenUSD 25.11 specifications
 """
 
 from typing import Optional, Dict, List
-from pxr import Usd, UsdGeom
+from pxr import Usd, UsdGeom, UsdShade
 
 try:
-    from pxr import Usd, UsdGeom
+    from pxr import Usd, UsdGeom, UsdShade
     USD_AVAILABLE = True
 except ImportError:
     USD_AVAILABLE = False
@@ -58,6 +58,9 @@ class CoordinateSystemManager:
         
         all_systems = []
         for prim in self.stage.Traverse():
+            # Cheap applied-schema check before constructing the API wrapper
+            if not prim.HasAPI(UsdShade.CoordSysAPI):
+                continue
             systems = self.get_coordinate_systems(prim)
             all_systems.extend(systems)
         
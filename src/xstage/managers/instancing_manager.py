@@ -48,30 +48,35 @@ class InstancingManager:
         
         self.instance_info.clear()
         
-        # Traverse stage and find instanceable prims
-        for prim in self.stage.Traverse():
-            if prim.IsInstanceable():
-                master = prim.GetMaster()
-                if master:
-                    master_path = str(master.GetPath())
-                    
-                    if master_path not in self.instance_info:
-                        # Find all instances of this master
-                        instance_paths = []
-                        for instance_prim in self.stage.Traverse():
-                            if instance_prim.IsInstance() and instance_prim.GetMaster() == master:
-                                instance_paths.append(str(instance_prim.GetPath()))
-                        
-                        instance_info = InstanceInfo(
-                            master_path=master_path,
-                            instance_paths=instance_paths,
-                            instance_count=len(instance_paths)
-                        )
-                        
-                        # Estimate memory savings
-                        instance_info.memory_savings_mb = self._estimate_memory_savings(master, len(instance_paths))
-                        
-                        self.instance_info[master_path] = instance_info
+        # Group instances by master in a single traversal. Instance prims have no
+        # traversable children, so PrimRange never descends into their subtrees.
+        instances_by_master: Dict[str, List[str]] = {}
+        masters: Dict[str, Usd.Prim] = {}
+        for prim in Usd.PrimRange.Stage(self.stage, Usd.PrimDefaultPredicate):
+            if not prim.IsInstance():
+                continue
+            master = prim.GetMaster()
+            if not master:
+                continue
+            master_path = str(master.GetPath())
+            if master_path not in instances_by_master:
+                instances_by_master[master_path] = []
+                masters[master_path] = master
+            instances_by_master[master_path].append(str(prim.GetPath()))
+        
+        for master_path, instance_paths in instances_by_master.items():
+            instance_info = InstanceInfo(
+                master_path=master_path,
+                instance_paths=instance_paths,
+                instance_count=len(instance_paths)
+            )
+            
+            # Estimate memory savings
+            instance_info.memory_savings_mb = self._estimate_memory_savings(
+                masters[master_path], len(instance_paths)
+            )
+            
+            self.instance_info[master_path] = instance_info
         
         return self.instance_info
     
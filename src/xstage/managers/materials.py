@@ -4,7 +4,8 @@ Handles material extraction, visualization, and MaterialX integration
 Based on OpenUSD 25.11 specifications
 """
 
-from typing import Optional, Dict, List
+import logging
+from typing import Optional, Dict, List, Tuple
 from pxr import Usd, UsdShade, Sdf
 
 try:
@@ -13,6 +14,32 @@ try:
 except ImportError:
     USD_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+
+# Shader ids with a known input set, in schema order. When every input authored
+# on a shader is in its set, inputs are fetched by name instead of enumerating
+# and introspecting every property on the prim.
+_FAST_SCHEMAS: Dict[str, Tuple[str, ...]] = {
+    "UsdPreviewSurface": (
+        "diffuseColor",
+        "emissiveColor",
+        "useSpecularWorkflow",
+        "specularColor",
+        "metallic",
+        "roughness",
+        "clearcoat",
+        "clearcoatRoughness",
+        "opacity",
+        "opacityMode",
+        "opacityThreshold",
+        "ior",
+        "normal",
+        "displacement",
+        "occlusion",
+    ),
+}
+
 
 class MaterialManager:
     """Manages USD materials and shaders"""
@@ -33,7 +60,7 @@ class MaterialManager:
                 'volume_output': None,
                 'inputs': {},
                 'surface_shader': None,
-                'shader_network': [],
+                'shader_network': {'nodes': [], 'edges': []},
             }
             
             # Get surface output
@@ -52,7 +79,7 @@ class MaterialManager:
                     }
                     # Extract shader network
                     material_data['shader_network'] = MaterialManager._extract_shader_network(
-                        source[0], time_code
+                        source[0].GetPrim(), time_code
                     )
             
             # Get displacement output
@@ -74,74 +101,133 @@ class MaterialManager:
             # Extract material inputs
             for input_attr in material.GetInputs():
                 input_name = input_attr.GetBaseName()
-                input_value = input_attr.Get(time_code)
                 material_data['inputs'][input_name] = {
-                    'value': input_value,
+                    'value': input_attr.Get(time_code),
                     'type': str(input_attr.GetTypeName()),
                 }
             
             return material_data
-        except Exception as e:
-            print(f"Error extracting material {prim.GetPath()}: {e}")
+        except Exception:
+            logger.debug("Error extracting material %s", prim.GetPath(), exc_info=True)
             return None
     
     @staticmethod
-    def _extract_shader_network(shader_prim: Usd.Prim, time_code: float) -> List[Dict]:
-        """Extract shader network from a shader prim"""
+    def _extract_shader_network(root_shader_prim: Usd.Prim, time_code: float) -> Dict:
+        """Extract the shader network reachable from a shader prim
+        
+        Returns {'nodes': [...], 'edges': [...]}. Nodes are in reverse-topological
+        order (the root first, every shader before the shaders feeding it) and hold
+        only unconnected input values; each edge is
+        (src_index, src_output, dst_index, dst_input) into the nodes list.
+        """
+        network = {'nodes': [], 'edges': []}
         if not USD_AVAILABLE:
-            return []
+            return network
             
-        network = []
         try:
-            shader = UsdShade.Shader(shader_prim)
+            nodes, edges = MaterialManager._walk_shader_network(root_shader_prim, time_code)
             
-            shader_data = {
-                'name': shader_prim.GetPath().pathString,
-                'id': shader.GetIdAttr().Get(time_code) if shader.GetIdAttr() else None,
-                'inputs': {},
-                'outputs': {},
-            }
+            for shader_prim, shader, shader_id, inputs in nodes:
+                network['nodes'].append({
+                    'name': shader_prim.GetPath().pathString,
+                    'id': shader_id,
+                    'inputs': {
+                        input_name: {
+                            'value': input_attr.Get(time_code),
+                            'type': str(input_attr.GetTypeName()),
+                        }
+                        for input_attr, input_name in inputs
+                    },
+                    'outputs': {
+                        output_attr.GetBaseName(): {'type': str(output_attr.GetTypeName())}
+                        for output_attr in shader.GetOutputs()
+                    },
+                })
+            network['edges'] = edges
             
-            # Extract inputs
-            for input_attr in shader.GetInputs():
-                input_name = input_attr.GetBaseName()
-                input_value = input_attr.Get(time_code)
-                
-                # Check if connected
-                source = input_attr.GetConnectedSource()
-                if source:
-                    shader_data['inputs'][input_name] = {
-                        'connected': True,
-                        'source': source[0].GetPath().pathString,
-                        'source_output': source[1],
-                    }
-                else:
-                    shader_data['inputs'][input_name] = {
-                        'connected': False,
-                        'value': input_value,
-                        'type': str(input_attr.GetTypeName()),
-                    }
+        except Exception:
+            logger.debug("Error extracting shader network", exc_info=True)
+        
+        return network
+    
+    @staticmethod
+    def _walk_shader_network(root_shader_prim: Usd.Prim, time_code: float) -> Tuple[List[Tuple], List[Tuple]]:
+        """Linearize the upstream shader DAG in a single iterative DFS
+        
+        Each input's connection is resolved once, both to record the edge and to
+        schedule the source shader. Returns (nodes, edges): nodes are
+        (prim, shader, shader_id, unconnected_inputs) in reverse-topological
+        order, where unconnected_inputs is a list of (input_attr, input_name);
+        edges are (src_index, src_output, dst_index, dst_input).
+        """
+        records: Dict[Sdf.Path, Tuple] = {}
+        postorder: List[Sdf.Path] = []  # Sources always precede their consumers
+        stack = [(root_shader_prim, False)]
+        while stack:
+            shader_prim, expanded = stack.pop()
+            path = shader_prim.GetPath()
+            if expanded:
+                postorder.append(path)
+                continue
+            if path in records:
+                continue
             
-            # Extract outputs
-            for output_attr in shader.GetOutputs():
-                output_name = output_attr.GetBaseName()
-                shader_data['outputs'][output_name] = {
-                    'type': str(output_attr.GetTypeName()),
-                }
+            shader = UsdShade.Shader(shader_prim)
+            id_attr = shader.GetIdAttr()
+            shader_id = id_attr.Get(time_code) if id_attr else None
             
-            network.append(shader_data)
+            # Known shader ids: look inputs up by name with statically known types
+            # Custom or extra inputs fall back to the full enumeration below
+            fast_schema = _FAST_SCHEMAS.get(shader_id)
+            if fast_schema is not None:
+                authored = {
+                    name[7:] for name in shader_prim.GetAuthoredPropertyNames()
+                    if name.startswith('inputs:')
+                }
+                if not authored.issubset(fast_schema):
+                    fast_schema = None
+            if fast_schema is not None:
+                shader_inputs = [
+                    (shader.GetInput(input_name), input_name)
+                    for input_name in fast_schema
+                    if input_name in authored
+                ]
+            else:
+                shader_inputs = [
+                    (input_attr, input_attr.GetBaseName())
+                    for input_attr in shader.GetInputs()
+                ]
             
-            # Recursively extract connected shaders
-            for input_attr in shader.GetInputs():
+            unconnected = []
+            connections = []  # (dst_input, src_path, src_output)
+            sources = []
+            for input_attr, input_name in shader_inputs:
                 source = input_attr.GetConnectedSource()
                 if source:
-                    connected_network = MaterialManager._extract_shader_network(source[0], time_code)
-                    network.extend(connected_network)
+                    source_prim = source[0].GetPrim()
+                    source_path = source_prim.GetPath()
+                    connections.append((input_name, source_path, source[1]))
+                    if source_path not in records:
+                        sources.append(source_prim)
+                else:
+                    unconnected.append((input_attr, input_name))
             
-        except Exception as e:
-            print(f"Error extracting shader network: {e}")
+            records[path] = (shader_prim, shader, shader_id, unconnected, connections)
+            stack.append((shader_prim, True))
+            stack.extend((source_prim, False) for source_prim in reversed(sources))
         
-        return network
+        order = postorder[::-1]
+        index_of = {path: i for i, path in enumerate(order)}
+        nodes = []
+        edges = []
+        for dst_index, path in enumerate(order):
+            shader_prim, shader, shader_id, unconnected, connections = records[path]
+            nodes.append((shader_prim, shader, shader_id, unconnected))
+            edges.extend(
+                (index_of[source_path], source_output, dst_index, input_name)
+                for input_name, source_path, source_output in connections
+            )
+        return nodes, edges
     
     @staticmethod
     def get_material_binding(prim: Usd.Prim, purpose: str = 'preview') -> Optional[Usd.Prim]:
@@ -163,8 +249,8 @@ class MaterialManager:
                 material = binding_api.GetDirectBinding().GetMaterial()
             
             return material.GetPrim() if material else None
-        except Exception as e:
-            print(f"Error getting material binding: {e}")
+        except Exception:
+            logger.debug("Error getting material binding", exc_info=True)
             return None
     
     @staticmethod
@@ -186,18 +272,15 @@ class MaterialManager:
             
             return True
         except Exception as e:
-            print(f"Error binding material: {e}")
+            logger.warning("Error binding material: %s", e)
             return False
     
     @staticmethod
     def find_all_materials(stage: Usd.Stage) -> List[Usd.Prim]:
         """Find all materials in the stage"""
-        if not USD_AVAILABLE:
-            return []
-            
-        materials = []
-        for prim in stage.Traverse():
-            if prim.IsA(UsdShade.Material):
-                materials.append(prim)
-        return materials
+        # Compare typeName tokens instead of dispatching IsA() per prim
+        return [
+            prim for prim in Usd.PrimRange.Stage(stage, Usd.PrimDefaultPredicate)
+            if prim.GetTypeName() == "Material"
+        ]
 
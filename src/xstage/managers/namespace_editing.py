@@ -4,22 +4,99 @@ Handles prim renaming, moving, and relocates
 Based on OpenUSD 25.11 specifications
 """
 
+import logging
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Optional, Dict, List
-from pxr import Usd, UsdNamespaceEditor, Sdf
+from pxr import Usd, Sdf
 
 try:
-    from pxr import Usd, UsdNamespaceEditor, Sdf
+    from pxr import Usd, Sdf
     USD_AVAILABLE = True
 except ImportError:
     USD_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=256)
+def _compute_new_path(old_path: str, new_name: str) -> Sdf.Path:
+    """Path a prim at old_path would have after being renamed to new_name"""
+    return Sdf.Path(old_path).GetParentPath().AppendChild(new_name)
+
 
 class NamespaceEditor:
     """Manages namespace editing operations"""
     
     def __init__(self, stage: Usd.Stage):
         self.stage = stage
-        self.editor = UsdNamespaceEditor(stage) if USD_AVAILABLE else None
+        self.editor = Usd.NamespaceEditor(stage) if USD_AVAILABLE else None
+        # Open batch: each edit is applied at once inside a shared Sdf.ChangeBlock
+        self._in_batch = False
+        self._change_block = None
+        self._batch_paths: List[Sdf.Path] = []
+    
+    @contextmanager
+    def batch(self):
+        """Coalesce the change notices of several renames/moves
+        
+        Each edit is still applied (and reported) immediately; the batch only
+        holds an Sdf.ChangeBlock open so e.g. a multi-select rename sends one
+        round of notices. The block is closed even if an edit raises.
+        """
+        if self._in_batch:
+            yield self
+            return
+        
+        self._in_batch = True
+        self._batch_paths = []
+        self._open_change_block()
+        try:
+            yield self
+        finally:
+            self._in_batch = False
+            self._batch_paths = []
+            self._close_change_block()
+    
+    def _open_change_block(self):
+        """Enter a change block held until _close_change_block()"""
+        if USD_AVAILABLE:
+            self._change_block = Sdf.ChangeBlock()
+            self._change_block.__enter__()
+    
+    def _close_change_block(self):
+        """Exit the held change block, letting the stage recompose"""
+        if self._change_block is not None:
+            block, self._change_block = self._change_block, None
+            block.__exit__(None, None, None)
+    
+    def _flush_if_dependent(self, old_sdf_path: Sdf.Path):
+        """Recompose before an edit that touches a prim already edited in this batch
+        
+        Inside a change block the stage is not recomposed, so a later edit of
+        e.g. a child of a renamed prim would see stale composition.
+        """
+        if any(old_sdf_path.HasPrefix(path) or path.HasPrefix(old_sdf_path)
+               for path in self._batch_paths):
+            self._close_change_block()
+            self._batch_paths = []
+            self._open_change_block()
+    
+    def _can_move_prim(self, old_sdf_path: Sdf.Path, new_sdf_path: Sdf.Path) -> bool:
+        """Validate a move on a scratch editor so no edit is left pending"""
+        editor = Usd.NamespaceEditor(self.stage)
+        return editor.MovePrimAtPath(old_sdf_path, new_sdf_path) and bool(editor.CanApplyEdits())
+    
+    def _move_prim(self, old_sdf_path: Sdf.Path, new_sdf_path: Sdf.Path) -> bool:
+        """Set up a single move and apply it, revalidating against the current stage"""
+        if self._in_batch:
+            self._flush_if_dependent(old_sdf_path)
+        if not self.editor.MovePrimAtPath(old_sdf_path, new_sdf_path):
+            return False
+        edited = self.apply_edits()
+        if edited and self._in_batch:
+            self._batch_paths.extend((old_sdf_path, new_sdf_path))
+        return edited
     
     def can_rename(self, old_path: str, new_name: str) -> bool:
         """Check if a prim can be renamed"""
@@ -27,12 +104,10 @@ class NamespaceEditor:
             return False
         
         try:
-            old_sdf_path = Sdf.Path(old_path)
-            parent_path = old_sdf_path.GetParentPath()
-            new_path = parent_path.AppendChild(new_name)
-            return self.editor.CanEditNamespace(old_sdf_path, new_path)
-        except Exception as e:
-            print(f"Error checking rename: {e}")
+            new_path = _compute_new_path(old_path, new_name)
+            return self._can_move_prim(Sdf.Path(old_path), new_path)
+        except Exception:
+            logger.debug("Error checking rename", exc_info=True)
             return False
     
     def rename_prim(self, old_path: str, new_name: str) -> bool:
@@ -41,17 +116,11 @@ class NamespaceEditor:
             return False
         
         try:
-            old_sdf_path = Sdf.Path(old_path)
-            parent_path = old_sdf_path.GetParentPath()
-            new_path = parent_path.AppendChild(new_name)
-            
-            if self.editor.CanEditNamespace(old_sdf_path, new_path):
-                return self.editor.EditNamespace(old_sdf_path, new_path)
+            new_path = _compute_new_path(old_path, new_name)
+            return self._move_prim(Sdf.Path(old_path), new_path)
         except Exception as e:
-            print(f"Error renaming prim: {e}")
+            logger.warning("Error renaming prim: %s", e)
             return False
-        
-        return False
     
     def can_move(self, old_path: str, new_path: str) -> bool:
         """Check if a prim can be moved"""
@@ -59,11 +128,9 @@ class NamespaceEditor:
             return False
         
         try:
-            old_sdf_path = Sdf.Path(old_path)
-            new_sdf_path = Sdf.Path(new_path)
-            return self.editor.CanEditNamespace(old_sdf_path, new_sdf_path)
-        except Exception as e:
-            print(f"Error checking move: {e}")
+            return self._can_move_prim(Sdf.Path(old_path), Sdf.Path(new_path))
+        except Exception:
+            logger.debug("Error checking move", exc_info=True)
             return False
     
     def move_prim(self, old_path: str, new_path: str) -> bool:
@@ -72,16 +139,10 @@ class NamespaceEditor:
             return False
         
         try:
-            old_sdf_path = Sdf.Path(old_path)
-            new_sdf_path = Sdf.Path(new_path)
-            
-            if self.editor.CanEditNamespace(old_sdf_path, new_sdf_path):
-                return self.editor.EditNamespace(old_sdf_path, new_sdf_path)
+            return self._move_prim(Sdf.Path(old_path), Sdf.Path(new_path))
         except Exception as e:
-            print(f"Error moving prim: {e}")
+            logger.warning("Error moving prim: %s", e)
             return False
-        
-        return False
     
     def get_relocates(self) -> List[Dict]:
         """Get all relocates in the stage"""
@@ -107,8 +168,8 @@ class NamespaceEditor:
             return (False, ["Editor not available"])
         
         try:
-            can_apply, errors = self.editor.CanApplyEdits()
-            return (can_apply, [str(e) for e in errors] if errors else [])
+            result = self.editor.CanApplyEdits()
+            return (bool(result), [] if result else [result.whyNot])
         except Exception as e:
             return (False, [str(e)])
     
@@ -118,13 +179,13 @@ class NamespaceEditor:
             return False
         
         try:
-            can_apply, errors = self.editor.CanApplyEdits()
-            if can_apply:
+            result = self.editor.CanApplyEdits()
+            if result:
                 return self.editor.ApplyEdits()
             else:
-                print(f"Cannot apply edits: {errors}")
+                logger.warning("Cannot apply edits: %s", result.whyNot)
                 return False
         except Exception as e:
-            print(f"Error applying edits: {e}")
+            logger.warning("Error applying edits: %s", e)
             return False
 
@@ -4,11 +4,13 @@ Support for computed attributes and extent calculations
 Based on OpenUSD 25.08+ OpenExec framework
 """
 
-from typing import Optional, Dict, List, Any
+import logging
+from functools import lru_cache
+from typing import Optional, Dict, List, Any, FrozenSet, Tuple
 from pxr import Usd, UsdGeom, Gf
 
 try:
-    from pxr import Usd, UsdGeom, Gf
+    from pxr import Usd, UsdGeom, Gf, Sdf, Tf, Vt
     USD_AVAILABLE = True
 except ImportError:
     USD_AVAILABLE = False
@@ -21,6 +23,19 @@ except ImportError:
     OPENEXEC_AVAILABLE = False
     UsdExec = None
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _get_boundable_type_names() -> FrozenSet[str]:
+    """All prim typeNames that derive from UsdGeom.Boundable"""
+    boundable_type = Tf.Type.Find(UsdGeom.Boundable)
+    type_names = (
+        Usd.SchemaRegistry.GetSchemaTypeName(derived)
+        for derived in boundable_type.GetAllDerivedTypes()
+    )
+    return frozenset(name for name in type_names if name)
+
 
 class OpenExecManager:
     """Manages OpenExec computed attributes and extent calculations"""
@@ -64,11 +79,17 @@ class OpenExecManager:
                     return True
             
             return False
-        except Exception as e:
-            print(f"Error checking computed attribute: {e}")
+        except Exception:
+            logger.debug("Error checking computed attribute", exc_info=True)
             return False
     
-    def compute_extent(self, prim: Usd.Prim, time_code: float = 0.0) -> Optional[List]:
+    @staticmethod
+    def _create_bbox_cache(time_code: float) -> UsdGeom.BBoxCache:
+        """Create a BBoxCache for extent computation (default purpose only)"""
+        return UsdGeom.BBoxCache(time_code, includedPurposes=[UsdGeom.Tokens.default_])
+    
+    def compute_extent(self, prim: Usd.Prim, time_code: float = 0.0,
+                       bbox_cache: Optional[UsdGeom.BBoxCache] = None) -> Optional[List]:
         """Compute extent for a boundable prim"""
         if not USD_AVAILABLE or not prim:
             return None
@@ -78,24 +99,33 @@ class OpenExecManager:
             if not boundable:
                 return None
             
-            # Use UsdGeom to compute extent
-            # This is the standard way to compute extent in USD
-            bbox_cache = UsdGeom.BBoxCache(time_code, includedPurposes=[UsdGeom.Tokens.default_])
-            bbox = bbox_cache.ComputeWorldBound(prim)
-            
-            if bbox:
-                # Get the bounding box
-                range = bbox.ComputeAlignedRange()
-                min_point = range.GetMin()
-                max_point = range.GetMax()
-                
-                return [
-                    [min_point[0], min_point[1], min_point[2]],
-                    [max_point[0], max_point[1], max_point[2]]
-                ]
-        except Exception as e:
-            print(f"Error computing extent: {e}")
+            if bbox_cache is None:
+                bbox_cache = self._create_bbox_cache(time_code)
+            elif bbox_cache.GetTime() != Usd.TimeCode(time_code):
+                # Retarget a shared cache rather than reallocating it per frame
+                bbox_cache.SetTime(time_code)
+            return self._compute_extent_with_cache(prim, bbox_cache)
+        except Exception:
+            logger.debug("Error computing extent", exc_info=True)
             return None
+    
+    @staticmethod
+    def _compute_extent_with_cache(prim: Usd.Prim, bbox_cache: UsdGeom.BBoxCache) -> Optional[List]:
+        """Compute extent of a known-boundable prim (no guards; for hot loops)"""
+        # Use UsdGeom to compute extent
+        # This is the standard way to compute extent in USD
+        bbox = bbox_cache.ComputeWorldBound(prim)
+        
+        if bbox:
+            # Get the bounding box
+            range = bbox.ComputeAlignedRange()
+            min_point = range.GetMin()
+            max_point = range.GetMax()
+            
+            return [
+                [min_point[0], min_point[1], min_point[2]],
+                [max_point[0], max_point[1], max_point[2]]
+            ]
         
         return None
     
@@ -115,14 +145,13 @@ class OpenExecManager:
             if attr:
                 try:
                     return attr.Get(time_code)
-                except:
+                except Exception:
                     # If Get fails, it might be computed
-                    # Try to evaluate it
-                    pass
+                    logger.debug("Could not read %s", attr.GetPath(), exc_info=True)
             
             return None
-        except Exception as e:
-            print(f"Error getting computed value: {e}")
+        except Exception:
+            logger.debug("Error getting computed value", exc_info=True)
             return None
     
     def get_all_computed_attributes(self, prim: Usd.Prim) -> List[str]:
@@ -147,12 +176,13 @@ class OpenExecManager:
                     # Get computed attribute names from OpenExec
                     # This depends on the OpenExec API
                     pass
-            except:
-                pass
+            except Exception:
+                logger.debug("Error querying OpenExec schema", exc_info=True)
         
         return computed
     
-    def ensure_extent(self, prim: Usd.Prim, time_code: float = 0.0) -> bool:
+    def ensure_extent(self, prim: Usd.Prim, time_code: float = 0.0,
+                      bbox_cache: Optional[UsdGeom.BBoxCache] = None) -> bool:
         """Ensure extent is computed and set on a prim"""
         if not USD_AVAILABLE or not prim:
             return False
@@ -168,40 +198,104 @@ class OpenExecManager:
                 return True  # Already has extent
             
             # Compute extent
-            extent = self.compute_extent(prim, time_code)
+            extent = self.compute_extent(prim, time_code, bbox_cache=bbox_cache)
             if extent:
-                extent_attr.Set(extent, time_code)
+                self.author_extents([(prim, extent)], time_code)
                 return True
-        except Exception as e:
-            print(f"Error ensuring extent: {e}")
+        except Exception:
+            logger.debug("Error ensuring extent", exc_info=True)
             return False
         
         return False
     
     def compute_all_extents(self, time_code: float = 0.0, progress_callback=None) -> Dict[str, bool]:
-        """Compute extents for all boundable prims in the stage"""
+        """Compute extents for all boundable prims in the stage
+        
+        Every extent is computed before any is authored, and the writes go in
+        as one batch.
+        """
+        results, to_author = self.collect_extents(time_code, progress_callback)
+        self.author_extents(to_author, time_code)
+        return results
+    
+    def find_boundable_prims(self) -> List[Usd.Prim]:
+        """Find all boundable prims in the stage"""
         if not USD_AVAILABLE or not self.stage:
-            return {}
+            return []
         
-        results = {}
-        boundable_prims = []
+        # typeName lookup avoids per-prim IsA dispatch
+        boundable_type_names = _get_boundable_type_names()
+        return [
+            prim for prim in Usd.PrimRange.Stage(self.stage, Usd.PrimDefaultPredicate)
+            if prim.GetTypeName() in boundable_type_names
+        ]
+    
+    def collect_extents(self, time_code: float = 0.0,
+                        progress_callback=None) -> Tuple[Dict[str, bool], List]:
+        """Compute missing extents without authoring them
+        
+        Only reads the stage, so it may run off the GUI thread. Returns the
+        per-prim results and the (prim, extent) pairs to pass to author_extents().
+        """
+        if not USD_AVAILABLE or not self.stage:
+            return {}, []
         
-        # Collect all boundable prims
-        for prim in self.stage.Traverse():
-            if prim.IsA(UsdGeom.Boundable):
-                boundable_prims.append(prim)
+        results = {}
+        boundable_prims = self.find_boundable_prims()
         
         total = len(boundable_prims)
+        # One cache for the whole sweep so sibling prims reuse xform/extent memos
+        bbox_cache = self._create_bbox_cache(time_code)
         
+        # Phase 1: read-only computation; fully drained before any authoring starts
+        computed = []
         for i, prim in enumerate(boundable_prims):
             if progress_callback:
                 progress = int((i / total) * 100) if total > 0 else 0
                 progress_callback(progress, f"Computing extent for {prim.GetPath()}")
             
+            if UsdGeom.Boundable(prim).GetExtentAttr().HasAuthoredValue():
+                computed.append((True, None))
+                continue
+            try:
+                computed.append((False, self._compute_extent_with_cache(prim, bbox_cache)))
+            except Exception:
+                logger.debug("Error computing extent for %s", prim.GetPath(), exc_info=True)
+                computed.append((False, None))
+        
+        # Phase 2: gather what the caller should author in one batch
+        to_author = []
+        for prim, (already_authored, extent) in zip(boundable_prims, computed):
             prim_path = prim.GetPath().pathString
-            results[prim_path] = self.ensure_extent(prim, time_code)
+            if already_authored:
+                results[prim_path] = True
+            elif extent:
+                to_author.append((prim, extent))
+                results[prim_path] = True
+            else:
+                results[prim_path] = False
         
-        return results
+        return results, to_author
+    
+    def author_extents(self, extents: List, time_code: float):
+        """Author (prim, extent) pairs straight into the edit target layer
+        
+        Writes go through Sdf specs inside one change block, so the stage
+        recomposes once for the whole batch instead of once per prim.
+        """
+        if not USD_AVAILABLE or not self.stage or not extents:
+            return
+        
+        edit_target = self.stage.GetEditTarget()
+        layer = edit_target.GetLayer()
+        extent_name = UsdGeom.Tokens.extent
+        with Sdf.ChangeBlock():
+            for prim, extent in extents:
+                prim_spec = Sdf.CreatePrimInLayer(layer, edit_target.MapToSpecPath(prim.GetPath()))
+                attr_spec = prim_spec.attributes.get(extent_name)
+                if attr_spec is None:
+                    attr_spec = Sdf.AttributeSpec(prim_spec, extent_name, Sdf.ValueTypeNames.Float3Array)
+                layer.SetTimeSample(attr_spec.path, time_code, Vt.Vec3fArray(extent))
     
     def get_computed_attribute_info(self, prim: Usd.Prim, attr_name: str) -> Dict:
         """Get information about a computed attribute"""
@@ -219,14 +313,25 @@ class OpenExecManager:
         try:
             attr = prim.GetAttribute(attr_name)
             if attr:
-                info['has_authored_value'] = attr.HasAuthoredValue()
-                info['can_compute'] = not attr.HasAuthoredValue()
+                has_authored_value = attr.HasAuthoredValue()
+                info['has_authored_value'] = has_authored_value
+                info['can_compute'] = not has_authored_value
                 
                 # Try to get computed value
                 if info['can_compute']:
                     info['computed_value'] = self.get_computed_value(prim, attr_name)
-        except:
-            pass
+        except Exception:
+            logger.debug("Error getting computed attribute info", exc_info=True)
         
         return info
+    
+    def get_computed_attribute_info_map(self, prim: Usd.Prim) -> Dict[str, Dict]:
+        """Get info for every computed attribute on a prim in one call"""
+        if not USD_AVAILABLE or not prim:
+            return {}
+        
+        return {
+            attr_name: self.get_computed_attribute_info(prim, attr_name)
+            for attr_name in self.get_all_computed_attributes(prim)
+        }
 
@@ -4,22 +4,25 @@ Handles payload loading and unloading for performance optimization
 Based on OpenUSD 25.11 specifications
 """
 
-from typing import Optional, List, Dict
+import logging
+from typing import Optional, List, Dict, Set
 from pxr import Usd
 
 try:
-    from pxr import Usd
+    from pxr import Usd, Sdf
     USD_AVAILABLE = True
 except ImportError:
     USD_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 
 class PayloadManager:
     """Manages USD payloads for performance optimization"""
     
     def __init__(self, stage: Usd.Stage):
         self.stage = stage
-        self.loaded_payloads = set()
+        self.loaded_payloads: Set[Sdf.Path] = set()
     
     def load_payload(self, prim: Usd.Prim) -> bool:
         """Load a payload on a prim"""
@@ -29,10 +32,10 @@ class PayloadManager:
         try:
             if prim.HasPayload():
                 prim.Load()
-                self.loaded_payloads.add(prim.GetPath().pathString)
+                self.loaded_payloads.add(prim.GetPath())
                 return True
         except Exception as e:
-            print(f"Error loading payload: {e}")
+            logger.warning("Error loading payload: %s", e)
             return False
         
         return False
@@ -45,39 +48,59 @@ class PayloadManager:
         try:
             if prim.HasPayload():
                 prim.Unload()
-                self.loaded_payloads.discard(prim.GetPath().pathString)
+                self.loaded_payloads.discard(prim.GetPath())
                 return True
         except Exception as e:
-            print(f"Error unloading payload: {e}")
+            logger.warning("Error unloading payload: %s", e)
             return False
         
         return False
     
+    def _iter_payload_prims(self):
+        """Yield every prim with a payload, including unloaded ones"""
+        # The default Traverse() predicate requires IsLoaded, which skips the
+        # very payload prims we are looking for; drop that term but keep the rest.
+        predicate = Usd.PrimIsActive & Usd.PrimIsDefined & ~Usd.PrimIsAbstract
+        for prim in Usd.PrimRange.Stage(self.stage, predicate):
+            if prim.HasPayload():
+                yield prim
+    
     def load_all_payloads(self) -> int:
         """Load all payloads in the stage"""
         if not USD_AVAILABLE or not self.stage:
             return 0
         
-        count = 0
-        for prim in self.stage.Traverse():
-            if prim.HasPayload() and prim.GetPath().pathString not in self.loaded_payloads:
-                if self.load_payload(prim):
-                    count += 1
+        load_paths = set(self.find_all_payload_paths()) - self.loaded_payloads
+        if not load_paths:
+            return 0
+        
+        # One recomposition for the whole set instead of one per prim
+        try:
+            self.stage.LoadAndUnload(load_paths, set(), Usd.LoadWithDescendants)
+        except Exception as e:
+            logger.warning("Error loading payloads: %s", e)
+            return 0
         
-        return count
+        self.loaded_payloads |= load_paths
+        return len(load_paths)
     
     def unload_all_payloads(self) -> int:
         """Unload all payloads in the stage"""
         if not USD_AVAILABLE or not self.stage:
             return 0
         
-        count = 0
-        for prim in self.stage.Traverse():
-            if prim.HasPayload() and prim.GetPath().pathString in self.loaded_payloads:
-                if self.unload_payload(prim):
-                    count += 1
+        unload_paths = self.loaded_payloads.intersection(self.find_all_payload_paths())
+        if not unload_paths:
+            return 0
+        
+        try:
+            self.stage.LoadAndUnload(set(), unload_paths)
+        except Exception as e:
+            logger.warning("Error unloading payloads: %s", e)
+            return 0
         
-        return count
+        self.loaded_payloads -= unload_paths
+        return len(unload_paths)
     
     def get_payload_info(self, prim: Usd.Prim) -> Optional[Dict]:
         """Get information about a prim's payload"""
@@ -85,14 +108,15 @@ class PayloadManager:
             return None
         
         try:
+            prim_path = prim.GetPath()
             payloads = prim.GetPayloads()
             if not payloads:
                 return None
             
             payload_info = {
-                'prim_path': prim.GetPath().pathString,
+                'prim_path': prim_path.pathString,
                 'payloads': [],
-                'is_loaded': prim.GetPath().pathString in self.loaded_payloads,
+                'is_loaded': prim_path in self.loaded_payloads,
             }
             
             for payload in payloads:
@@ -103,8 +127,8 @@ class PayloadManager:
                 payload_info['payloads'].append(payload_data)
             
             return payload_info
-        except Exception as e:
-            print(f"Error getting payload info: {e}")
+        except Exception:
+            logger.debug("Error getting payload info", exc_info=True)
             return None
     
     def find_all_payloads(self) -> List[Usd.Prim]:
@@ -112,10 +136,15 @@ class PayloadManager:
         if not USD_AVAILABLE or not self.stage:
             return []
         
-        payload_prims = []
-        for prim in self.stage.Traverse():
-            if prim.HasPayload():
-                payload_prims.append(prim)
+        return list(self._iter_payload_prims())
+    
+    def find_all_payload_paths(self) -> List[Sdf.Path]:
+        """Find the paths of all prims with payloads
         
-        return payload_prims
-
+        Prefer this over find_all_payloads() when only paths are needed; it
+        does not hold on to prim handles.
+        """
+        if not USD_AVAILABLE or not self.stage:
+            return []
+        
+        return [prim.GetPath() for prim in self._iter_payload_prims()]
@@ -4,15 +4,18 @@ Handles prim selection, highlighting, and transform manipulation
 Based on OpenUSD 25.11 specifications
 """
 
-from typing import Optional, List, Set
+import logging
+from typing import Optional, List, Set, Dict, Iterable
 from pxr import Usd, UsdGeom, Gf
 
 try:
-    from pxr import Usd, UsdGeom, Gf
+    from pxr import Usd, UsdGeom, Gf, Sdf, Tf
     USD_AVAILABLE = True
 except ImportError:
     USD_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 
 class PrimSelectionManager:
     """Manages prim selection and manipulation"""
@@ -21,26 +24,155 @@ class PrimSelectionManager:
         self.stage = stage
         self.selected_prims: Set[str] = set()
         self.highlighted_prim: Optional[str] = None
+        
+        # Memoized IsA(UsdGeom.Xformable) results, keyed by prim path
+        self._xformable_cache: Dict[Sdf.Path, bool] = {}
+        
+        # Parent world-transform caches, only live between begin_batch()/end_batch()
+        self._xform_cache: Optional[UsdGeom.XformCache] = None
+        self._batch_time: Optional[float] = None
+        self._parent_inv_cache: Dict[Sdf.Path, Gf.Matrix4d] = {}
+        
+        # Resolved prims for selected paths, pruned when the stage resyncs
+        self._prim_cache: Dict[str, Usd.Prim] = {}
+        self._objects_changed_listener = None
+        if USD_AVAILABLE and stage:
+            self._objects_changed_listener = Tf.Notice.Register(
+                Usd.Notice.ObjectsChanged, self._on_objects_changed, stage
+            )
+    
+    def _on_objects_changed(self, notice, sender):
+        """Drop cached lookups under resynced paths (prims added, removed or retyped)"""
+        resynced_paths = notice.GetResyncedPaths()
+        if not resynced_paths:
+            return
+        
+        def is_stale(path: Sdf.Path) -> bool:
+            return any(path.HasPrefix(resynced) for resynced in resynced_paths)
+        
+        for path_str in [p for p in self._prim_cache if is_stale(Sdf.Path(p))]:
+            del self._prim_cache[path_str]
+        for path in [p for p in self._xformable_cache if is_stale(p)]:
+            del self._xformable_cache[path]
+    
+    def _is_xformable(self, prim: Usd.Prim) -> bool:
+        """Cached check whether a prim is Xformable"""
+        path = prim.GetPath()
+        is_xformable = self._xformable_cache.get(path)
+        if is_xformable is None:
+            is_xformable = prim.IsA(UsdGeom.Xformable)
+            self._xformable_cache[path] = is_xformable
+        return is_xformable
+    
+    @staticmethod
+    def _get_or_create_op(xformable: UsdGeom.Xformable, op_type) -> UsdGeom.XformOp:
+        """Return the prim's plain (unsuffixed, non-inverse) op of op_type, adding it if missing
+        
+        Reusing the existing op keeps repeated edits (e.g. gizmo drags) from
+        appending a new op to xformOpOrder on every call.
+        """
+        for op in xformable.GetOrderedXformOps():
+            if op.GetOpType() == op_type and not op.IsInverseOp() and len(op.SplitName()) == 2:
+                return op
+        
+        add_methods = {
+            UsdGeom.XformOp.TypeTranslate: xformable.AddTranslateOp,
+            UsdGeom.XformOp.TypeRotateXYZ: xformable.AddRotateXYZOp,
+            UsdGeom.XformOp.TypeScale: xformable.AddScaleOp,
+            UsdGeom.XformOp.TypeTransform: xformable.AddTransformOp,
+        }
+        return add_methods[op_type]()
+    
+    @staticmethod
+    def _collapse_to_matrix_op(xformable: UsdGeom.Xformable) -> UsdGeom.XformOp:
+        """Replace the op stack with one matrix op, baking any existing animation
+        
+        MakeMatrixXform() alone drops every op with its time samples, so each
+        key (and the default value, if authored) is re-set on the new op.
+        """
+        ops = xformable.GetOrderedXformOps()
+        default = Usd.TimeCode.Default()
+        baked = [(time, xformable.GetLocalTransformation(time))
+                 for time in xformable.GetTimeSamples()]
+        if baked and any(op.Get(default) is not None for op in ops):
+            baked.append((default, xformable.GetLocalTransformation(default)))
+        reset_xform_stack = xformable.GetResetXformStack()
+        
+        xform_op = xformable.MakeMatrixXform()
+        if reset_xform_stack:
+            xformable.SetResetXformStack(True)
+        for time, matrix in baked:
+            xform_op.Set(matrix, time)
+        return xform_op
+    
+    def begin_batch(self, time_code: float = 0.0):
+        """Start a batch of set_prim_transform calls at one time code
+        
+        Parent world transforms (and their inverses) are computed once per parent
+        for the whole batch, e.g. while dragging many siblings at once.
+        """
+        self._xform_cache = UsdGeom.XformCache(time_code)
+        self._batch_time = time_code
+        self._parent_inv_cache.clear()
+    
+    def end_batch(self):
+        """Finish a transform batch and drop its caches"""
+        self._xform_cache = None
+        self._batch_time = None
+        self._parent_inv_cache.clear()
+    
+    def _get_parent_inverse(self, parent_prim: Usd.Prim, time_code: float) -> Gf.Matrix4d:
+        """Inverse world transform of a parent prim, cached while a batch is active"""
+        if self._xform_cache is None or time_code != self._batch_time:
+            parent_transform = UsdGeom.Xformable(parent_prim).ComputeLocalToWorldTransform(time_code)
+            return parent_transform.GetInverse()
+        
+        parent_path = parent_prim.GetPath()
+        parent_inverse = self._parent_inv_cache.get(parent_path)
+        if parent_inverse is None:
+            parent_inverse = self._xform_cache.GetLocalToWorldTransform(parent_prim).GetInverse()
+            self._parent_inv_cache[parent_path] = parent_inverse
+        return parent_inverse
+    
+    def _invalidate_batch_below(self, prim_path: Sdf.Path):
+        """Drop batch caches made stale by editing the transform at prim_path"""
+        if self._xform_cache is None:
+            return
+        if any(path.HasPrefix(prim_path) for path in self._parent_inv_cache):
+            self._xform_cache.Clear()
+            self._parent_inv_cache.clear()
+    
+    def invalidate_caches(self):
+        """Drop cached per-prim lookups (call after the stage is edited or reloaded)"""
+        self._xformable_cache.clear()
+        self._prim_cache.clear()
     
     def select_prim(self, prim_path: str, add_to_selection: bool = False):
         """Select a prim"""
         if not add_to_selection:
             self.selected_prims.clear()
+            self._prim_cache.clear()
         self.selected_prims.add(prim_path)
     
     def deselect_prim(self, prim_path: str):
         """Deselect a prim"""
         self.selected_prims.discard(prim_path)
+        self._prim_cache.pop(prim_path, None)
     
     def clear_selection(self):
         """Clear all selections"""
         self.selected_prims.clear()
+        self.invalidate_caches()
     
     def get_selected_prims(self) -> List[Usd.Prim]:
         """Get list of selected prims"""
         prims = []
+        prim_cache = self._prim_cache
         for path_str in self.selected_prims:
-            prim = self.stage.GetPrimAtPath(path_str)
+            prim = prim_cache.get(path_str)
+            if prim is None or not prim.IsValid():
+                prim = self.stage.GetPrimAtPath(path_str)
+                prim_cache[path_str] = prim
             if prim and prim.IsValid():
                 prims.append(prim)
         return prims
@@ -67,106 +199,130 @@ class PrimSelectionManager:
                 boundable = UsdGeom.Boundable(prim)
                 bbox = boundable.ComputeWorldBound(time_code, Usd.TimeCode.Default())
                 return bbox
-        except Exception as e:
-            print(f"Error getting prim bounds: {e}")
+        except Exception:
+            logger.debug("Error getting prim bounds", exc_info=True)
         
         return None
     
+    def get_selection_bounds(self, prim_paths: Optional[Iterable[str]] = None,
+                             time_code: float = 0.0) -> Gf.Range3d:
+        """Get the combined world-space bounds of several prims (default: the selection)
+        
+        All prims share one BBoxCache, so common ancestors' transforms are
+        resolved once rather than once per prim. Returns an empty range if no
+        boundable prims are found.
+        """
+        bounds = Gf.Range3d()
+        if not USD_AVAILABLE or not self.stage:
+            return bounds
+        
+        if prim_paths is None:
+            prims = self.get_selected_prims()
+        else:
+            prims = [self.stage.GetPrimAtPath(path) for path in prim_paths]
+        
+        try:
+            bbox_cache = UsdGeom.BBoxCache(time_code, [UsdGeom.Tokens.default_])
+            for prim in prims:
+                if prim and prim.IsA(UsdGeom.Boundable):
+                    bounds.UnionWith(bbox_cache.ComputeWorldBound(prim).ComputeAlignedRange())
+        except Exception:
+            logger.debug("Error getting selection bounds", exc_info=True)
+        
+        return bounds
+    
     def get_prim_transform(self, prim: Usd.Prim, time_code: float = 0.0) -> Optional[Gf.Matrix4d]:
         """Get transform matrix for a prim"""
         if not USD_AVAILABLE or not prim:
             return None
         
         try:
-            if prim.IsA(UsdGeom.Xformable):
+            if self._is_xformable(prim):
                 xformable = UsdGeom.Xformable(prim)
                 transform = xformable.ComputeLocalToWorldTransform(time_code)
                 return transform
-        except Exception as e:
-            print(f"Error getting prim transform: {e}")
+        except Exception:
+            logger.debug("Error getting prim transform", exc_info=True)
         
         return None
     
     def set_prim_transform(self, prim: Usd.Prim, transform: Gf.Matrix4d, time_code: float = None) -> bool:
         """Set transform for a prim"""
-        if not USD_AVAILABLE or not prim or not prim.IsA(UsdGeom.Xformable):
+        if not USD_AVAILABLE or not prim or not self._is_xformable(prim):
             return False
         
         try:
             xformable = UsdGeom.Xformable(prim)
             
-            # Get current transform
-            current_transform = xformable.ComputeLocalToWorldTransform(time_code or 0.0)
-            
             # Calculate local transform
             parent_prim = prim.GetParent()
-            if parent_prim and parent_prim.IsA(UsdGeom.Xformable):
-                parent_xform = UsdGeom.Xformable(parent_prim)
-                parent_transform = parent_xform.ComputeLocalToWorldTransform(time_code or 0.0)
-                local_transform = transform * parent_transform.GetInverse()
+            if parent_prim and self._is_xformable(parent_prim):
+                local_transform = transform * self._get_parent_inverse(parent_prim, time_code or 0.0)
             else:
                 local_transform = transform
             
-            # Set transform
-            xform_op = xformable.AddTransformOp()
-            if time_code is not None:
-                xform_op.Set(local_transform, time_code)
-            else:
-                xform_op.Set(local_transform)
+            # Collapse the op stack to a single matrix op so repeated sets never stack
+            with Sdf.ChangeBlock():
+                xform_op = self._collapse_to_matrix_op(xformable)
+                if time_code is not None:
+                    xform_op.Set(local_transform, time_code)
+                else:
+                    xform_op.Set(local_transform)
             
+            self._invalidate_batch_below(prim.GetPath())
             return True
         except Exception as e:
-            print(f"Error setting prim transform: {e}")
+            logger.warning("Error setting prim transform: %s", e)
             return False
     
     def translate_prim(self, prim: Usd.Prim, translation: Gf.Vec3d, time_code: float = None) -> bool:
         """Translate a prim"""
-        if not USD_AVAILABLE or not prim or not prim.IsA(UsdGeom.Xformable):
+        if not USD_AVAILABLE or not prim or not self._is_xformable(prim):
             return False
         
         try:
             xformable = UsdGeom.Xformable(prim)
-            translate_op = xformable.AddTranslateOp()
+            translate_op = self._get_or_create_op(xformable, UsdGeom.XformOp.TypeTranslate)
             if time_code is not None:
                 translate_op.Set(translation, time_code)
             else:
                 translate_op.Set(translation)
             return True
         except Exception as e:
-            print(f"Error translating prim: {e}")
+            logger.warning("Error translating prim: %s", e)
             return False
     
     def rotate_prim(self, prim: Usd.Prim, rotation: Gf.Vec3f, time_code: float = None) -> bool:
         """Rotate a prim (Euler angles in degrees)"""
-        if not USD_AVAILABLE or not prim or not prim.IsA(UsdGeom.Xformable):
+        if not USD_AVAILABLE or not prim or not self._is_xformable(prim):
             return False
         
         try:
             xformable = UsdGeom.Xformable(prim)
-            rotate_op = xformable.AddRotateXYZOp()
+            rotate_op = self._get_or_create_op(xformable, UsdGeom.XformOp.TypeRotateXYZ)
             if time_code is not None:
                 rotate_op.Set(rotation, time_code)
             else:
                 rotate_op.Set(rotation)
             return True
         except Exception as e:
-            print(f"Error rotating prim: {e}")
+            logger.warning("Error rotating prim: %s", e)
             return False
     
     def scale_prim(self, prim: Usd.Prim, scale: Gf.Vec3f, time_code: float = None) -> bool:
         """Scale a prim"""
-        if not USD_AVAILABLE or not prim or not prim.IsA(UsdGeom.Xformable):
+        if not USD_AVAILABLE or not prim or not self._is_xformable(prim):
             return False
         
         try:
             xformable = UsdGeom.Xformable(prim)
-            scale_op = xformable.AddScaleOp()
+            scale_op = self._get_or_create_op(xformable, UsdGeom.XformOp.TypeScale)
             if time_code is not None:
                 scale_op.Set(scale, time_code)
             else:
                 scale_op.Set(scale)
             return True
         except Exception as e:
-            print(f"Error scaling prim: {e}")
+            logger.warning("Error scaling prim: %s", e)
             return False
 
@@ -3,7 +3,8 @@ Scene Comparison/Diff
 Compare two USD stages and highlight differences
 """
 
-from typing import Dict, List, Optional, Set
+import logging
+from typing import Dict, List, Optional
 from pxr import Usd, Sdf
 
 try:
@@ -12,18 +13,22 @@ try:
 except ImportError:
     USD_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 
 class SceneDiff:
     """Represents differences between two stages"""
     
     def __init__(self):
-        self.added_prims: List[str] = []
-        self.removed_prims: List[str] = []
-        self.modified_prims: List[str] = []
-        self.added_attributes: Dict[str, List[str]] = {}  # prim_path -> [attr_names]
-        self.removed_attributes: Dict[str, List[str]] = {}
-        self.modified_attributes: Dict[str, List[str]] = {}
-        self.different_values: Dict[str, Dict[str, tuple]] = {}  # prim_path -> {attr_name: (old, new)}
+        # Prim paths are kept as Sdf.Path; stringify them only for display
+        self.added_prims: List[Sdf.Path] = []
+        self.removed_prims: List[Sdf.Path] = []
+        self.modified_prims: List[Sdf.Path] = []
+        self.added_attributes: Dict[Sdf.Path, List[str]] = {}  # prim_path -> [attr_names]
+        self.removed_attributes: Dict[Sdf.Path, List[str]] = {}
+        self.modified_attributes: Dict[Sdf.Path, List[str]] = {}
+        self.different_values: Dict[Sdf.Path, Dict[str, tuple]] = {}  # prim_path -> {attr_name: (old, new)}
+        self.unreadable_attributes = 0  # attributes whose values could not be read or compared
 
 
 class SceneComparator:
@@ -40,35 +45,38 @@ class SceneComparator:
         
         diff = SceneDiff()
         
-        # Get all prim paths from both stages
-        paths1 = self._get_all_prim_paths(self.stage1)
-        paths2 = self._get_all_prim_paths(self.stage2)
+        # Only stage1 is indexed; stage2 streams past it, claiming its matches
+        prims1 = self._get_prims_by_path(self.stage1)
+        common_prims = []
+        for prim2 in self.stage2.Traverse():
+            prim_path = prim2.GetPath()
+            prim1 = prims1.pop(prim_path, None)
+            if prim1 is None:
+                diff.added_prims.append(prim_path)
+            else:
+                common_prims.append((prim1, prim2))
         
-        # Find added and removed prims
-        diff.added_prims = list(paths2 - paths1)
-        diff.removed_prims = list(paths1 - paths2)
+        # Whatever stage2 did not claim only exists in stage1
+        diff.removed_prims = list(prims1)
+        del prims1
         
-        # Find common prims and compare
-        common_paths = paths1 & paths2
-        for prim_path in common_paths:
-            prim1 = self.stage1.GetPrimAtPath(prim_path)
-            prim2 = self.stage2.GetPrimAtPath(prim_path)
-            
-            if prim1 and prim2:
-                self._compare_prim(prim1, prim2, diff)
+        # Compare common prims without resolving their paths again
+        for prim1, prim2 in common_prims:
+            self._compare_prim(prim1, prim2, diff)
+        
+        if diff.unreadable_attributes:
+            logger.warning("Skipped %d attributes whose values could not be compared",
+                           diff.unreadable_attributes)
         
         return diff
     
-    def _get_all_prim_paths(self, stage: Usd.Stage) -> Set[str]:
-        """Get all prim paths from a stage"""
-        paths = set()
-        for prim in stage.Traverse():
-            paths.add(prim.GetPath().pathString)
-        return paths
+    def _get_prims_by_path(self, stage: Usd.Stage) -> Dict[Sdf.Path, Usd.Prim]:
+        """Get all prims from a stage keyed by path"""
+        return {prim.GetPath(): prim for prim in stage.Traverse()}
     
     def _compare_prim(self, prim1: Usd.Prim, prim2: Usd.Prim, diff: SceneDiff):
         """Compare two prims"""
-        prim_path = prim1.GetPath().pathString
+        prim_path = prim1.GetPath()
         
         # Get attributes
         attrs1 = {attr.GetName(): attr for attr in prim1.GetAttributes()}
@@ -79,14 +87,10 @@ class SceneComparator:
         removed_attrs = set(attrs1.keys()) - set(attrs2.keys())
         
         if added_attrs:
-            if prim_path not in diff.added_attributes:
-                diff.added_attributes[prim_path] = []
-            diff.added_attributes[prim_path].extend(added_attrs)
+            diff.added_attributes.setdefault(prim_path, []).extend(added_attrs)
         
         if removed_attrs:
-            if prim_path not in diff.removed_attributes:
-                diff.removed_attributes[prim_path] = []
-            diff.removed_attributes[prim_path].extend(removed_attrs)
+            diff.removed_attributes.setdefault(prim_path, []).extend(removed_attrs)
         
         # Compare common attributes
         common_attrs = set(attrs1.keys()) & set(attrs2.keys())
@@ -94,25 +98,53 @@ class SceneComparator:
             attr1 = attrs1[attr_name]
             attr2 = attrs2[attr_name]
             
+            # Skip fetching large arrays that both stages read from the same spec
+            if self._shares_default_value(attr1, attr2):
+                continue
+            
+            # Neither side resolves a value, so there is nothing to fetch
+            has_value1 = attr1.HasValue()
+            has_value2 = attr2.HasValue()
+            if not (has_value1 or has_value2):
+                continue
+            
             try:
-                value1 = attr1.Get()
-                value2 = attr2.Get()
-                
-                if value1 != value2:
-                    if prim_path not in diff.modified_attributes:
-                        diff.modified_attributes[prim_path] = []
-                    diff.modified_attributes[prim_path].append(attr_name)
-                    
-                    if prim_path not in diff.different_values:
-                        diff.different_values[prim_path] = {}
-                    diff.different_values[prim_path][attr_name] = (value1, value2)
-            except:
-                pass
+                value1 = attr1.Get() if has_value1 else None
+                value2 = attr2.Get() if has_value2 else None
+                changed = value1 != value2
+            except Exception:
+                logger.debug("Could not compare %s.%s", prim_path, attr_name, exc_info=True)
+                diff.unreadable_attributes += 1
+                continue
+            
+            if changed:
+                diff.modified_attributes.setdefault(prim_path, []).append(attr_name)
+                diff.different_values.setdefault(prim_path, {})[attr_name] = (value1, value2)
         
         # Check if prim type changed
+        # Each prim is compared once, so no membership scan of the list is needed
         if prim1.GetTypeName() != prim2.GetTypeName():
-            if prim_path not in diff.modified_prims:
-                diff.modified_prims.append(prim_path)
+            diff.modified_prims.append(prim_path)
+    
+    @staticmethod
+    def _default_value_spec(attr: Usd.Attribute) -> Optional[Sdf.AttributeSpec]:
+        """Get the strongest spec that authors a default value for attr"""
+        for spec in attr.GetPropertyStack(Usd.TimeCode.Default()):
+            if spec.HasDefaultValue():
+                return spec
+        return None
+    
+    @classmethod
+    def _shares_default_value(cls, attr1: Usd.Attribute, attr2: Usd.Attribute) -> bool:
+        """Check if two array attributes resolve their value from the same layer spec"""
+        type_name = attr1.GetTypeName()
+        # Only worth checking for arrays; time code values are remapped by layer offsets
+        if (not type_name.isArray or type_name != attr2.GetTypeName()
+                or type_name == Sdf.ValueTypeNames.TimeCodeArray):
+            return False
+        
+        spec1 = cls._default_value_spec(attr1)
+        return spec1 is not None and spec1 == cls._default_value_spec(attr2)
     
     def get_diff_summary(self, diff: SceneDiff) -> str:
         """Get human-readable diff summary"""
@@ -3,21 +3,73 @@ Scene Graph Search & Filter
 Search and filter prims by name, type, path, metadata, etc.
 """
 
-from typing import Optional, List, Dict, Callable
+from typing import Any, Optional, List, Dict, Callable, Tuple
 from pxr import Usd, UsdGeom
 
 try:
-    from pxr import Usd, UsdGeom
+    from pxr import Usd, UsdGeom, Tf
     USD_AVAILABLE = True
 except ImportError:
     USD_AVAILABLE = False
 
 
+# (lowercase name, lowercase path, lowercase type name, prim, metadata dict)
+_IndexEntry = Tuple[str, str, str, Usd.Prim, Dict[str, Any]]
+
+
+def _search_by_name(index: List[_IndexEntry], query_lower: str) -> List[Usd.Prim]:
+    """Prims whose name contains query_lower"""
+    return [entry[3] for entry in index if query_lower in entry[0]]
+
+
+def _search_by_path(index: List[_IndexEntry], query_lower: str) -> List[Usd.Prim]:
+    """Prims whose path contains query_lower"""
+    return [entry[3] for entry in index if query_lower in entry[1]]
+
+
+def _search_by_type(index: List[_IndexEntry], query_lower: str) -> List[Usd.Prim]:
+    """Prims whose type name contains query_lower"""
+    return [entry[3] for entry in index if query_lower in entry[2]]
+
+
+def _search_all(index: List[_IndexEntry], query_lower: str) -> List[Usd.Prim]:
+    """Prims whose name, path or type name contains query_lower"""
+    # The name is the last path element, so a name match is also a path match
+    return [entry[3] for entry in index if query_lower in entry[1] or query_lower in entry[2]]
+
+
+# search_type -> specialised loop that only calls the getters it needs
+_SEARCH_LOOPS = {
+    "name": _search_by_name,
+    "path": _search_by_path,
+    "type": _search_by_type,
+    "all": _search_all,
+}
+
+
 class SceneSearchManager:
     """Manages scene graph search and filtering"""
     
     def __init__(self, stage: Usd.Stage):
         self.stage = stage
+        # Bumped on scene edits; cached scan results are tagged with it
+        self._change_token = 0
+        # (token, search index, type name -> index entries, sorted metadata keys)
+        self._scan_cache: Optional[
+            Tuple[int, List[_IndexEntry], Dict[str, List[_IndexEntry]], List[str]]
+        ] = None
+        self._objects_changed_listener = None
+        if USD_AVAILABLE and stage:
+            self._objects_changed_listener = Tf.Notice.Register(
+                Usd.Notice.ObjectsChanged, self._on_objects_changed, stage
+            )
+    
+    def _on_objects_changed(self, notice, sender):
+        """Invalidate cached scan results on prim or metadata edits"""
+        # Attribute value edits don't change types or metadata keys
+        if (notice.GetResyncedPaths()
+                or any(path.IsPrimPath() for path in notice.GetChangedInfoOnlyPaths())):
+            self._change_token += 1
     
     def search_prims(self, query: str, search_type: str = "name") -> List[Usd.Prim]:
         """
@@ -30,26 +82,67 @@ class SceneSearchManager:
         if not USD_AVAILABLE or not self.stage:
             return []
         
-        results = []
-        query_lower = query.lower()
+        search_loop = _SEARCH_LOOPS.get(search_type)
+        if search_loop is None:
+            return []
+        return search_loop(self._scan()[0], query.lower())
+    
+    def combined_search(self, query: str = "", search_type: str = "name",
+                        prim_type: Optional[str] = None,
+                        metadata_key: Optional[str] = None,
+                        metadata_value: Optional[str] = None) -> List[Usd.Prim]:
+        """
+        Search and filter prims in a single pass over the cached search index
         
-        for prim in self.stage.Traverse():
-            match = False
-            
-            if search_type in ("name", "all"):
-                if query_lower in prim.GetName().lower():
-                    match = True
-            
-            if search_type in ("path", "all") and not match:
-                if query_lower in prim.GetPath().pathString.lower():
-                    match = True
+        Args:
+            query: Search query string (empty matches every prim)
+            search_type: Type of search ("name", "path", "type", "all")
+            prim_type: Only keep prims with exactly this type name
+            metadata_key: Only keep prims that have this metadata
+            metadata_value: Only keep prims whose metadata value matches (case-insensitive)
+        """
+        if not USD_AVAILABLE or not self.stage:
+            return []
+        
+        query_lower = query.lower() if query else None
+        if query_lower is not None and search_type not in _SEARCH_LOOPS:
+            return []
+        match_name = search_type == "name"
+        match_path = search_type in ("path", "all")
+        match_type = search_type in ("type", "all")
+        meta_value_lower = metadata_value.lower() if metadata_value else None
+        
+        # The type filter is a lookup in the cached scan, so only those prims are visited
+        index, entries_by_type, _ = self._scan()
+        if prim_type is not None:
+            entries = entries_by_type.get(prim_type, ())
+        else:
+            entries = index
+        
+        results = []
+        append = results.append
+        # Remaining predicates run cheapest-first so most prims are rejected early
+        for name_lower, path_lower, type_lower, prim, metadata in entries:
+            if query_lower is not None:
+                if match_name:
+                    matched = query_lower in name_lower
+                else:
+                    matched = (
+                        (match_path and query_lower in path_lower)
+                        or (match_type and query_lower in type_lower)
+                    )
+                if not matched:
+                    continue
             
-            if search_type in ("type", "all") and not match:
-                if query_lower in prim.GetTypeName().lower():
-                    match = True
+            # Metadata was captured by the scan, so no per-prim USD calls here
+            if metadata_key is not None:
+                if metadata_key not in metadata:
+                    continue
+                if (meta_value_lower is not None
+                        and str(metadata[metadata_key]).lower() != meta_value_lower):
+                    continue
             
-            if match:
-                results.append(prim)
+            append(prim)
         
         return results
     
@@ -58,27 +151,14 @@ class SceneSearchManager:
         if not USD_AVAILABLE or not self.stage:
             return []
         
-        results = []
-        for prim in self.stage.Traverse():
-            if prim.GetTypeName() == prim_type:
-                results.append(prim)
-        return results
+        return [entry[3] for entry in self._scan()[1].get(prim_type, ())]
     
     def filter_by_metadata(self, key: str, value: str = None) -> List[Usd.Prim]:
         """Filter prims by metadata"""
         if not USD_AVAILABLE or not self.stage:
             return []
         
-        results = []
-        for prim in self.stage.Traverse():
-            if prim.HasMetadata(key):
-                if value is None:
-                    results.append(prim)
-                else:
-                    metadata_value = prim.GetMetadata(key)
-                    if str(metadata_value).lower() == value.lower():
-                        results.append(prim)
-        return results
+        return self.combined_search(metadata_key=key, metadata_value=value)
     
     def filter_by_variant(self, variant_set: str, variant: str) -> List[Usd.Prim]:
         """Filter prims by variant selection"""
@@ -105,24 +185,46 @@ class SceneSearchManager:
                 results.append(prim)
         return results
     
-    def get_prim_types(self) -> List[str]:
-        """Get all unique prim types in the stage"""
+    def _scan(self) -> Tuple[List[_IndexEntry], Dict[str, List[_IndexEntry]], List[str]]:
+        """Get the search index, its entries grouped by type name and sorted metadata keys
+        
+        Entries carry each prim's metadata so metadata filters don't query USD.
+        Built in one traversal and cached until the stage changes.
+        """
+        cached = self._scan_cache
+        if cached is None or cached[0] != self._change_token:
+            index: List[_IndexEntry] = []
+            entries_by_type: Dict[str, List[_IndexEntry]] = {}
+            keys = set()
+            for prim in self.stage.Traverse():
+                type_name = prim.GetTypeName()
+                metadata = prim.GetAllMetadata()
+                entry = (prim.GetName().lower(), prim.GetPath().pathString.lower(),
+                         type_name.lower(), prim, metadata)
+                index.append(entry)
+                type_entries = entries_by_type.get(type_name)
+                if type_entries is None:
+                    entries_by_type[type_name] = [entry]
+                else:
+                    type_entries.append(entry)
+                keys.update(metadata)
+            cached = (self._change_token, index, entries_by_type, sorted(keys))
+            self._scan_cache = cached
+        return cached[1], cached[2], cached[3]
+    
+    def scan_stage(self) -> Tuple[List[str], List[str]]:
+        """Get sorted unique prim types and metadata keys in one traversal"""
         if not USD_AVAILABLE or not self.stage:
-            return []
+            return [], []
         
-        types = set()
-        for prim in self.stage.Traverse():
-            types.add(prim.GetTypeName())
-        return sorted(list(types))
+        _, entries_by_type, keys = self._scan()
+        return sorted(entries_by_type), list(keys)
+    
+    def get_prim_types(self) -> List[str]:
+        """Get all unique prim types in the stage"""
+        return self.scan_stage()[0]
     
     def get_metadata_keys(self) -> List[str]:
         """Get all unique metadata keys in the stage"""
-        if not USD_AVAILABLE or not self.stage:
-            return []
-        
-        keys = set()
-        for prim in self.stage.Traverse():
-            for key in prim.GetAllMetadata():
-                keys.add(key)
-        return sorted(list(keys))
+        return self.scan_stage()[1]
 
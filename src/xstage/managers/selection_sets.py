@@ -3,9 +3,15 @@ Selection Sets Manager
 Save, load, and manage named selection sets
 """
 
-from typing import List, Dict, Optional, Set
+import atexit
+import logging
+import weakref
+from typing import List, Dict, Optional, Set, Any, Iterable, Tuple, Union
 from pathlib import Path
 import json
+import os
+import sys
+import threading
 from dataclasses import dataclass, asdict
 from enum import Enum
 
@@ -15,6 +21,50 @@ try:
 except ImportError:
     USD_AVAILABLE = False
 
+# Optional: orjson encodes/decodes several times faster than the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def _dumps(data: Any) -> bytes:
+    """Encode data as indented JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _loads(raw: bytes) -> Any:
+    """Decode JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _to_path(prim_path: Union[str, "Sdf.Path"]) -> "Sdf.Path":
+    """Coerce a path string (or Sdf.Path) to Sdf.Path; plain strings without USD"""
+    return Sdf.Path(prim_path) if USD_AVAILABLE else str(prim_path)
+
+
+def _intern_paths(prim_paths: Iterable[str]) -> Tuple[str, ...]:
+    """Sorted tuple of interned path strings, shared across all selection sets"""
+    return tuple(sorted({sys.intern(p) for p in prim_paths}))
+
+
+# Managers whose pending writes are flushed when the interpreter exits
+_live_managers = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_managers():
+    """Write every manager's pending save before exit"""
+    for manager in list(_live_managers):
+        manager.flush(final=True)
+
 
 class SelectionSetOperation(Enum):
     """Selection set operations"""
@@ -28,7 +78,7 @@ class SelectionSetOperation(Enum):
 class SelectionSet:
     """Named selection set"""
     name: str
-    prim_paths: List[str]
+    prim_paths: Tuple[str, ...]  # Sorted, de-duplicated and interned
     stage_path: Optional[str] = None  # USD file path
     description: str = ""
     tags: List[str] = None
@@ -36,6 +86,7 @@ class SelectionSet:
     updated_at: float = 0.0
     
     def __post_init__(self):
+        self.prim_paths = _intern_paths(self.prim_paths)
         if self.tags is None:
             self.tags = []
         if self.created_at == 0.0:
@@ -47,21 +98,84 @@ class SelectionSet:
 class SelectionSetManager:
     """Manages selection sets"""
     
+    # Bursts of edits within this window are coalesced into a single disk write
+    SAVE_DEBOUNCE_SECONDS = 0.5
+    # A failed write is retried this many times, this far apart
+    SAVE_RETRY_SECONDS = 2.0
+    SAVE_MAX_RETRIES = 5
+    
     def __init__(self, stage: Optional[Usd.Stage] = None, config_path: Optional[str] = None):
         self.stage = stage
         self.config_path = config_path or str(Path.home() / ".xstage" / "selection_sets.json")
         self.selection_sets: List[SelectionSet] = []
-        self.current_selection: Set[str] = set()
+        # Sdf.Path hashes by interned-pool identity, so set ops skip string hashing.
+        # Callers that need strings use str(path) / path.pathString.
+        self.current_selection: Set[Sdf.Path] = set()
+        self._sdf_paths: Dict[str, Tuple[Sdf.Path, ...]] = {}  # Per-set converted paths
+        self._dirty = False  # True when selection_sets differ from what is on disk
+        
+        # Background save state: the latest snapshot waiting to be written
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._pending_data: Optional[Dict] = None
+        
+        # Lookup indices over selection_sets (which stays the canonical, ordered list)
+        self._by_name: Dict[str, SelectionSet] = {}
+        self._by_stage: Dict[Optional[str], Dict[str, SelectionSet]] = {}
+        self._by_tag: Dict[str, Dict[str, SelectionSet]] = {}
         self.load()
+        _live_managers.add(self)
+    
+    def _index_add(self, selection_set: SelectionSet):
+        """Add a selection set to the lookup indices"""
+        name = selection_set.name
+        self._by_name[name] = selection_set
+        self._by_stage.setdefault(selection_set.stage_path, {})[name] = selection_set
+        for tag in selection_set.tags:
+            self._by_tag.setdefault(tag, {})[name] = selection_set
+    
+    def _index_remove(self, selection_set: SelectionSet):
+        """Remove a selection set from the lookup indices"""
+        name = selection_set.name
+        self._by_name.pop(name, None)
+        self._sdf_paths.pop(name, None)
+        buckets = [(self._by_stage, selection_set.stage_path)]
+        buckets.extend((self._by_tag, tag) for tag in selection_set.tags)
+        for index, key in buckets:
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.pop(name, None)
+                if not bucket:
+                    del index[key]
+    
+    def _rebuild_indices(self):
+        """Rebuild all lookup indices from selection_sets"""
+        self._by_name.clear()
+        self._sdf_paths.clear()
+        self._by_stage.clear()
+        self._by_tag.clear()
+        for selection_set in self.selection_sets:
+            self._index_add(selection_set)
+    
+    def _add_selection_set(self, selection_set: SelectionSet):
+        """Add a selection set, replacing any existing set with the same name"""
+        existing = self._by_name.get(selection_set.name)
+        if existing is not None:
+            self._remove_selection_set(existing)
+        self.selection_sets.append(selection_set)
+        self._index_add(selection_set)
+    
+    def _remove_selection_set(self, selection_set: SelectionSet):
+        """Remove a selection set from the list and indices"""
+        self._index_remove(selection_set)
+        self.selection_sets.remove(selection_set)
     
     def create_selection_set(self, name: str, prim_paths: List[str], 
                             description: str = "", tags: List[str] = None) -> str:
         """Create a new selection set"""
         import time
         
-        # Remove existing set with same name
-        self.selection_sets = [s for s in self.selection_sets if s.name != name]
-        
         stage_path = None
         if self.stage:
             stage_path = self.stage.GetRootLayer().identifier
@@ -76,115 +190,203 @@ class SelectionSetManager:
             updated_at=time.time()
         )
         
-        self.selection_sets.append(selection_set)
+        # Replaces any existing set with the same name
+        self._add_selection_set(selection_set)
+        self._dirty = True
         self.save()
         return name
     
     def get_selection_set(self, name: str) -> Optional[SelectionSet]:
         """Get a selection set by name"""
-        for s in self.selection_sets:
-            if s.name == name:
-                return s
-        return None
+        return self._by_name.get(name)
     
     def delete_selection_set(self, name: str) -> bool:
         """Delete a selection set"""
-        for i, s in enumerate(self.selection_sets):
-            if s.name == name:
-                self.selection_sets.pop(i)
-                self.save()
-                return True
-        return False
+        selection_set = self._by_name.get(name)
+        if selection_set is None:
+            return False
+        self._remove_selection_set(selection_set)
+        self._dirty = True
+        self.save()
+        return True
     
     def update_selection_set(self, name: str, prim_paths: List[str] = None,
                            description: str = None, tags: List[str] = None) -> bool:
         """Update a selection set"""
         import time
         
-        for s in self.selection_sets:
-            if s.name == name:
-                if prim_paths is not None:
-                    s.prim_paths = prim_paths
-                if description is not None:
-                    s.description = description
-                if tags is not None:
-                    s.tags = tags
-                s.updated_at = time.time()
-                self.save()
-                return True
-        return False
+        s = self._by_name.get(name)
+        if s is None:
+            return False
+        
+        if prim_paths is not None:
+            s.prim_paths = _intern_paths(prim_paths)
+            self._sdf_paths.pop(name, None)
+        if description is not None:
+            s.description = description
+        if tags is not None:
+            # Re-index under the new tags
+            self._index_remove(s)
+            s.tags = tags
+            self._index_add(s)
+        s.updated_at = time.time()
+        self._dirty = True
+        self.save()
+        return True
     
     def get_selection_sets_for_stage(self, stage_path: str) -> List[SelectionSet]:
         """Get selection sets for a specific stage"""
-        return [s for s in self.selection_sets if s.stage_path == stage_path]
+        return list(self._by_stage.get(stage_path, {}).values())
     
     def get_selection_sets_by_tag(self, tag: str) -> List[SelectionSet]:
         """Get selection sets by tag"""
-        return [s for s in self.selection_sets if tag in s.tags]
+        return list(self._by_tag.get(tag, {}).values())
+    
+    def _get_sdf_paths(self, selection_set: SelectionSet) -> Tuple[Sdf.Path, ...]:
+        """A selection set's paths as Sdf.Path, converted once per set"""
+        paths = self._sdf_paths.get(selection_set.name)
+        if paths is None:
+            paths = tuple(_to_path(p) for p in selection_set.prim_paths)
+            self._sdf_paths[selection_set.name] = paths
+        return paths
     
     def apply_selection_set(self, name: str, operation: SelectionSetOperation = SelectionSetOperation.REPLACE) -> List[str]:
-        """Apply a selection set to current selection"""
+        """Apply a selection set to current selection
+        
+        The current selection is updated in place; the result is a copy as path strings.
+        """
         selection_set = self.get_selection_set(name)
         if not selection_set:
             return []
         
-        current_set = set(self.current_selection)
-        new_set = set(selection_set.prim_paths)
+        current = self.current_selection
+        new_paths = self._get_sdf_paths(selection_set)
         
-        if operation == SelectionSetOperation.REPLACE:
-            result = new_set
-        elif operation == SelectionSetOperation.UNION:
-            result = current_set | new_set
+        if operation == SelectionSetOperation.UNION:
+            current.update(new_paths)
         elif operation == SelectionSetOperation.INTERSECT:
-            result = current_set & new_set
+            current.intersection_update(new_paths)
         elif operation == SelectionSetOperation.SUBTRACT:
-            result = current_set - new_set
+            current.difference_update(new_paths)
         else:
-            result = new_set
+            current.clear()
+            current.update(new_paths)
         
-        self.current_selection = result
-        return list(result)
+        return [str(p) for p in current]
     
     def save_current_selection(self, name: str, description: str = "") -> str:
         """Save current selection as a selection set"""
-        return self.create_selection_set(name, list(self.current_selection), description)
+        return self.create_selection_set(name, [str(p) for p in self.current_selection], description)
     
-    def set_current_selection(self, prim_paths: List[str]):
-        """Set current selection"""
-        self.current_selection = set(prim_paths)
+    def set_current_selection(self, prim_paths: Iterable[Union[str, Sdf.Path]]):
+        """Set current selection (accepts path strings or Sdf.Path)"""
+        self.current_selection.clear()
+        self.current_selection.update(_to_path(p) for p in prim_paths)
     
     def get_current_selection(self) -> List[str]:
-        """Get current selection"""
-        return list(self.current_selection)
+        """Get current selection as path strings"""
+        return [str(p) for p in self.current_selection]
     
-    def save(self):
-        """Save selection sets to disk"""
-        try:
-            config_dir = Path(self.config_path).parent
-            config_dir.mkdir(parents=True, exist_ok=True)
-            
-            data = {
-                'selection_sets': [asdict(s) for s in self.selection_sets]
-            }
+    def save(self, force: bool = False):
+        """Schedule a save of selection sets to disk
+        
+        No-op unless there are unsaved changes (or force is set). The sets are
+        snapshotted on the calling thread; encoding and the write happen on a
+        background timer so bursts of edits coalesce into one write. Call
+        flush() to write synchronously.
+        """
+        if not self._dirty and not force:
+            return
+        
+        data = {
+            'selection_sets': [asdict(s) for s in self.selection_sets]
+        }
+        self._dirty = False
+        
+        with self._save_lock:
+            self._pending_data = data
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            # Daemon, so exit doesn't wait out the timer; the exit hook flushes instead
+            self._save_timer = threading.Timer(self.SAVE_DEBOUNCE_SECONDS, self._write_pending)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def flush(self, final: bool = False):
+        """Write any pending save immediately
+        
+        Runs at interpreter exit as well; final skips scheduling a retry.
+        """
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+        self._write_pending(self.SAVE_MAX_RETRIES if final else 0)
+    
+    def _write_pending(self, attempt: int = 0):
+        """Write the latest pending snapshot
+        
+        The file is written to a temporary sibling and swapped in with
+        os.replace, so a crash mid-write never leaves a truncated config behind.
+        A failed write is rescheduled (see _retry_write).
+        """
+        with self._write_lock:
+            with self._save_lock:
+                data = self._pending_data
+                self._pending_data = None
+            if data is None:
+                return
             
-            with open(self.config_path, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            print(f"Error saving selection sets: {e}")
+            tmp_path = self.config_path + ".tmp"
+            try:
+                config_dir = Path(self.config_path).parent
+                config_dir.mkdir(parents=True, exist_ok=True)
+                
+                with open(tmp_path, 'wb') as f:
+                    f.write(_dumps(data))
+                os.replace(tmp_path, self.config_path)
+            except Exception as e:
+                logger.warning("Error saving selection sets: %s", e)
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                self._retry_write(data, attempt)
+    
+    def _retry_write(self, data: Dict, attempt: int):
+        """Put a failed snapshot back and schedule another write of it"""
+        with self._save_lock:
+            if self._pending_data is not None:
+                # A newer snapshot is already queued and supersedes this one
+                return
+            if attempt >= self.SAVE_MAX_RETRIES:
+                # Keep the changes marked unsaved so the next save() retries
+                self._dirty = True
+                return
+            self._pending_data = data
+            self._save_timer = threading.Timer(
+                self.SAVE_RETRY_SECONDS, self._write_pending, args=(attempt + 1,)
+            )
+            self._save_timer.daemon = True
+            self._save_timer.start()
     
     def load(self):
         """Load selection sets from disk"""
+        # Don't read behind a write that is still waiting on the debounce timer
+        self.flush()
         try:
             if Path(self.config_path).exists():
-                with open(self.config_path, 'r') as f:
-                    data = json.load(f)
+                with open(self.config_path, 'rb') as f:
+                    data = _loads(f.read())
                 
                 self.selection_sets = [
                     SelectionSet(**s_data) for s_data in data.get('selection_sets', [])
                 ]
+            self._dirty = False
         except Exception as e:
-            print(f"Error loading selection sets: {e}")
+            logger.warning("Error loading selection sets: %s", e)
             self.selection_sets = []
+        self._rebuild_indices()
     
     def export_selection_set(self, name: str, filepath: str) -> bool:
         """Export a selection set to file"""
@@ -193,26 +395,26 @@ class SelectionSetManager:
             return False
         
         try:
-            with open(filepath, 'w') as f:
-                json.dump(asdict(selection_set), f, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(_dumps(asdict(selection_set)))
             return True
         except Exception as e:
-            print(f"Error exporting selection set: {e}")
+            logger.warning("Error exporting selection set: %s", e)
             return False
     
     def import_selection_set(self, filepath: str) -> bool:
         """Import a selection set from file"""
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = _loads(f.read())
             
             selection_set = SelectionSet(**data)
-            # Remove existing if same name
-            self.selection_sets = [s for s in self.selection_sets if s.name != selection_set.name]
-            self.selection_sets.append(selection_set)
+            # Replaces any existing set with the same name
+            self._add_selection_set(selection_set)
+            self._dirty = True
             self.save()
             return True
         except Exception as e:
-            print(f"Error importing selection set: {e}")
+            logger.warning("Error importing selection set: %s", e)
             return False
 
@@ -5,53 +5,84 @@ Based on OpenUSD 25.11 specifications
 """
 
 from typing import Optional, Dict, List
-from pxr import Usd, Sdf
 
 try:
-    from pxr import Usd, Sdf
+    from pxr import Usd, Sdf, Tf
     USD_AVAILABLE = True
 except ImportError:
     USD_AVAILABLE = False
+    Usd = Sdf = Tf = None
 
 
 class StageVariableManager:
     """Manages stage variables"""
     
-    def __init__(self, stage: Usd.Stage):
+    def __init__(self, stage: "Usd.Stage"):
         self.stage = stage
+        # Bumped on every variable write; the cached dict is tagged with it
+        self._write_gen = 0
+        self._cache: Optional[Dict[str, str]] = None
+        self._cache_key = None
+        # Traversed prims, dropped on any prim resync
+        self._prim_cache: Optional[List["Usd.Prim"]] = None
+        self._objects_changed_listener = None
+        if USD_AVAILABLE and stage:
+            self._objects_changed_listener = Tf.Notice.Register(
+                Usd.Notice.ObjectsChanged, self._on_objects_changed, stage
+            )
     
-    def get_stage_variables(self) -> Dict[str, str]:
-        """Get all stage variables"""
-        if not USD_AVAILABLE or not self.stage:
-            return {}
+    def _on_objects_changed(self, notice, sender):
+        """Invalidate cached variables when layer metadata is edited elsewhere"""
+        root = Sdf.Path.absoluteRootPath
+        resynced = notice.GetResyncedPaths()
+        if resynced:
+            self._prim_cache = None
+        if root in resynced or root in notice.GetChangedInfoOnlyPaths():
+            self._write_gen += 1
+    
+    def _get_prims(self) -> List["Usd.Prim"]:
+        """Get the stage's traversed prims, materialised once per resync"""
+        if self._prim_cache is None:
+            self._prim_cache = list(self.stage.Traverse())
+        return self._prim_cache
+    
+    def _get_cached_variables(self) -> Dict[str, str]:
+        """Get the stage variables dict, re-reading layer metadata only after writes"""
+        key = (self.stage.GetRootLayer().identifier, self._write_gen)
+        if self._cache is not None and self._cache_key == key:
+            return self._cache
         
         variables = {}
-        root_layer = self.stage.GetRootLayer()
-        
-        # Get stage variables from layer metadata
-        # Stage variables are typically stored in layer metadata
-        if hasattr(root_layer, 'customLayerData'):
-            custom_data = root_layer.customLayerData
-            if custom_data and isinstance(custom_data, dict):
-                # Look for stage variables
-                for key, value in custom_data.items():
-                    if key.startswith('stageVariables') or key == 'stageVariables':
-                        if isinstance(value, dict):
-                            variables.update(value)
         
-        # Also check for variables in stage metadata
+        # Stage variables are stored in layer metadata. The stage-level read
+        # composes the session layer over the root layer, so one read covers both.
         try:
             stage_metadata = self.stage.GetMetadata('customLayerData')
-            if stage_metadata and isinstance(stage_metadata, dict):
-                for key, value in stage_metadata.items():
-                    if key.startswith('stageVariables') or key == 'stageVariables':
-                        if isinstance(value, dict):
-                            variables.update(value)
-        except:
-            pass
+        except Exception:
+            stage_metadata = None
+        
+        # Most stages carry no custom layer data at all
+        if stage_metadata and isinstance(stage_metadata, dict):
+            main = stage_metadata.get('stageVariables')
+            if isinstance(main, dict):
+                variables.update(main)
+            # Rare extra 'stageVariables*' dicts are layered on top (keys arrive sorted)
+            for key_name, value in stage_metadata.items():
+                if (key_name != 'stageVariables' and key_name.startswith('stageVariables')
+                        and isinstance(value, dict)):
+                    variables.update(value)
         
+        self._cache = variables
+        self._cache_key = key
         return variables
     
+    def get_stage_variables(self) -> Dict[str, str]:
+        """Get all stage variables"""
+        if not USD_AVAILABLE or not self.stage:
+            return {}
+        
+        return dict(self._get_cached_variables())
+    
     def set_stage_variable(self, name: str, value: str) -> bool:
         """Set a stage variable"""
         if not USD_AVAILABLE or not self.stage:
@@ -60,24 +91,24 @@ class StageVariableManager:
         try:
             root_layer = self.stage.GetRootLayer()
             
-            # Get existing custom layer data
+            # Get existing custom layer data. The binding already returns a
+            # fresh dict converted from the layer, so it can be edited in place.
             custom_data = {}
             if hasattr(root_layer, 'customLayerData'):
                 existing = root_layer.customLayerData
                 if existing and isinstance(existing, dict):
-                    custom_data = existing.copy()
+                    custom_data = existing
             
             # Add/update stage variable
-            if 'stageVariables' not in custom_data:
-                custom_data['stageVariables'] = {}
-            
-            if not isinstance(custom_data['stageVariables'], dict):
-                custom_data['stageVariables'] = {}
+            variables = custom_data.get('stageVariables')
+            if not isinstance(variables, dict):
+                variables = custom_data['stageVariables'] = {}
+            variables[name] = value
             
-            custom_data['stageVariables'][name] = value
-            
-            # Set custom layer data
-            root_layer.customLayerData = custom_data
+            # Set custom layer data in one change
+            with Sdf.ChangeBlock():
+                root_layer.customLayerData = custom_data
+            self._write_gen += 1
             
             return True
         except Exception as e:
@@ -86,8 +117,10 @@ class StageVariableManager:
     
     def evaluate_variable(self, variable_name: str) -> Optional[str]:
         """Evaluate a stage variable"""
-        variables = self.get_stage_variables()
-        return variables.get(variable_name)
+        if not USD_AVAILABLE or not self.stage:
+            return None
+        
+        return self._get_cached_variables().get(variable_name)
     
     def find_variable_references(self, variable_name: str) -> List[str]:
         """Find all references to a stage variable in the stage"""
@@ -97,21 +130,29 @@ class StageVariableManager:
         references = []
         variable_ref = f"${variable_name}"
         
-        # Search in paths and asset paths
-        for prim in self.stage.Traverse():
-            # Check references
-            if prim.HasAuthoredReferences():
-                refs = prim.GetReferences()
-                for ref in refs.GetAddedOrExplicitItems():
-                    if variable_ref in str(ref.assetPath):
-                        references.append(prim.GetPath().pathString)
+        # Search in reference and payload asset paths
+        for prim in self._get_prims():
+            # Cheap authored-arc checks first; most prims have neither
+            has_references = prim.HasAuthoredReferences()
+            has_payloads = prim.HasAuthoredPayloads()
+            if not (has_references or has_payloads):
+                continue
+            
+            # Reference and payload items come from list-op metadata
+            # (Usd.References has no item accessor)
+            found = has_references and any(
+                variable_ref in ref.assetPath
+                for ref in prim.GetMetadata('references').GetAddedOrExplicitItems()
+            )
+            if not found and has_payloads:
+                found = any(
+                    variable_ref in payload.assetPath
+                    for payload in prim.GetMetadata('payload').GetAddedOrExplicitItems()
+                )
             
-            # Check payloads
-            if prim.HasAuthoredPayloads():
-                payloads = prim.GetPayloads()
-                for payload in payloads.GetAddedOrExplicitItems():
-                    if variable_ref in str(payload.assetPath):
-                        references.append(prim.GetPath().pathString)
+            # Only matching prims pay for building their path string
+            if found:
+                references.append(prim.GetPath().pathString)
         
         return references
 
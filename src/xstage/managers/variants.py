@@ -4,41 +4,105 @@ Handles variant sets and variant selection
 Based on OpenUSD 25.11 specifications
 """
 
-from typing import Optional, Dict, List
+import logging
+from dataclasses import dataclass
+from typing import Optional, Dict, List, Tuple
 from pxr import Usd
 
 try:
-    from pxr import Usd
+    from pxr import Usd, Sdf, Tf
     USD_AVAILABLE = True
 except ImportError:
     USD_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class VariantSetInfo:
+    """Selection and available variants of one variant set"""
+    __slots__ = ('current_selection', 'available_variants')
+    current_selection: str
+    available_variants: Tuple[str, ...]
+
 
 class VariantManager:
     """Manages USD variant sets"""
     
-    @staticmethod
-    def get_variant_sets(prim: Usd.Prim) -> Dict[str, Dict]:
-        """Get all variant sets on a prim"""
+    def __init__(self, stage: Optional[Usd.Stage] = None):
+        # Prim path -> variant set info for self.stage; pruned by ObjectsChanged notices
+        self._variant_cache: Dict[Sdf.Path, Dict[str, VariantSetInfo]] = {}
+        self._objects_changed_listener = None
+        self.stage = None
+        self.set_stage(stage)
+    
+    def set_stage(self, stage: Optional[Usd.Stage]):
+        """Set the stage, dropping cached variant info and the old stage's listener"""
+        if self._objects_changed_listener is not None:
+            self._objects_changed_listener.Revoke()
+            self._objects_changed_listener = None
+        self._variant_cache.clear()
+        self.stage = stage
+        if USD_AVAILABLE and stage:
+            self._objects_changed_listener = Tf.Notice.Register(
+                Usd.Notice.ObjectsChanged, self._on_objects_changed, stage
+            )
+    
+    def _on_objects_changed(self, notice, sender):
+        """Drop cached variant info for prims affected by a stage edit"""
+        if not self._variant_cache:
+            return
+        
+        changed = [path.GetPrimPath() for path in notice.GetResyncedPaths()]
+        changed_info = {path.GetPrimPath() for path in notice.GetChangedInfoOnlyPaths()}
+        stale = [
+            path for path in self._variant_cache
+            if path in changed_info or any(path.HasPrefix(c) for c in changed)
+        ]
+        for path in stale:
+            del self._variant_cache[path]
+    
+    def get_variant_sets(self, prim: Optional[Usd.Prim] = None) -> Dict[str, VariantSetInfo]:
+        """Get all variant sets on a prim (the stage's default prim if omitted)
+        
+        Results for prims on this manager's stage are cached until the prim is
+        edited; the returned dict is shared, so treat it as read-only.
+        """
         if not USD_AVAILABLE:
             return {}
-            
-        variant_sets = prim.GetVariantSets()
-        variant_set_names = variant_sets.GetNames()
         
+        if prim is None:
+            if not self.stage:
+                return {}
+            prim = self.stage.GetDefaultPrim()
+        if not prim:
+            return {}
+        
+        # Only prims on the watched stage can be invalidated, so only those are cached
+        cacheable = self.stage is not None and prim.GetStage() == self.stage
+        path = prim.GetPath()
+        if cacheable:
+            cached = self._variant_cache.get(path)
+            if cached is not None:
+                return cached
+        
+        variant_sets = prim.GetVariantSets()
         result = {}
-        for variant_set_name in variant_set_names:
+        for variant_set_name in variant_sets.GetNames():
             variant_set = variant_sets.GetVariantSet(variant_set_name)
-            current_selection = variant_set.GetVariantSelection()
-            available_variants = variant_set.GetVariantNames()
-            
-            result[variant_set_name] = {
-                'current_selection': current_selection,
-                'available_variants': available_variants,
-            }
+            result[variant_set_name] = VariantSetInfo(
+                variant_set.GetVariantSelection(),
+                tuple(variant_set.GetVariantNames()),
+            )
         
+        if cacheable:
+            self._variant_cache[path] = result
         return result
     
+    def clear_cache(self):
+        """Clear cached variant set info"""
+        self._variant_cache.clear()
+    
     @staticmethod
     def set_variant_selection(prim: Usd.Prim, variant_set_name: str, variant_name: str) -> bool:
         """Set the selected variant for a variant set"""
@@ -53,10 +117,10 @@ class VariantManager:
                 variant_set.SetVariantSelection(variant_name)
                 return True
             else:
-                print(f"Variant '{variant_name}' not found in variant set '{variant_set_name}'")
+                logger.warning("Variant '%s' not found in variant set '%s'", variant_name, variant_set_name)
                 return False
         except Exception as e:
-            print(f"Error setting variant selection: {e}")
+            logger.warning("Error setting variant selection: %s", e)
             return False
     
     @staticmethod
@@ -69,8 +133,8 @@ class VariantManager:
             variant_sets = prim.GetVariantSets()
             variant_set = variant_sets.GetVariantSet(variant_set_name)
             return variant_set.GetVariantSelection()
-        except Exception as e:
-            print(f"Error getting variant selection: {e}")
+        except Exception:
+            logger.debug("Error getting variant selection", exc_info=True)
             return None
     
     @staticmethod
@@ -84,7 +148,7 @@ class VariantManager:
             variant_set = variant_sets.AddVariantSet(variant_set_name)
             return variant_set is not None
         except Exception as e:
-            print(f"Error creating variant set: {e}")
+            logger.warning("Error creating variant set: %s", e)
             return False
     
     @staticmethod
@@ -99,6 +163,6 @@ class VariantManager:
             variant_set.AddVariant(variant_name)
             return True
         except Exception as e:
-            print(f"Error adding variant: {e}")
+            logger.warning("Error adding variant: %s", e)
             return False
 
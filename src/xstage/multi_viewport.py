@@ -7,7 +7,7 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QComboBox,
     QLabel, QPushButton, QGroupBox
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from typing import Optional, List
 
 from .viewer import USDStageManager
@@ -15,6 +15,30 @@ from .viewport import ViewportWidget
 from .hydra_viewport import HydraViewportWidget
 
 
+class SharedFrameCache:
+    """Geometry data extracted once per stage/time and shared by viewports"""
+    
+    def __init__(self):
+        self.stage_manager = None
+        self.time_code: Optional[float] = None
+        self.geometry_data: Optional[dict] = None
+    
+    def get(self, stage_manager, time_code: float) -> dict:
+        """Get geometry data for a time, extracting it on a miss"""
+        if (self.geometry_data is None or self.stage_manager is not stage_manager
+                or self.time_code != time_code):
+            self.geometry_data = stage_manager.get_geometry_data(time_code)
+            self.stage_manager = stage_manager
+            self.time_code = time_code
+        return self.geometry_data
+    
+    def clear(self):
+        """Drop the cached frame"""
+        self.stage_manager = None
+        self.time_code = None
+        self.geometry_data = None
+
+
 class MultiViewportWidget(QWidget):
     """Widget with multiple synchronized viewports"""
     
@@ -23,6 +47,9 @@ class MultiViewportWidget(QWidget):
         self.stage_manager = None
         self.viewports = []
         self.viewport_types = []  # 'perspective', 'top', 'front', 'side'
+        self._viewport_pool: List[ViewportWidget] = []  # Detached, reusable viewports
+        self._time_code: Optional[float] = None  # Last time passed to update_geometry
+        self._frame_cache = SharedFrameCache()
         self.init_ui()
     
     def init_ui(self):
@@ -61,15 +88,32 @@ class MultiViewportWidget(QWidget):
     def set_stage_manager(self, manager: USDStageManager):
         """Set the USD stage manager"""
         self.stage_manager = manager
+        self._frame_cache.clear()
         for viewport in self.viewports:
             viewport.set_stage_manager(manager)
     
+    def _acquire_viewport(self, view_type: str) -> ViewportWidget:
+        """Take a viewport from the pool (or create one) for the given view type"""
+        viewport = self._viewport_pool.pop() if self._viewport_pool else ViewportWidget()
+        self.viewports.append(viewport)
+        self.viewport_types.append(view_type)
+        return viewport
+    
+    def _finish_layout(self):
+        """Deferred setup for viewports placed by change_layout"""
+        for viewport in self.viewports:
+            if viewport.stage_manager is not self.stage_manager:
+                viewport.set_stage_manager(self.stage_manager)
+            if self.stage_manager and self._time_code is not None:
+                viewport.update_geometry(self._time_code, shared_cache=self._frame_cache)
+    
     def change_layout(self, layout_name: str):
         """Change viewport layout"""
-        # Clear existing viewports
+        # Return existing viewports to the pool instead of destroying their
+        # GL resources; they are re-parented into the new layout below
         for viewport in self.viewports:
             viewport.setParent(None)
-            viewport.deleteLater()
+            self._viewport_pool.append(viewport)
         
         self.viewports = []
         self.viewport_types = []
@@ -81,45 +125,15 @@ class MultiViewportWidget(QWidget):
                 item.widget().deleteLater()
         
         if layout_name == "Single Viewport":
-            viewport = ViewportWidget()
-            viewport.set_stage_manager(self.stage_manager)
-            self.viewports.append(viewport)
-            self.viewport_types.append('perspective')
+            viewport = self._acquire_viewport('perspective')
             self.viewport_layout.addWidget(viewport)
         
-        elif layout_name == "Two Views (Horizontal)":
-            splitter = QSplitter(Qt.Orientation.Horizontal)
-            
-            viewport1 = ViewportWidget()
-            viewport1.set_stage_manager(self.stage_manager)
-            self.viewports.append(viewport1)
-            self.viewport_types.append('perspective')
-            splitter.addWidget(viewport1)
-            
-            viewport2 = ViewportWidget()
-            viewport2.set_stage_manager(self.stage_manager)
-            self.viewports.append(viewport2)
-            self.viewport_types.append('top')
-            splitter.addWidget(viewport2)
-            
-            splitter.setStretchFactor(0, 1)
-            splitter.setStretchFactor(1, 1)
-            self.viewport_layout.addWidget(splitter)
-        
-        elif layout_name == "Two Views (Vertical)":
-            splitter = QSplitter(Qt.Orientation.Vertical)
-            
-            viewport1 = ViewportWidget()
-            viewport1.set_stage_manager(self.stage_manager)
-            self.viewports.append(viewport1)
-            self.viewport_types.append('perspective')
-            splitter.addWidget(viewport1)
-            
-            viewport2 = ViewportWidget()
-            viewport2.set_stage_manager(self.stage_manager)
-            self.viewports.append(viewport2)
-            self.viewport_types.append('top')
-            splitter.addWidget(viewport2)
+        elif layout_name in ("Two Views (Horizontal)", "Two Views (Vertical)"):
+            orientation = (Qt.Orientation.Horizontal if layout_name == "Two Views (Horizontal)"
+                           else Qt.Orientation.Vertical)
+            splitter = QSplitter(orientation)
+            splitter.addWidget(self._acquire_viewport('perspective'))
+            splitter.addWidget(self._acquire_viewport('top'))
             
             splitter.setStretchFactor(0, 1)
             splitter.setStretchFactor(1, 1)
@@ -128,33 +142,13 @@ class MultiViewportWidget(QWidget):
         elif layout_name == "Four Views":
             # Top splitter
             top_splitter = QSplitter(Qt.Orientation.Horizontal)
-            
-            viewport1 = ViewportWidget()
-            viewport1.set_stage_manager(self.stage_manager)
-            self.viewports.append(viewport1)
-            self.viewport_types.append('perspective')
-            top_splitter.addWidget(viewport1)
-            
-            viewport2 = ViewportWidget()
-            viewport2.set_stage_manager(self.stage_manager)
-            self.viewports.append(viewport2)
-            self.viewport_types.append('top')
-            top_splitter.addWidget(viewport2)
+            top_splitter.addWidget(self._acquire_viewport('perspective'))
+            top_splitter.addWidget(self._acquire_viewport('top'))
             
             # Bottom splitter
             bottom_splitter = QSplitter(Qt.Orientation.Horizontal)
-            
-            viewport3 = ViewportWidget()
-            viewport3.set_stage_manager(self.stage_manager)
-            self.viewports.append(viewport3)
-            self.viewport_types.append('front')
-            bottom_splitter.addWidget(viewport3)
-            
-            viewport4 = ViewportWidget()
-            viewport4.set_stage_manager(self.stage_manager)
-            self.viewports.append(viewport4)
-            self.viewport_types.append('side')
-            bottom_splitter.addWidget(viewport4)
+            bottom_splitter.addWidget(self._acquire_viewport('front'))
+            bottom_splitter.addWidget(self._acquire_viewport('side'))
             
             # Main splitter
             main_splitter = QSplitter(Qt.Orientation.Vertical)
@@ -164,11 +158,17 @@ class MultiViewportWidget(QWidget):
             main_splitter.setStretchFactor(1, 1)
             
             self.viewport_layout.addWidget(main_splitter)
+        
+        # Let the new layout paint before viewports pull scene data
+        QTimer.singleShot(0, self._finish_layout)
     
     def update_geometry(self, time_code: float):
         """Update all viewports"""
+        self._time_code = time_code
+        # Re-extract once per call (the stage may have changed), then share
+        self._frame_cache.clear()
         for viewport in self.viewports:
-            viewport.update_geometry(time_code)
+            viewport.update_geometry(time_code, shared_cache=self._frame_cache)
     
     def get_viewport(self, index: int = 0) -> Optional[ViewportWidget]:
         """Get a specific viewport"""
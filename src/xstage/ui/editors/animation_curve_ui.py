@@ -8,11 +8,30 @@ from PySide6.QtWidgets import (
     QLabel, QPushButton, QComboBox, QDoubleSpinBox, QGroupBox,
     QSplitter, QListWidget, QListWidgetItem
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPainter, QPen, QColor
+from PySide6.QtCore import Qt, Signal, QPoint, QTimer
+from PySide6.QtGui import QPainter, QPen, QColor, QPolygon, QPixmap
+from bisect import bisect_left
 from typing import Optional, List, Dict
+import numpy as np
 
-from ...managers.animation_curves import AnimationCurveManager
+try:
+    from pxr import Usd, Tf
+    USD_AVAILABLE = True
+except ImportError:
+    USD_AVAILABLE = False
+
+from ...managers.animation_curves import AnimationCurveManager, Keyframe
+
+
+def _plot_value(value) -> Optional[float]:
+    """Value to plot for a keyframe, or None if it can't be drawn"""
+    # Handle different value types
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, (list, tuple)) and len(value) > 0:
+        # Use first component for now
+        return value[0]
+    return None
 
 
 class CurveGraphWidget(QWidget):
@@ -24,18 +43,148 @@ class CurveGraphWidget(QWidget):
         self.time_range = (0.0, 100.0)
         self.value_range = (0.0, 1.0)
         self.selected_keyframe = None
+        # Plottable keyframes as parallel arrays, rebuilt only when the curve changes
+        self._times = np.empty(0)
+        self._values = np.empty(0)
+        # Times of all keyframes (plottable or not), for bisecting edits
+        self._keyframe_times: List[float] = []
+        # Background fill and grid depend only on the widget size
+        self._bg_pixmap: Optional[QPixmap] = None
+        # Keyframe screen positions from the last paint, for hit-testing clicks
+        self._screen_xs = np.empty(0, dtype=np.int32)
+        self._screen_ys = np.empty(0, dtype=np.int32)
         self.setMinimumHeight(200)
     
     def set_curve_data(self, curve_data: Dict):
         """Set curve data to display"""
         self.curve_data = curve_data
+        self._keyframe_times = []
+        times = []
+        values = []
         if curve_data:
             if 'time_range' in curve_data:
                 self.time_range = curve_data['time_range']
             if 'value_range' in curve_data:
                 self.value_range = curve_data['value_range']
+            
+            for time, value in curve_data.get('keyframes', ()):
+                self._keyframe_times.append(time)
+                value = _plot_value(value)
+                if value is not None:
+                    times.append(time)
+                    values.append(value)
+        
+        self._times = np.asarray(times, dtype=np.float64)
+        self._values = np.asarray(values, dtype=np.float64)
         self.update()
     
+    def set_keyframe_sample(self, time: float, value):
+        """Insert or replace one keyframe in the displayed curve without reloading it"""
+        if self.curve_data is None:
+            return
+        
+        keyframes = self.curve_data.setdefault('keyframes', [])
+        keyframe = Keyframe(time, value)
+        i = bisect_left(self._keyframe_times, time)
+        if i < len(self._keyframe_times) and self._keyframe_times[i] == time:
+            keyframes[i] = keyframe
+        else:
+            keyframes.insert(i, keyframe)
+            self._keyframe_times.insert(i, time)
+        
+        plot_value = _plot_value(value)
+        j = int(np.searchsorted(self._times, time))
+        if j < len(self._times) and self._times[j] == time:
+            if plot_value is None:
+                self._times = np.delete(self._times, j)
+                self._values = np.delete(self._values, j)
+            else:
+                self._values[j] = plot_value
+        elif plot_value is not None:
+            self._times = np.insert(self._times, j, time)
+            self._values = np.insert(self._values, j, plot_value)
+        
+        self._update_ranges()
+    
+    def remove_keyframe_sample(self, time: float):
+        """Remove one keyframe from the displayed curve without reloading it"""
+        if self.curve_data is None:
+            return
+        
+        i = bisect_left(self._keyframe_times, time)
+        if i < len(self._keyframe_times) and self._keyframe_times[i] == time:
+            del self.curve_data['keyframes'][i]
+            del self._keyframe_times[i]
+        
+        j = int(np.searchsorted(self._times, time))
+        if j < len(self._times) and self._times[j] == time:
+            self._times = np.delete(self._times, j)
+            self._values = np.delete(self._values, j)
+        
+        self._update_ranges()
+    
+    def _update_ranges(self):
+        """Refresh curve_data's summary fields after a keyframe edit and repaint"""
+        keyframes = self.curve_data['keyframes']
+        self.curve_data['num_keyframes'] = len(keyframes)
+        if keyframes:
+            self.time_range = (self._keyframe_times[0], self._keyframe_times[-1])
+            self.curve_data['time_range'] = self.time_range
+            # Same rule as AnimationCurveManager.get_curve_data: ranges for scalar curves
+            if isinstance(keyframes[0].value, (int, float)) and len(self._values):
+                self.value_range = (float(self._values.min()), float(self._values.max()))
+                self.curve_data['value_range'] = self.value_range
+        self.update()
+    
+    def hit_test(self, x: int, y: int, radius: int = 6) -> Optional[int]:
+        """Index of the painted keyframe nearest (x, y) within radius, or None"""
+        if not len(self._screen_xs):
+            return None
+        dx = self._screen_xs - x
+        dy = self._screen_ys - y
+        dist_sq = dx * dx + dy * dy
+        nearest = int(np.argmin(dist_sq))
+        if dist_sq[nearest] <= radius * radius:
+            return nearest
+        return None
+    
+    def mousePressEvent(self, event):
+        """Select the keyframe under the cursor"""
+        pos = event.position().toPoint()
+        selected = self.hit_test(pos.x(), pos.y())
+        if selected != self.selected_keyframe:
+            self.selected_keyframe = selected
+            self.update()
+        super().mousePressEvent(event)
+    
+    def resizeEvent(self, event):
+        """Drop the cached background; it is redrawn at the new size"""
+        self._bg_pixmap = None
+        super().resizeEvent(event)
+    
+    def _background_pixmap(self) -> QPixmap:
+        """Background fill plus grid, rendered once per widget size"""
+        ratio = self.devicePixelRatioF()
+        # Also catches size or screen changes that arrived while the widget was hidden
+        if (self._bg_pixmap is None or self._bg_pixmap.devicePixelRatio() != ratio
+                or self._bg_pixmap.size() != self.size() * ratio):
+            width = self.width()
+            height = self.height()
+            pixmap = QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            
+            painter = QPainter(pixmap)
+            painter.fillRect(0, 0, width, height, QColor(40, 40, 40))
+            painter.setPen(QPen(QColor(60, 60, 60), 1))
+            for i in range(5):
+                x = int((i / 4.0) * width)
+                painter.drawLine(x, 0, x, height)
+                y = int((i / 4.0) * height)
+                painter.drawLine(0, y, width, y)
+            painter.end()
+            self._bg_pixmap = pixmap
+        return self._bg_pixmap
+    
     def paintEvent(self, event):
         """Draw the curve graph"""
         painter = QPainter(self)
@@ -44,62 +193,49 @@ class CurveGraphWidget(QWidget):
         width = self.width()
         height = self.height()
         
-        # Draw background
-        painter.fillRect(0, 0, width, height, QColor(40, 40, 40))
-        
-        if not self.curve_data or 'keyframes' not in self.curve_data:
-            return
-        
         # Calculate scale
+        has_keyframes = bool(self.curve_data) and 'keyframes' in self.curve_data
         time_span = self.time_range[1] - self.time_range[0]
         value_span = self.value_range[1] - self.value_range[0]
         
-        if time_span == 0 or value_span == 0:
+        if not has_keyframes or time_span == 0 or value_span == 0:
+            self._screen_xs = self._screen_ys = np.empty(0, dtype=np.int32)
+            # Draw background only
+            painter.fillRect(0, 0, width, height, QColor(40, 40, 40))
             return
         
-        # Draw grid
-        painter.setPen(QPen(QColor(60, 60, 60), 1))
-        for i in range(5):
-            x = int((i / 4.0) * width)
-            painter.drawLine(x, 0, x, height)
-            y = int((i / 4.0) * height)
-            painter.drawLine(0, y, width, y)
+        # Draw background and grid
+        painter.drawPixmap(0, 0, self._background_pixmap())
         
         # Draw curve
         keyframes = self.curve_data['keyframes']
         if len(keyframes) < 2:
+            self._screen_xs = self._screen_ys = np.empty(0, dtype=np.int32)
             return
         
-        # Convert to screen coordinates
-        points = []
-        for kf in keyframes:
-            time = kf['time']
-            value = kf['value']
-            
-            # Handle different value types
-            if isinstance(value, (int, float)):
-                x = int(((time - self.time_range[0]) / time_span) * width)
-                y = int(height - ((value - self.value_range[0]) / value_span) * height)
-                points.append((x, y))
-            elif isinstance(value, (list, tuple)) and len(value) > 0:
-                # Use first component for now
-                x = int(((time - self.time_range[0]) / time_span) * width)
-                y = int(height - ((value[0] - self.value_range[0]) / value_span) * height)
-                points.append((x, y))
+        # Convert to screen coordinates in two vectorised passes
+        xs = ((self._times - self.time_range[0]) * (width / time_span)).astype(np.int32)
+        ys = (height - (self._values - self.value_range[0]) * (height / value_span)).astype(np.int32)
+        self._screen_xs = xs
+        self._screen_ys = ys
+        points = list(zip(xs.tolist(), ys.tolist()))
         
         # Draw curve line
         if len(points) > 1:
             painter.setPen(QPen(QColor(100, 150, 255), 2))
-            for i in range(len(points) - 1):
-                painter.drawLine(points[i][0], points[i][1], points[i+1][0], points[i+1][1])
+            painter.drawPolyline(QPolygon([QPoint(x, y) for x, y in points]))
         
-        # Draw keyframes
+        # Draw keyframes, setting each brush once rather than per dot
         painter.setPen(QPen(QColor(255, 255, 255), 1))
+        painter.setBrush(QColor(100, 150, 255))
+        selected = self.selected_keyframe
         for i, (x, y) in enumerate(points):
-            if i == self.selected_keyframe:
-                painter.setBrush(QColor(255, 200, 0))
-            else:
-                painter.setBrush(QColor(100, 150, 255))
+            if i != selected:
+                painter.drawEllipse(x - 4, y - 4, 8, 8)
+        
+        if selected is not None and 0 <= selected < len(points):
+            x, y = points[selected]
+            painter.setBrush(QColor(255, 200, 0))
             painter.drawEllipse(x - 4, y - 4, 8, 8)
 
 
@@ -111,6 +247,14 @@ class AnimationCurveEditorWidget(QWidget):
         self.stage = None
         self.current_prim = None
         self.current_attr = None
+        
+        # Animated-attribute scan, reused until the stage changes
+        self._animated_cache = None
+        self._animated_cache_key = None
+        self._change_serial = 0
+        self._objects_changed_listener = None
+        self._curve_reload_pending = False
+        
         self.init_ui()
     
     def init_ui(self):
@@ -197,35 +341,72 @@ class AnimationCurveEditorWidget(QWidget):
     def set_stage(self, stage):
         """Set the USD stage"""
         self.stage = stage
+        self.invalidate()
+        if self._objects_changed_listener is not None:
+            self._objects_changed_listener.Revoke()
+            self._objects_changed_listener = None
+        if stage and USD_AVAILABLE:
+            listener = Tf.Notice.Register(
+                Usd.Notice.ObjectsChanged, self._on_objects_changed, stage
+            )
+            self._objects_changed_listener = listener
+            # Stop callbacks into this widget once Qt has deleted it
+            self.destroyed.connect(lambda *_: listener.Revoke())
         self.refresh()
     
+    def _on_objects_changed(self, notice, sender):
+        """Any stage edit may add or remove time samples, so retire the cached scan"""
+        self._change_serial += 1
+    
+    def invalidate(self):
+        """Drop the cached animated-attribute scan"""
+        self._animated_cache = None
+        self._animated_cache_key = None
+    
     def refresh(self):
         """Refresh animated attributes"""
-        self.attr_tree.clear()
-        
-        if not self.stage:
-            return
-        
-        # Get all animated attributes
-        all_animated = AnimationCurveManager.get_all_animated_attributes(self.stage)
-        
-        for prim_data in all_animated:
-            prim_item = QTreeWidgetItem([prim_data['prim_path'], "", ""])
-            self.attr_tree.addTopLevelItem(prim_item)
+        self.attr_tree.setUpdatesEnabled(False)
+        self.attr_tree.blockSignals(True)
+        try:
+            self.attr_tree.clear()
+            
+            if not self.stage:
+                return
             
-            for attr_info in prim_data['attributes']:
-                attr_item = QTreeWidgetItem([
-                    "",
-                    attr_info['name'],
-                    str(len(attr_info['time_samples']))
-                ])
-                attr_item.setData(0, Qt.ItemDataRole.UserRole, {
-                    'prim_path': prim_data['prim_path'],
-                    'attr_name': attr_info['name'],
-                })
-                prim_item.addChild(attr_item)
-        
-        self.attr_tree.expandAll()
+            # Get all animated attributes, rescanning only if the stage changed
+            key = (id(self.stage), self._change_serial)
+            if self._animated_cache is None or self._animated_cache_key != key:
+                self._animated_cache = AnimationCurveManager.get_all_animated_attributes(self.stage)
+                self._animated_cache_key = key
+            all_animated = self._animated_cache
+            
+            # Build the whole tree detached, then insert it in one call
+            roots = []
+            for prim_data in all_animated:
+                prim_item = QTreeWidgetItem([prim_data['prim_path'], "", ""])
+                
+                attr_items = []
+                for attr_info in prim_data['attributes']:
+                    attr_item = QTreeWidgetItem([
+                        "",
+                        attr_info['name'],
+                        str(len(attr_info['time_samples']))
+                    ])
+                    attr_item.setData(0, Qt.ItemDataRole.UserRole, {
+                        'prim_path': prim_data['prim_path'],
+                        'attr_name': attr_info['name'],
+                    })
+                    attr_items.append(attr_item)
+                prim_item.addChildren(attr_items)
+                roots.append(prim_item)
+            
+            self.attr_tree.insertTopLevelItems(0, roots)
+            # Open the prim rows only; expandAll would also visit every attribute leaf
+            for prim_item in roots:
+                prim_item.setExpanded(True)
+        finally:
+            self.attr_tree.blockSignals(False)
+            self.attr_tree.setUpdatesEnabled(True)
     
     def on_attribute_selected(self):
         """Handle attribute selection"""
@@ -253,6 +434,22 @@ class AnimationCurveEditorWidget(QWidget):
         curve_data = AnimationCurveManager.get_curve_data(attr)
         self.curve_graph.set_curve_data(curve_data)
     
+    def _schedule_curve_reload(self):
+        """Reload the selected curve once the event loop is idle, coalescing repeated edits"""
+        if not self._curve_reload_pending:
+            self._curve_reload_pending = True
+            QTimer.singleShot(0, self._do_curve_reload)
+    
+    def _do_curve_reload(self):
+        """Run a scheduled curve reload"""
+        self._curve_reload_pending = False
+        self.on_attribute_selected()
+    
+    def _shows_current_curve(self) -> bool:
+        """Check if the graph holds loaded samples of the current attribute"""
+        curve_data = self.curve_graph.curve_data
+        return bool(curve_data) and curve_data.get('attribute_path') == self.current_attr.GetPath().pathString
+    
     def add_keyframe(self):
         """Add a keyframe"""
         if not self.current_attr:
@@ -261,8 +458,13 @@ class AnimationCurveEditorWidget(QWidget):
         time = self.time_spinbox.value()
         value = self.value_spinbox.value()
         
-        AnimationCurveManager.set_keyframe(self.current_attr, time, value)
-        self.on_attribute_selected()  # Refresh
+        if not AnimationCurveManager.set_keyframe(self.current_attr, time, value):
+            return
+        if self._shows_current_curve():
+            # Patch the one sample (as stored, after any type conversion) into the graph
+            self.curve_graph.set_keyframe_sample(time, self.current_attr.Get(time))
+        else:
+            self._schedule_curve_reload()
     
     def remove_keyframe(self):
         """Remove a keyframe"""
@@ -270,6 +472,10 @@ class AnimationCurveEditorWidget(QWidget):
             return
         
         time = self.time_spinbox.value()
-        AnimationCurveManager.remove_keyframe(self.current_attr, time)
-        self.on_attribute_selected()  # Refresh
-
+        if not AnimationCurveManager.remove_keyframe(self.current_attr, time):
+            return
+        if self._shows_current_curve() and len(self.curve_graph.curve_data['keyframes']) > 1:
+            self.curve_graph.remove_keyframe_sample(time)
+        else:
+            # Removing the last sample leaves no curve; reload to show that
+            self._schedule_curve_reload()
@@ -9,9 +9,11 @@ from PySide6.QtWidgets import (
     QDoubleSpinBox, QGroupBox, QFormLayout, QTextEdit, QComboBox,
     QCheckBox, QFileDialog, QMessageBox, QToolButton, QButtonGroup
 )
-from PySide6.QtCore import Qt, Signal, QPointF
-from PySide6.QtGui import QColor, QPen, QPainter, QPainterPath
-from typing import Optional, List, Tuple
+from PySide6.QtCore import Qt, Signal, QPoint, QPointF, QRect
+from PySide6.QtGui import QColor, QPen, QPainter, QPolygon, QPixmap
+from typing import Optional, Dict, List, Tuple
+import math
+import numpy as np
 
 from ...utils.annotations import AnnotationManager, Annotation, AnnotationType
 
@@ -24,7 +26,11 @@ class AnnotationCanvas(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.drawing = False
-        self.current_points = []
+        # Stroke points in a geometrically grown buffer; only the first _n rows are live
+        self._pts = np.empty((1024, 2), dtype=np.int32)
+        self._n = 0
+        # Background plus the stroke drawn so far; moves only add their new segment
+        self._stroke_cache: Optional[QPixmap] = None
         self.current_color = QColor(0, 255, 0)
         self.current_size = 2.0
         self.setMinimumSize(400, 300)
@@ -42,49 +48,79 @@ class AnnotationCanvas(QWidget):
         """Start drawing"""
         if event.button() == Qt.MouseButton.LeftButton:
             self.drawing = True
-            self.current_points = [event.position().toPoint()]
+            pos = event.position().toPoint()
+            self._pts[0] = (pos.x(), pos.y())
+            self._n = 1
+            self._stroke_cache = None
             self.update()
     
     def mouseMoveEvent(self, event):
         """Continue drawing"""
         if self.drawing:
-            self.current_points.append(event.position().toPoint())
-            self.update()
+            prev = QPoint(*self._pts[self._n - 1].tolist())
+            cur = event.position().toPoint()
+            if self._n == len(self._pts):
+                self._pts = np.concatenate((self._pts, np.empty_like(self._pts)))
+            self._pts[self._n] = (cur.x(), cur.y())
+            self._n += 1
+            
+            if self._stroke_cache is not None:
+                painter = QPainter(self._stroke_cache)
+                painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+                painter.setPen(QPen(self.current_color, self.current_size))
+                painter.drawLine(prev, cur)
+                painter.end()
+            
+            # Repaint just the new segment, padded for pen width and antialiasing
+            pad = math.ceil(self.current_size) + 1
+            self.update(QRect(prev, cur).normalized().adjusted(-pad, -pad, pad, pad))
     
     def mouseReleaseEvent(self, event):
         """Finish drawing"""
         if event.button() == Qt.MouseButton.LeftButton and self.drawing:
             self.drawing = False
-            if len(self.current_points) > 1:
+            if self._n > 1:
                 # Convert to list of tuples
-                points = [(p.x(), p.y()) for p in self.current_points]
+                points = list(map(tuple, self._pts[:self._n].tolist()))
                 self.annotation_drawn.emit(points)
-            self.current_points = []
+            self._n = 0
+            self._stroke_cache = None
             self.update()
     
+    def resizeEvent(self, event):
+        """Drop the cached stroke; it is redrawn at the new size"""
+        self._stroke_cache = None
+        super().resizeEvent(event)
+    
+    def _stroke_pixmap(self) -> QPixmap:
+        """Background and current stroke, rebuilt only when the cache was dropped"""
+        ratio = self.devicePixelRatioF()
+        # Also catches size or screen changes that arrived while the widget was hidden
+        if (self._stroke_cache is None or self._stroke_cache.devicePixelRatio() != ratio
+                or self._stroke_cache.size() != self.size() * ratio):
+            pixmap = QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.fillRect(0, 0, self.width(), self.height(), QColor(50, 50, 50))
+            if self._n:
+                painter.setPen(QPen(self.current_color, self.current_size))
+                painter.drawPolyline(QPolygon([QPoint(x, y) for x, y in self._pts[:self._n].tolist()]))
+            painter.end()
+            self._stroke_cache = pixmap
+        return self._stroke_cache
+    
     def paintEvent(self, event):
         """Paint the canvas"""
+        # Qt clips to the dirty region, so a stroke update only copies its segment box
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw background
-        painter.fillRect(self.rect(), QColor(50, 50, 50))
-        
-        # Draw current drawing
-        if self.current_points:
-            pen = QPen(self.current_color, self.current_size)
-            painter.setPen(pen)
-            
-            path = QPainterPath()
-            path.moveTo(self.current_points[0])
-            for point in self.current_points[1:]:
-                path.lineTo(point)
-            
-            painter.drawPath(path)
+        painter.drawPixmap(0, 0, self._stroke_pixmap())
     
     def clear(self):
         """Clear the canvas"""
-        self.current_points = []
+        self._n = 0
+        self._stroke_cache = None
         self.update()
 
 
@@ -93,11 +129,25 @@ class AnnotationsWidget(QWidget):
     
     annotation_added = Signal(str)  # Emits annotation ID
     
+    # Type selector buttons, in order; the button id indexes this table
+    TYPE_BUTTONS = (
+        (AnnotationType.TEXT, "Text"),
+        (AnnotationType.ARROW, "Arrow"),
+        (AnnotationType.DRAWING, "Draw"),
+        (AnnotationType.RECTANGLE, "Rect"),
+        (AnnotationType.CIRCLE, "Circle"),
+    )
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.annotation_manager = AnnotationManager()
         self.current_annotation_type = AnnotationType.TEXT
         self.current_color = QColor(255, 255, 0)
+        self._current_color_tuple = self._color_tuple(self.current_color)
+        # List rows by annotation id, so refreshes only touch rows that changed
+        self._row_by_id: Dict[str, QListWidgetItem] = {}
+        # Manager version the list was last synced to
+        self._listed_version: Optional[int] = None
         self.init_ui()
     
     def init_ui(self):
@@ -113,42 +163,14 @@ class AnnotationsWidget(QWidget):
         type_layout = QHBoxLayout()
         
         self.type_button_group = QButtonGroup()
-        
-        text_btn = QToolButton()
-        text_btn.setText("Text")
-        text_btn.setCheckable(True)
-        text_btn.setChecked(True)
-        text_btn.clicked.connect(lambda: self.set_annotation_type(AnnotationType.TEXT))
-        self.type_button_group.addButton(text_btn, 0)
-        type_layout.addWidget(text_btn)
-        
-        arrow_btn = QToolButton()
-        arrow_btn.setText("Arrow")
-        arrow_btn.setCheckable(True)
-        arrow_btn.clicked.connect(lambda: self.set_annotation_type(AnnotationType.ARROW))
-        self.type_button_group.addButton(arrow_btn, 1)
-        type_layout.addWidget(arrow_btn)
-        
-        draw_btn = QToolButton()
-        draw_btn.setText("Draw")
-        draw_btn.setCheckable(True)
-        draw_btn.clicked.connect(lambda: self.set_annotation_type(AnnotationType.DRAWING))
-        self.type_button_group.addButton(draw_btn, 2)
-        type_layout.addWidget(draw_btn)
-        
-        rect_btn = QToolButton()
-        rect_btn.setText("Rect")
-        rect_btn.setCheckable(True)
-        rect_btn.clicked.connect(lambda: self.set_annotation_type(AnnotationType.RECTANGLE))
-        self.type_button_group.addButton(rect_btn, 3)
-        type_layout.addWidget(rect_btn)
-        
-        circle_btn = QToolButton()
-        circle_btn.setText("Circle")
-        circle_btn.setCheckable(True)
-        circle_btn.clicked.connect(lambda: self.set_annotation_type(AnnotationType.CIRCLE))
-        self.type_button_group.addButton(circle_btn, 4)
-        type_layout.addWidget(circle_btn)
+        for button_id, (_, label) in enumerate(self.TYPE_BUTTONS):
+            button = QToolButton()
+            button.setText(label)
+            button.setCheckable(True)
+            self.type_button_group.addButton(button, button_id)
+            type_layout.addWidget(button)
+        self.type_button_group.button(0).setChecked(True)
+        self.type_button_group.idClicked.connect(self.on_type_button_clicked)
         
         type_group.setLayout(type_layout)
         layout.addWidget(type_group)
@@ -231,16 +253,26 @@ class AnnotationsWidget(QWidget):
         layout.addStretch()
         self.setLayout(layout)
     
+    def on_type_button_clicked(self, button_id: int):
+        """Handle a type selector button click"""
+        self.set_annotation_type(self.TYPE_BUTTONS[button_id][0])
+    
     def set_annotation_type(self, ann_type: AnnotationType):
         """Set current annotation type"""
         self.current_annotation_type = ann_type
         self.canvas.setVisible(ann_type == AnnotationType.DRAWING)
     
+    @staticmethod
+    def _color_tuple(color: QColor) -> Tuple[float, float, float, float]:
+        """RGBA floats stored on annotations"""
+        return (color.redF(), color.greenF(), color.blueF(), color.alphaF())
+    
     def choose_color(self):
         """Choose annotation color"""
         color = QColorDialog.getColor(self.current_color, self, "Choose Color")
         if color.isValid():
             self.current_color = color
+            self._current_color_tuple = self._color_tuple(color)
             self.canvas.set_drawing_color(color)
             self.update_color_button()
     
@@ -255,12 +287,7 @@ class AnnotationsWidget(QWidget):
         """Handle drawing completion"""
         if self.current_annotation_type == AnnotationType.DRAWING:
             viewport_pos = (0, 0)  # Would be actual viewport position
-            color = (
-                self.current_color.redF(),
-                self.current_color.greenF(),
-                self.current_color.blueF(),
-                self.current_color.alphaF()
-            )
+            color = self._current_color_tuple
             ann_id = self.annotation_manager.add_drawing_annotation(
                 points, viewport_pos, color, self.size_spin.value()
             )
@@ -274,12 +301,7 @@ class AnnotationsWidget(QWidget):
         if not text:
             return
         
-        color = (
-            self.current_color.redF(),
-            self.current_color.greenF(),
-            self.current_color.blueF(),
-            self.current_color.alphaF()
-        )
+        color = self._current_color_tuple
         
         ann_id = self.annotation_manager.add_text_annotation(
             text, position, prim_path, color
@@ -291,12 +313,7 @@ class AnnotationsWidget(QWidget):
     def add_arrow_annotation(self, start: Tuple[float, float, float], end: Tuple[float, float, float]):
         """Add an arrow annotation"""
         text = self.text_edit.toPlainText()
-        color = (
-            self.current_color.redF(),
-            self.current_color.greenF(),
-            self.current_color.blueF(),
-            self.current_color.alphaF()
-        )
+        color = self._current_color_tuple
         
         ann_id = self.annotation_manager.add_arrow_annotation(
             start, end, text, color, self.arrow_head_spin.value()
@@ -311,7 +328,8 @@ class AnnotationsWidget(QWidget):
         if selected:
             ann_id = selected.data(Qt.ItemDataRole.UserRole)
             if self.annotation_manager.remove_annotation(ann_id):
-                self.refresh_list()
+                self.annotations_list.takeItem(self.annotations_list.row(selected))
+                self._row_by_id.pop(ann_id, None)
     
     def clear_all(self):
         """Clear all annotations"""
@@ -320,17 +338,60 @@ class AnnotationsWidget(QWidget):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
-            self.annotation_manager.annotations.clear()
+            self.annotation_manager.clear_annotations()
             self.refresh_list()
     
+    @staticmethod
+    def _annotation_item_text(ann: Annotation) -> str:
+        """List label for an annotation"""
+        return f"{ann.type.value}: {ann.text[:30] if ann.text else 'No text'}"
+    
+    def _make_annotation_item(self, ann: Annotation) -> QListWidgetItem:
+        """Build the list row for an annotation"""
+        item = QListWidgetItem(self._annotation_item_text(ann))
+        item.setData(Qt.ItemDataRole.UserRole, ann.id)
+        return item
+    
     def refresh_list(self):
-        """Refresh annotations list"""
-        self.annotations_list.clear()
-        for ann in self.annotation_manager.get_visible_annotations():
-            item_text = f"{ann.type.value}: {ann.text[:30] if ann.text else 'No text'}"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, ann.id)
-            self.annotations_list.addItem(item)
+        """Refresh annotations list, adding and removing only the rows that changed"""
+        if self._listed_version == self.annotation_manager.version:
+            return
+        self._listed_version = self.annotation_manager.version
+        visible = self.annotation_manager.get_visible_annotations()
+        visible_ids = {ann.id for ann in visible}
+        
+        self.annotations_list.setUpdatesEnabled(False)
+        try:
+            for ann_id in [i for i in self._row_by_id if i not in visible_ids]:
+                item = self._row_by_id.pop(ann_id)
+                self.annotations_list.takeItem(self.annotations_list.row(item))
+            
+            # Surviving rows keep their order; new annotations go on the end. If that
+            # doesn't reproduce the manager's order (e.g. after an import), rebuild.
+            kept = [ann.id for ann in visible if ann.id in self._row_by_id]
+            rows = [self.annotations_list.item(i).data(Qt.ItemDataRole.UserRole)
+                    for i in range(self.annotations_list.count())]
+            appended_only = kept == rows and all(
+                ann.id not in self._row_by_id for ann in visible[len(kept):]
+            )
+            if not appended_only:
+                self.annotations_list.clear()
+                self._row_by_id.clear()
+            
+            for ann in visible:
+                item = self._row_by_id.get(ann.id)
+                if item is not None:
+                    item_text = self._annotation_item_text(ann)
+                    if item.text() != item_text:
+                        item.setText(item_text)
+            
+            new_items = [self._make_annotation_item(ann) for ann in visible
+                         if ann.id not in self._row_by_id]
+            for item in new_items:
+                self.annotations_list.addItem(item)
+                self._row_by_id[item.data(Qt.ItemDataRole.UserRole)] = item
+        finally:
+            self.annotations_list.setUpdatesEnabled(True)
     
     def export_annotations(self):
         """Export annotations to file"""
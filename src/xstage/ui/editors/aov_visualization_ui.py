@@ -11,7 +11,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal
 from typing import Optional
 
-from ...managers.aov_manager import AOVManager, AOVDisplayMode
+from ...managers.aov_manager import AOVManager, AOVInfo, AOVDisplayMode
 
 
 class AOVVisualizationWidget(QWidget):
@@ -22,6 +22,8 @@ class AOVVisualizationWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.aov_manager = AOVManager()
+        # Manager version the list was last built from
+        self._listed_version: Optional[int] = None
         self.init_ui()
     
     def init_ui(self):
@@ -125,17 +127,29 @@ class AOVVisualizationWidget(QWidget):
     def refresh_aovs(self):
         """Refresh AOV list"""
         self.aov_manager.extract_aovs()
-        self.aov_list.clear()
-        
-        for aov in self.aov_manager.get_aov_list():
-            item_text = f"{aov.name} ({aov.data_type})"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, aov.name)
-            item.setCheckState(Qt.CheckState.Checked if aov.enabled else Qt.CheckState.Unchecked)
-            self.aov_list.addItem(item)
+        if self._listed_version == self.aov_manager.version:
+            return
+        self._listed_version = self.aov_manager.version
+        
+        items = [self._make_aov_item(aov) for aov in self.aov_manager.get_aov_list()]
+        self.aov_list.setUpdatesEnabled(False)
+        try:
+            self.aov_list.clear()
+            for item in items:
+                self.aov_list.addItem(item)
+        finally:
+            self.aov_list.setUpdatesEnabled(True)
         
         self.update_statistics()
     
+    @staticmethod
+    def _make_aov_item(aov: AOVInfo) -> QListWidgetItem:
+        """Build the list row for an AOV"""
+        item = QListWidgetItem(f"{aov.name} ({aov.data_type})")
+        item.setData(Qt.ItemDataRole.UserRole, aov.name)
+        item.setCheckState(Qt.CheckState.Checked if aov.enabled else Qt.CheckState.Unchecked)
+        return item
+    
     def on_aov_selected(self):
         """Handle AOV selection"""
         selected = self.aov_list.currentItem()
@@ -146,21 +160,29 @@ class AOVVisualizationWidget(QWidget):
                 self.preview_widget.setText(f"Preview: {aov.name}\nType: {aov.data_type}\nSource: {aov.source_name}")
                 self.aov_selected.emit(aov_name)
     
+    def _set_selected_enabled(self, enabled: bool):
+        """Enable or disable all selected AOVs with one manager call"""
+        items = self.aov_list.selectedItems()
+        self.aov_manager.enable_aovs(
+            [item.data(Qt.ItemDataRole.UserRole) for item in items], enabled
+        )
+        
+        state = Qt.CheckState.Checked if enabled else Qt.CheckState.Unchecked
+        self.aov_list.blockSignals(True)
+        try:
+            for item in items:
+                item.setCheckState(state)
+        finally:
+            self.aov_list.blockSignals(False)
+        self.update_statistics()
+    
     def enable_selected(self):
         """Enable selected AOVs"""
-        for item in self.aov_list.selectedItems():
-            aov_name = item.data(Qt.ItemDataRole.UserRole)
-            self.aov_manager.enable_aov(aov_name, True)
-            item.setCheckState(Qt.CheckState.Checked)
-        self.update_statistics()
+        self._set_selected_enabled(True)
     
     def disable_selected(self):
         """Disable selected AOVs"""
-        for item in self.aov_list.selectedItems():
-            aov_name = item.data(Qt.ItemDataRole.UserRole)
-            self.aov_manager.enable_aov(aov_name, False)
-            item.setCheckState(Qt.CheckState.Unchecked)
-        self.update_statistics()
+        self._set_selected_enabled(False)
     
     def on_display_mode_changed(self, index):
         """Handle display mode change"""
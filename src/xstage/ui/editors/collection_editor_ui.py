@@ -9,7 +9,7 @@ from PySide6.QtWidgets import (
     QListWidget, QListWidgetItem, QCheckBox
 )
 from PySide6.QtCore import Qt, Signal
-from typing import Optional
+from typing import Dict, Optional
 
 from ...managers.collections import CollectionManager
 
@@ -98,21 +98,31 @@ class CollectionEditorWidget(QWidget):
         if not self.stage:
             return
         
-        # Find all collections
-        for prim in self.stage.Traverse():
-            collections = CollectionManager.get_collections(prim)
-            if collections:
-                for collection_data in collections:
-                    item = QTreeWidgetItem([
-                        collection_data['name'],
-                        collection_data['mode'],
-                        prim.GetPath().pathString
-                    ])
-                    item.setData(0, Qt.ItemDataRole.UserRole, {
-                        'prim_path': prim.GetPath().pathString,
-                        'collection_name': collection_data['name'],
-                    })
-                    self.collection_tree.addTopLevelItem(item)
+        # Gather every collection first, then insert the rows in one call
+        items = [
+            self._make_collection_item(collection_data)
+            for collection_data in CollectionManager.get_all_collections(self.stage)
+        ]
+        
+        self.collection_tree.setUpdatesEnabled(False)
+        try:
+            self.collection_tree.addTopLevelItems(items)
+        finally:
+            self.collection_tree.setUpdatesEnabled(True)
+    
+    @staticmethod
+    def _make_collection_item(collection_data: Dict) -> QTreeWidgetItem:
+        """Build the tree row for a collection"""
+        item = QTreeWidgetItem([
+            collection_data['name'],
+            collection_data['mode'],
+            collection_data['prim_path']
+        ])
+        item.setData(0, Qt.ItemDataRole.UserRole, {
+            'prim_path': collection_data['prim_path'],
+            'collection_name': collection_data['name'],
+        })
+        return item
     
     def on_collection_selected(self):
         """Handle collection selection"""
@@ -183,17 +183,25 @@ class MaterialEditorWidget(QWidget):
         
         # Display shader network
         shader_text = "Shader Network:\n"
-        if 'shader_network' in material_data and material_data['shader_network']:
-            for shader in material_data['shader_network']:
+        network = material_data.get('shader_network') or {}
+        nodes = network.get('nodes', [])
+        if nodes:
+            # Group edges by consuming shader
+            connections = {}
+            for src_index, src_output, dst_index, dst_input in network.get('edges', []):
+                connections.setdefault(dst_index, []).append((dst_input, src_index))
+            
+            for i, shader in enumerate(nodes):
                 shader_text += f"\nShader: {shader.get('name', 'N/A')}\n"
                 shader_text += f"  ID: {shader.get('id', 'N/A')}\n"
-                if 'inputs' in shader:
+                shader_inputs = shader.get('inputs', {})
+                shader_connections = connections.get(i, [])
+                if shader_inputs or shader_connections:
                     shader_text += "  Inputs:\n"
-                    for input_name, input_data in shader['inputs'].items():
-                        if input_data.get('connected'):
-                            shader_text += f"    {input_name}: Connected to {input_data.get('source', 'N/A')}\n"
-                        else:
-                            shader_text += f"    {input_name}: {input_data.get('value', 'N/A')}\n"
+                    for input_name, src_index in shader_connections:
+                        shader_text += f"    {input_name}: Connected to {nodes[src_index].get('name', 'N/A')}\n"
+                    for input_name, input_data in shader_inputs.items():
+                        shader_text += f"    {input_name}: {input_data.get('value', 'N/A')}\n"
         else:
             shader_text += "No shader network"
         
@@ -7,12 +7,74 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget, QTreeWidgetItem,
     QLabel, QPushButton, QGroupBox, QFormLayout, QCheckBox, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal
-from typing import Optional
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool, QTimer
+from typing import Optional, Dict, List, Set
+
+try:
+    from pxr import Usd, Sdf, Tf
+    USD_AVAILABLE = True
+except ImportError:
+    USD_AVAILABLE = False
 
 from ...managers.openexec_support import OpenExecManager
 
 
+def _truncated_str(value, limit: int = 50) -> str:
+    """Short display string for a value; large arrays are summarised, not formatted"""
+    if not isinstance(value, str) and hasattr(value, '__len__'):
+        try:
+            length = len(value)
+        except TypeError:
+            length = 0
+        if length > 8:
+            return f"{type(value).__name__}(len={length})"
+    
+    value_str = str(value)
+    if len(value_str) > limit:
+        value_str = value_str[:limit] + "..."
+    return value_str
+
+
+class ExtentComputeSignals(QObject):
+    """Signals for ExtentComputeTask (QRunnable is not a QObject)"""
+    
+    progress = Signal(int, str)  # progress, message
+    # Each carries the task's manager so the widget can drop results for a replaced stage
+    finished = Signal(object, object, object)  # manager, per-prim results dict, (prim, extent) pairs
+    failed = Signal(object, str)  # manager, error message
+
+
+class ExtentComputeTask(QRunnable):
+    """Compute extents on a pool thread; authoring is left to the GUI thread"""
+    
+    def __init__(self, openexec_manager: OpenExecManager, time_code: float = 0.0):
+        super().__init__()
+        self.openexec_manager = openexec_manager
+        self.time_code = time_code
+        self.signals = ExtentComputeSignals()
+        # The widget owns the task; don't let the pool delete it under Python
+        self.setAutoDelete(False)
+    
+    def run(self):
+        """Run the read-only extent computation"""
+        last_progress = [-1]
+        
+        def progress_callback(progress, message):
+            # One queued signal per percent, not per prim
+            if progress != last_progress[0]:
+                last_progress[0] = progress
+                self.signals.progress.emit(progress, message)
+        
+        try:
+            results, to_author = self.openexec_manager.collect_extents(
+                time_code=self.time_code,
+                progress_callback=progress_callback
+            )
+            self.signals.finished.emit(self.openexec_manager, results, to_author)
+        except Exception as e:
+            self.signals.failed.emit(self.openexec_manager, str(e))
+
+
 class OpenExecWidget(QWidget):
     """Widget for managing OpenExec computed attributes"""
     
@@ -22,6 +84,21 @@ class OpenExecWidget(QWidget):
         super().__init__(parent)
         self.stage = None
         self.openexec_manager = None
+        # Per-prim attribute name -> info, dropped on change notices
+        self._attr_cache: Dict[Sdf.Path, Dict[str, Dict]] = {}
+        # Tree items currently shown, by prim path; updated in place on edits
+        self._item_cache: Dict[Sdf.Path, QTreeWidgetItem] = {}
+        # Prims that can carry computed attributes; rebuilt after resyncs
+        self._candidate_prims: Optional[List] = None
+        self._objects_changed_listener = None
+        self._destroyed_connection = None
+        # Edits seen since the last tree update, applied on the next event loop pass
+        self._dirty_paths: Set[Sdf.Path] = set()
+        self._full_refresh_pending = False
+        self._update_scheduled = False
+        self._extent_task = None
+        self._extent_reporter = None
+        self._extent_progress_mgr = None
         self.init_ui()
     
     def init_ui(self):
@@ -70,9 +147,9 @@ class OpenExecWidget(QWidget):
         self.compute_all_extents_check.setChecked(False)
         extent_layout.addWidget(self.compute_all_extents_check)
         
-        compute_btn = QPushButton("Compute Extents")
-        compute_btn.clicked.connect(self.compute_extents)
-        extent_layout.addWidget(compute_btn)
+        self.compute_btn = QPushButton("Compute Extents")
+        self.compute_btn.clicked.connect(self.compute_extents)
+        extent_layout.addWidget(self.compute_btn)
         
         extent_group.setLayout(extent_layout)
         layout.addWidget(extent_group)
@@ -86,89 +163,277 @@ class OpenExecWidget(QWidget):
     
     def set_stage(self, stage):
         """Set the USD stage"""
+        self._cancel_extent_task()
         self.stage = stage
+        self._attr_cache.clear()
+        self._item_cache.clear()
+        self._candidate_prims = None
+        self._dirty_paths.clear()
+        self._full_refresh_pending = False
+        if self._objects_changed_listener is not None:
+            self._objects_changed_listener.Revoke()
+            self._objects_changed_listener = None
         if stage:
             self.openexec_manager = OpenExecManager(stage)
+            if USD_AVAILABLE:
+                listener = Tf.Notice.Register(
+                    Usd.Notice.ObjectsChanged, self._on_objects_changed, stage
+                )
+                self._objects_changed_listener = listener
+                # Stop callbacks into this widget once Qt has deleted it; only the
+                # current listener needs this, so replace the previous connection
+                if self._destroyed_connection is not None:
+                    QObject.disconnect(self._destroyed_connection)
+                self._destroyed_connection = self.destroyed.connect(lambda *_: listener.Revoke())
             self.refresh_computed_attributes()
         else:
             self.openexec_manager = None
             self.attrs_tree.clear()
     
+    def _on_objects_changed(self, notice, sender):
+        """Record prims touched by a stage edit and schedule a tree update"""
+        structural = []
+        for path in notice.GetResyncedPaths():
+            if path.IsPrimPath() or path.IsAbsoluteRootPath():
+                structural.append(path)
+            else:
+                # Property resyncs (e.g. a newly authored extent) keep the prim set intact
+                self._dirty_paths.add(path.GetPrimPath())
+        for path in notice.GetChangedInfoOnlyPaths():
+            self._dirty_paths.add(path.GetPrimPath())
+        
+        for prim_path in self._dirty_paths:
+            self._attr_cache.pop(prim_path, None)
+        
+        if structural:
+            # Prims were added, removed or retyped: rescan, reusing unaffected entries
+            self._candidate_prims = None
+            self._full_refresh_pending = True
+            stale = [
+                cached for cached in self._attr_cache
+                if any(cached.HasPrefix(path) for path in structural)
+            ]
+            for cached in stale:
+                del self._attr_cache[cached]
+        
+        if not self._update_scheduled and (self._dirty_paths or self._full_refresh_pending):
+            self._update_scheduled = True
+            QTimer.singleShot(0, self._apply_pending_updates)
+    
+    def _apply_pending_updates(self):
+        """Bring the tree up to date with edits recorded by _on_objects_changed"""
+        self._update_scheduled = False
+        dirty_paths, self._dirty_paths = self._dirty_paths, set()
+        
+        if self._full_refresh_pending:
+            self._full_refresh_pending = False
+            self.refresh_computed_attributes()
+            return
+        
+        if not self.stage or not self.openexec_manager or not dirty_paths:
+            return
+        
+        self.attrs_tree.setUpdatesEnabled(False)
+        try:
+            for prim_path in dirty_paths:
+                prim = self.stage.GetPrimAtPath(prim_path)
+                info_map = self._get_computed_attributes(prim) if prim else {}
+                self._sync_prim_item(prim_path, info_map)
+        finally:
+            self.attrs_tree.setUpdatesEnabled(True)
+        self.status_label.setText(f"Found {self.attrs_tree.topLevelItemCount()} prims with computed attributes")
+    
+    def _sync_prim_item(self, prim_path, info_map: Dict[str, Dict]):
+        """Update, add or remove the tree row of a single prim"""
+        prim_item = self._item_cache.get(prim_path)
+        if not info_map:
+            if prim_item is not None:
+                del self._item_cache[prim_path]
+                index = self.attrs_tree.indexOfTopLevelItem(prim_item)
+                if index >= 0:
+                    self.attrs_tree.takeTopLevelItem(index)
+            return
+        
+        if prim_item is None:
+            prim_item = QTreeWidgetItem([prim_path.pathString, "", "", ""])
+            self._item_cache[prim_path] = prim_item
+            self.attrs_tree.addTopLevelItem(prim_item)
+        else:
+            prim_item.takeChildren()
+        prim_item.addChildren(self._build_attr_items(info_map))
+        prim_item.setExpanded(True)
+    
+    def _get_computed_attributes(self, prim) -> Dict[str, Dict]:
+        """Get computed attribute infos for a prim, using the cache"""
+        prim_path = prim.GetPath()
+        info_map = self._attr_cache.get(prim_path)
+        if info_map is None:
+            info_map = self.openexec_manager.get_computed_attribute_info_map(prim)
+            self._attr_cache[prim_path] = info_map
+        return info_map
+    
+    def _build_attr_items(self, info_map: Dict[str, Dict]) -> List[QTreeWidgetItem]:
+        """Build the attribute rows shown under a prim"""
+        attr_items = []
+        for attr_name, info in info_map.items():
+            status = "Computed" if info.get('is_computed') else "Can Compute"
+            value_str = _truncated_str(info.get('computed_value', 'N/A'))
+            
+            attr_items.append(QTreeWidgetItem([
+                "",
+                attr_name,
+                status,
+                value_str
+            ]))
+        return attr_items
+    
+    def _detach_items(self):
+        """Take all top-level items out of the tree without deleting them"""
+        for index in range(self.attrs_tree.topLevelItemCount() - 1, -1, -1):
+            self.attrs_tree.takeTopLevelItem(index)
+    
+    def _get_candidate_prims(self) -> List:
+        """Prims that may have computed attributes"""
+        if self._candidate_prims is None:
+            if self.openexec_manager.openexec_available:
+                # OpenExec computations can live on any prim
+                self._candidate_prims = list(self.stage.Traverse())
+            else:
+                # Without OpenExec only boundable extents are computed
+                self._candidate_prims = self.openexec_manager.find_boundable_prims()
+        return self._candidate_prims
+    
     def refresh_computed_attributes(self):
         """Refresh list of computed attributes"""
-        self.attrs_tree.clear()
-        
         if not self.stage or not self.openexec_manager:
+            self.attrs_tree.clear()
             return
         
         try:
-            # Find all prims with computed attributes
-            for prim in self.stage.Traverse():
-                computed_attrs = self.openexec_manager.get_all_computed_attributes(prim)
+            # Find all prims with computed attributes, reusing items for
+            # prims whose cached attribute info is still valid
+            self._dirty_paths.clear()
+            prim_items = []
+            item_cache = {}
+            for prim in self._get_candidate_prims():
+                prim_path = prim.GetPath()
+                fresh = prim_path not in self._attr_cache
+                info_map = self._get_computed_attributes(prim)
                 
-                if computed_attrs:
-                    prim_item = QTreeWidgetItem([prim.GetPath().pathString, "", "", ""])
-                    
-                    for attr_name in computed_attrs:
-                        info = self.openexec_manager.get_computed_attribute_info(prim, attr_name)
-                        
-                        status = "Computed" if info.get('is_computed') else "Can Compute"
-                        value_str = str(info.get('computed_value', 'N/A'))
-                        if len(value_str) > 50:
-                            value_str = value_str[:50] + "..."
-                        
-                        attr_item = QTreeWidgetItem([
-                            "",
-                            attr_name,
-                            status,
-                            value_str
-                        ])
-                        prim_item.addChild(attr_item)
-                    
-                    self.attrs_tree.addTopLevelItem(prim_item)
+                if info_map:
+                    prim_item = self._item_cache.get(prim_path)
+                    if prim_item is None:
+                        prim_item = QTreeWidgetItem([prim_path.pathString, "", "", ""])
+                        prim_item.addChildren(self._build_attr_items(info_map))
+                    elif fresh:
+                        prim_item.takeChildren()
+                        prim_item.addChildren(self._build_attr_items(info_map))
+                    item_cache[prim_path] = prim_item
+                    prim_items.append(prim_item)
             
-            self.attrs_tree.expandAll()
+            # Swap the tree contents in one go to avoid a relayout per prim
+            self.attrs_tree.setUpdatesEnabled(False)
+            self.attrs_tree.blockSignals(True)
+            try:
+                self._detach_items()
+                self._item_cache = item_cache
+                self.attrs_tree.addTopLevelItems(prim_items)
+                self.attrs_tree.expandAll()
+            finally:
+                self.attrs_tree.blockSignals(False)
+                self.attrs_tree.setUpdatesEnabled(True)
             self.status_label.setText(f"Found {self.attrs_tree.topLevelItemCount()} prims with computed attributes")
         except Exception as e:
             self.status_label.setText(f"Error: {e}")
     
     def compute_extents(self):
         """Compute extents for prims"""
-        if not self.stage or not self.openexec_manager:
+        if not self.stage or not self.openexec_manager or self._extent_task:
             return
         
         try:
             from ...utils.progress_manager import ProgressDialogManager
             
             progress_mgr = ProgressDialogManager(self)
-            reporter = progress_mgr.show_progress("Computing Extents...", cancelable=False)
-            
-            def progress_callback(progress, message):
-                reporter.report(progress, message)
-            
-            results = self.openexec_manager.compute_all_extents(
-                time_code=0.0,
-                progress_callback=progress_callback
-            )
-            
-            reporter.finish(True, "Extent computation complete")
+            self._extent_reporter = progress_mgr.show_progress("Computing Extents...", cancelable=False)
+            self._extent_progress_mgr = progress_mgr  # owns the dialog; keep it alive
             
-            # Count successes
-            success_count = sum(1 for v in results.values() if v)
-            total_count = len(results)
-            
-            self.status_label.setText(
-                f"Computed extents: {success_count}/{total_count} prims"
-            )
-            
-            # Refresh computed attributes
-            self.refresh_computed_attributes()
-            
-            QMessageBox.information(
-                self, "Extent Computation",
-                f"Computed extents for {success_count} out of {total_count} prims"
-            )
+            task = ExtentComputeTask(self.openexec_manager, time_code=0.0)
+            task.signals.progress.connect(self._extent_reporter.report)
+            task.signals.finished.connect(self._on_extents_done)
+            task.signals.failed.connect(self._on_extents_failed)
+            self._extent_task = task
+            self.compute_btn.setEnabled(False)
+            self.status_label.setText("Computing extents...")
+            QThreadPool.globalInstance().start(task)
         except Exception as e:
+            self._extent_task = None
             QMessageBox.critical(self, "Error", f"Failed to compute extents: {e}")
             self.status_label.setText(f"Error: {e}")
-
+    
+    def _cancel_extent_task(self):
+        """Abandon an in-flight extent task; its results belong to the old stage"""
+        if self._extent_task is None:
+            return
+        # Not started yet: take it back from the pool. Otherwise it runs to the end
+        # and _on_extents_done drops the results, since the manager no longer matches.
+        QThreadPool.globalInstance().tryTake(self._extent_task)
+        self._finish_extent_task(False, "Cancelled: stage changed")
+    
+    def _is_current_extent_task(self, manager) -> bool:
+        """Whether a finished task's results are still for the current stage"""
+        return self._extent_task is not None and manager is self.openexec_manager
+    
+    def _finish_extent_task(self, success: bool, message: str):
+        """Tear down the running extent task and its progress dialog"""
+        if self._extent_reporter:
+            self._extent_reporter.finish(success, message)
+        self._extent_task = None
+        self._extent_reporter = None
+        self._extent_progress_mgr = None
+        self.compute_btn.setEnabled(True)
+    
+    def _on_extents_done(self, manager, results: dict, to_author: list):
+        """Author computed extents on the GUI thread"""
+        if not self._is_current_extent_task(manager):
+            return
+        # The GUI may have edited the stage while the task ran; re-authoring a
+        # deleted prim would bring it back as an over, so skip those
+        valid = []
+        for prim, extent in to_author:
+            if prim.IsValid():
+                valid.append((prim, extent))
+            else:
+                results.pop(prim.GetPath().pathString, None)
+        try:
+            manager.author_extents(valid, 0.0)
+        except Exception as e:
+            self._finish_extent_task(False, str(e))
+            QMessageBox.critical(self, "Error", f"Failed to compute extents: {e}")
+            self.status_label.setText(f"Error: {e}")
+            return
+        
+        self._finish_extent_task(True, "Extent computation complete")
+        
+        # Count successes
+        success_count = sum(1 for v in results.values() if v)
+        total_count = len(results)
+        
+        self.status_label.setText(
+            f"Computed extents: {success_count}/{total_count} prims"
+        )
+        
+        # The tree picks up the new extents through the ObjectsChanged listener
+        
+        QMessageBox.information(
+            self, "Extent Computation",
+            f"Computed extents for {success_count} out of {total_count} prims"
+        )
+    
+    def _on_extents_failed(self, manager, message: str):
+        """Report a failed extent computation"""
+        if not self._is_current_extent_task(manager):
+            return
+        self._finish_extent_task(False, message)
+        QMessageBox.critical(self, "Error", f"Failed to compute extents: {message}")
+        self.status_label.setText(f"Error: {message}")
@@ -8,13 +8,30 @@ from PySide6.QtWidgets import (
     QGroupBox, QFormLayout, QDoubleSpinBox, QLineEdit, QTreeWidget,
     QTreeWidgetItem, QTextEdit
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from typing import Optional, List
-from pxr import Gf, UsdGeom
+import numpy as np
+from pxr import Gf, Sdf, UsdGeom
 
 from ...managers.prim_selection import PrimSelectionManager
 
 
+def _value_text(value, limit: int = 200) -> str:
+    """Display string for an attribute value; large arrays are summarised, not formatted"""
+    if not isinstance(value, str) and hasattr(value, '__len__'):
+        try:
+            length = len(value)
+        except TypeError:
+            length = 0
+        if length > 64:
+            return f"{type(value).__name__}(len={length})"
+    
+    value_str = str(value)
+    if len(value_str) > limit:
+        value_str = value_str[:limit] + "..."
+    return value_str
+
+
 class PrimPropertiesWidget(QWidget):
     """Widget for displaying and editing prim properties"""
     
@@ -24,6 +41,13 @@ class PrimPropertiesWidget(QWidget):
         super().__init__(parent)
         self.selection_manager = None
         self.current_prim = None
+        
+        # Coalesce spin box edits into one transform update
+        self._xform_timer = QTimer(self)
+        self._xform_timer.setSingleShot(True)
+        self._xform_timer.setInterval(30)
+        self._xform_timer.timeout.connect(self._apply_transform)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -102,6 +126,12 @@ class PrimPropertiesWidget(QWidget):
         self.scale_z_spin.valueChanged.connect(self.on_transform_changed)
         transform_layout.addRow("Scale Z:", self.scale_z_spin)
         
+        self._transform_spins = (
+            self.translate_x_spin, self.translate_y_spin, self.translate_z_spin,
+            self.rotate_x_spin, self.rotate_y_spin, self.rotate_z_spin,
+            self.scale_x_spin, self.scale_y_spin, self.scale_z_spin,
+        )
+        
         transform_group.setLayout(transform_layout)
         layout.addWidget(transform_group)
         
@@ -126,6 +156,11 @@ class PrimPropertiesWidget(QWidget):
     
     def update_selection(self, prim_path: Optional[str]):
         """Update display for selected prim"""
+        # Author any pending edit onto the previously selected prim first
+        if self._xform_timer.isActive():
+            self._xform_timer.stop()
+            self._apply_transform()
+        
         if not prim_path or not self.selection_manager:
             self.prim_name_label.setText("No prim selected")
             return
@@ -140,26 +175,26 @@ class PrimPropertiesWidget(QWidget):
         # Get transform
         transform = self.selection_manager.get_prim_transform(prim)
         if transform:
-            # Extract translation
-            translation = transform.ExtractTranslation()
-            self.translate_x_spin.setValue(translation[0])
-            self.translate_y_spin.setValue(translation[1])
-            self.translate_z_spin.setValue(translation[2])
+            # Row-vector convention: translation is the last row, axis scales are row lengths
+            matrix = np.asarray(transform, dtype=np.float64).reshape(4, 4)
+            translation = matrix[3, :3]
+            scale = np.linalg.norm(matrix[:3, :3], axis=1)
+            # Rotation extraction is not supported yet, so show 0,0,0 and let user edit
+            values = (*translation, 0.0, 0.0, 0.0, *scale)
             
-            # Extract rotation (simplified - full rotation extraction is complex)
-            # For now, just show 0,0,0 and let user edit
-            self.rotate_x_spin.setValue(0.0)
-            self.rotate_y_spin.setValue(0.0)
-            self.rotate_z_spin.setValue(0.0)
-            
-            # Extract scale
-            scale = transform.ExtractScale()
-            self.scale_x_spin.setValue(scale[0])
-            self.scale_y_spin.setValue(scale[1])
-            self.scale_z_spin.setValue(scale[2])
+            # Populating the spin boxes must not author the transform back onto the prim
+            for spin in self._transform_spins:
+                spin.blockSignals(True)
+            try:
+                for spin, value in zip(self._transform_spins, values):
+                    spin.setValue(float(value))
+            finally:
+                for spin in self._transform_spins:
+                    spin.blockSignals(False)
         
         # Display attributes (including computed)
-        attrs_text = "Attributes:\n"
+        parts = ["Attributes:", ""]
+        append = parts.append
         
         # Check for OpenExec support
         try:
@@ -179,14 +214,13 @@ class PrimPropertiesWidget(QWidget):
                             # Get computed value
                             computed_value = openexec_mgr.get_computed_value(prim, attr_name)
                             if computed_value is not None:
-                                attrs_text += f"\n{attr_name}: {computed_value} ({attr.GetTypeName()}) [COMPUTED]"
+                                append(f"{attr_name}: {_value_text(computed_value)} ({attr.GetTypeName()}) [COMPUTED]")
                             else:
-                                attrs_text += f"\n{attr_name}: (computed, not evaluated) ({attr.GetTypeName()}) [COMPUTED]"
+                                append(f"{attr_name}: (computed, not evaluated) ({attr.GetTypeName()}) [COMPUTED]")
                         else:
                             # Regular authored attribute
                             if attr.HasAuthoredValue():
-                                value = attr.Get()
-                                attrs_text += f"\n{attr_name}: {value} ({attr.GetTypeName()})"
+                                append(f"{attr_name}: {_value_text(attr.Get())} ({attr.GetTypeName()})")
                     except:
                         pass
                 
@@ -196,43 +230,49 @@ class PrimPropertiesWidget(QWidget):
                     if extent_attr and not extent_attr.HasAuthoredValue():
                         computed_extent = openexec_mgr.compute_extent(prim)
                         if computed_extent:
-                            attrs_text += f"\nextent: {computed_extent} (double2[]) [COMPUTED]"
+                            append(f"extent: {computed_extent} (double2[]) [COMPUTED]")
         except ImportError:
             # Fallback to regular attribute display
             for attr in prim.GetAttributes():
                 try:
                     if attr.HasAuthoredValue():
-                        value = attr.Get()
-                        attrs_text += f"\n{attr.GetName()}: {value} ({attr.GetTypeName()})"
+                        append(f"{attr.GetName()}: {_value_text(attr.Get())} ({attr.GetTypeName()})")
                 except:
                     pass
         
-        self.attributes_text.setText(attrs_text)
+        self.attributes_text.setPlainText("\n".join(parts))
     
     def on_transform_changed(self):
         """Handle transform change"""
         if not self.current_prim or not self.selection_manager:
             return
         
-        # Apply transform changes
-        translation = Gf.Vec3d(
-            self.translate_x_spin.value(),
-            self.translate_y_spin.value(),
-            self.translate_z_spin.value()
-        )
-        self.selection_manager.translate_prim(self.current_prim, translation)
+        self._xform_timer.start()
+    
+    def _apply_transform(self):
+        """Author the spin box values onto the current prim as one change"""
+        if not self.current_prim or not self.selection_manager:
+            return
         
-        rotation = Gf.Vec3f(
-            self.rotate_x_spin.value(),
-            self.rotate_y_spin.value(),
-            self.rotate_z_spin.value()
-        )
-        self.selection_manager.rotate_prim(self.current_prim, rotation)
+        # One change block so composition and listeners run once for all three ops
+        with Sdf.ChangeBlock():
+            translation = Gf.Vec3d(
+                self.translate_x_spin.value(),
+                self.translate_y_spin.value(),
+                self.translate_z_spin.value()
+            )
+            self.selection_manager.translate_prim(self.current_prim, translation)
         
-        scale = Gf.Vec3f(
-            self.scale_x_spin.value(),
-            self.scale_y_spin.value(),
-            self.scale_z_spin.value()
-        )
-        self.selection_manager.scale_prim(self.current_prim, scale)
-
+            rotation = Gf.Vec3f(
+                self.rotate_x_spin.value(),
+                self.rotate_y_spin.value(),
+                self.rotate_z_spin.value()
+            )
+            self.selection_manager.rotate_prim(self.current_prim, rotation)
+        
+            scale = Gf.Vec3f(
+                self.scale_x_spin.value(),
+                self.scale_y_spin.value(),
+                self.scale_z_spin.value()
+            )
+            self.selection_manager.scale_prim(self.current_prim, scale)
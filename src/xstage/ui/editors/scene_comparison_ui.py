@@ -142,7 +142,7 @@ class SceneComparisonWidget(QWidget):
         if self.diff.added_prims:
             added_item = QTreeWidgetItem(["Added Prims", str(len(self.diff.added_prims)), ""])
             for prim_path in self.diff.added_prims:
-                child = QTreeWidgetItem([prim_path, "Added Prim", ""])
+                child = QTreeWidgetItem([prim_path.pathString, "Added Prim", ""])
                 added_item.addChild(child)
             self.diff_tree.addTopLevelItem(added_item)
         
@@ -150,7 +150,7 @@ class SceneComparisonWidget(QWidget):
         if self.diff.removed_prims:
             removed_item = QTreeWidgetItem(["Removed Prims", str(len(self.diff.removed_prims)), ""])
             for prim_path in self.diff.removed_prims:
-                child = QTreeWidgetItem([prim_path, "Removed Prim", ""])
+                child = QTreeWidgetItem([prim_path.pathString, "Removed Prim", ""])
                 removed_item.addChild(child)
             self.diff_tree.addTopLevelItem(removed_item)
         
@@ -158,7 +158,7 @@ class SceneComparisonWidget(QWidget):
         if self.diff.modified_prims:
             modified_item = QTreeWidgetItem(["Modified Prims", str(len(self.diff.modified_prims)), ""])
             for prim_path in self.diff.modified_prims:
-                child = QTreeWidgetItem([prim_path, "Modified Prim", ""])
+                child = QTreeWidgetItem([prim_path.pathString, "Modified Prim", ""])
                 modified_item.addChild(child)
             self.diff_tree.addTopLevelItem(modified_item)
         
@@ -166,7 +166,7 @@ class SceneComparisonWidget(QWidget):
         if self.diff.modified_attributes:
             attrs_item = QTreeWidgetItem(["Modified Attributes", "", ""])
             for prim_path, attrs in self.diff.modified_attributes.items():
-                prim_item = QTreeWidgetItem([prim_path, "Prim", ""])
+                prim_item = QTreeWidgetItem([prim_path.pathString, "Prim", ""])
                 for attr_name in attrs:
                     old_val, new_val = self.diff.different_values.get(prim_path, {}).get(attr_name, (None, None))
                     details = f"Old: {old_val}, New: {new_val}"
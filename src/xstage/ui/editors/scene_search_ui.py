@@ -5,15 +5,69 @@ Search and filter interface for USD scene graph
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
-    QTreeWidget, QTreeWidgetItem, QLabel, QComboBox, QGroupBox,
+    QTreeView, QLabel, QComboBox, QGroupBox,
     QCheckBox, QListWidget, QListWidgetItem
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer, QAbstractTableModel, QModelIndex
 from typing import Optional, List
 
 from ...managers.scene_search import SceneSearchManager
 
 
+class PrimResultsModel(QAbstractTableModel):
+    """Flat model over a list of prims; cell text is read from the prim only when shown"""
+    
+    HEADERS = ("Prim", "Type", "Path")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._prims = []
+    
+    def set_prims(self, prims):
+        """Replace the listed prims"""
+        self.beginResetModel()
+        self._prims = list(prims)
+        self.endResetModel()
+    
+    def clear(self):
+        """Remove all prims"""
+        self.set_prims([])
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Number of prims (the model is flat)"""
+        return 0 if parent.isValid() else len(self._prims)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Name, type and path columns"""
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Cell text, or the prim path for UserRole"""
+        if not index.isValid():
+            return None
+        prim = self._prims[index.row()]
+        if not prim:
+            # Removed from the stage since the search ran
+            return None
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            column = index.column()
+            if column == 0:
+                return prim.GetName()
+            if column == 1:
+                return prim.GetTypeName()
+            return prim.GetPath().pathString
+        if role == Qt.ItemDataRole.UserRole:
+            return prim.GetPath().pathString
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Column titles"""
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+
 class SceneSearchWidget(QWidget):
     """Widget for searching and filtering scene graph"""
     
@@ -22,6 +76,13 @@ class SceneSearchWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.search_manager = None
+        
+        # Coalesce keystrokes so only the final text triggers a search
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.apply_filters)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -36,7 +97,7 @@ class SceneSearchWidget(QWidget):
         search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search prims...")
-        self.search_input.textChanged.connect(self.on_search_changed)
+        self.search_input.textChanged.connect(self._search_timer.start)
         search_layout.addWidget(self.search_input)
         
         self.search_type_combo = QComboBox()
@@ -69,7 +130,7 @@ class SceneSearchWidget(QWidget):
         
         self.metadata_value_edit = QLineEdit()
         self.metadata_value_edit.setPlaceholderText("Value (optional)")
-        self.metadata_value_edit.textChanged.connect(self.apply_filters)
+        self.metadata_value_edit.textChanged.connect(self._search_timer.start)
         metadata_layout.addWidget(self.metadata_value_edit)
         filter_layout.addLayout(metadata_layout)
         
@@ -80,9 +141,13 @@ class SceneSearchWidget(QWidget):
         results_label = QLabel("Results:")
         layout.addWidget(results_label)
         
-        self.results_tree = QTreeWidget()
-        self.results_tree.setHeaderLabels(["Prim", "Type", "Path"])
-        self.results_tree.itemDoubleClicked.connect(self.on_item_double_clicked)
+        # Model/view so only visible rows are materialised, however many prims match
+        self.results_model = PrimResultsModel(self)
+        self.results_tree = QTreeView()
+        self.results_tree.setRootIsDecorated(False)
+        self.results_tree.setUniformRowHeights(True)
+        self.results_tree.setModel(self.results_model)
+        self.results_tree.doubleClicked.connect(self.on_item_double_clicked)
         layout.addWidget(self.results_tree)
         
         # Clear button
@@ -106,16 +171,16 @@ class SceneSearchWidget(QWidget):
         if not self.search_manager:
             return
         
+        types, metadata_keys = self.search_manager.scan_stage()
+        
         # Update type filter
         self.type_filter_combo.clear()
         self.type_filter_combo.addItem("All")
-        types = self.search_manager.get_prim_types()
         self.type_filter_combo.addItems(types)
         
         # Update metadata filter
         self.metadata_key_combo.clear()
         self.metadata_key_combo.addItem("None")
-        metadata_keys = self.search_manager.get_metadata_keys()
         self.metadata_key_combo.addItems(metadata_keys)
     
     def on_search_changed(self):
@@ -124,54 +189,40 @@ class SceneSearchWidget(QWidget):
     
     def apply_filters(self):
         """Apply all filters and update results"""
-        self.results_tree.clear()
+        # Dropdown changes apply immediately; drop any pending debounced run
+        self._search_timer.stop()
         
         if not self.search_manager:
+            self.results_model.clear()
             return
         
         # Get search query
         query = self.search_input.text()
         search_type = self.search_type_combo.currentText().lower()
         
-        # Perform search
-        if query:
-            results = self.search_manager.search_prims(query, search_type)
-        else:
-            # No search, get all prims
-            results = list(self.search_manager.stage.Traverse())
-        
-        # Apply type filter
         type_filter = self.type_filter_combo.currentText()
-        if type_filter != "All":
-            results = [p for p in results if p.GetTypeName() == type_filter]
-        
-        # Apply metadata filter
         metadata_key = self.metadata_key_combo.currentText()
-        if metadata_key != "None":
-            metadata_value = self.metadata_value_edit.text()
-            if metadata_value:
-                results = self.search_manager.filter_by_metadata(metadata_key, metadata_value)
-            else:
-                results = self.search_manager.filter_by_metadata(metadata_key)
-        
-        # Display results
-        for prim in results:
-            item = QTreeWidgetItem([
-                prim.GetName(),
-                prim.GetTypeName(),
-                prim.GetPath().pathString
-            ])
-            item.setData(0, Qt.ItemDataRole.UserRole, prim.GetPath().pathString)
-            self.results_tree.addTopLevelItem(item)
-    
-    def on_item_double_clicked(self, item: QTreeWidgetItem, column: int):
+        
+        # Search and filter in a single pass over the stage
+        results = self.search_manager.combined_search(
+            query,
+            search_type,
+            prim_type=type_filter if type_filter != "All" else None,
+            metadata_key=metadata_key if metadata_key != "None" else None,
+            metadata_value=self.metadata_value_edit.text() or None,
+        )
+        
+        # Display results with a single model reset
+        self.results_model.set_prims(results)
+    
+    def on_item_double_clicked(self, index: QModelIndex):
         """Handle item double-click"""
-        prim_path = item.data(0, Qt.ItemDataRole.UserRole)
+        prim_path = index.data(Qt.ItemDataRole.UserRole)
         if prim_path:
             self.selection_changed.emit(prim_path)
     
     def clear(self):
         """Clear search and results"""
         self.search_input.clear()
-        self.results_tree.clear()
+        self.results_model.clear()
 
@@ -4,14 +4,80 @@ Display and edit stage variables
 """
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
     QLabel, QPushButton, QLineEdit, QGroupBox, QFormLayout, QMessageBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
 from typing import Optional
 
 from ...managers.stage_variables import StageVariableManager
 
+# Variable names are shown but edited through the form, not in the table
+_READONLY_FLAGS = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+
+class StageVariablesModel(QAbstractTableModel):
+    """Name/value rows for the stage variables table"""
+    
+    HEADERS = ("Variable", "Value")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items = []
+        # Value edits are written to the stage through this manager
+        self.variable_manager: Optional[StageVariableManager] = None
+    
+    def set_variables(self, variables):
+        """Replace all rows from a name -> value dict"""
+        self.beginResetModel()
+        self._items = [(name, str(value)) for name, value in variables.items()]
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Number of variables"""
+        return 0 if parent.isValid() else len(self._items)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Name and value columns"""
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Cell text"""
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self._items[index.row()][index.column()]
+        return None
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        """Write an in-place value edit to the stage, keeping the row only if it sticks"""
+        if not index.isValid() or index.column() != 1 or role != Qt.ItemDataRole.EditRole:
+            return False
+        if self.variable_manager is None:
+            return False
+        row = index.row()
+        name = self._items[row][0]
+        value = str(value)
+        if not self.variable_manager.set_stage_variable(name, value):
+            return False
+        self._items[row] = (name, value)
+        self.dataChanged.emit(index, index, [role])
+        return True
+    
+    def flags(self, index):
+        """Names are read-only; values stay editable"""
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if index.column() == 0:
+            return _READONLY_FLAGS
+        return _READONLY_FLAGS | Qt.ItemFlag.ItemIsEditable
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Column titles"""
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
 
 class StageVariablesWidget(QWidget):
     """Widget for managing stage variables"""
@@ -19,6 +85,7 @@ class StageVariablesWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.variable_manager = None
+        self._refresh_pending = False
         self.init_ui()
     
     def init_ui(self):
@@ -30,9 +97,9 @@ class StageVariablesWidget(QWidget):
         layout.addWidget(title)
         
         # Variables table
-        self.variables_table = QTableWidget()
-        self.variables_table.setColumnCount(2)
-        self.variables_table.setHorizontalHeaderLabels(["Variable", "Value"])
+        self.variables_model = StageVariablesModel(self)
+        self.variables_table = QTableView()
+        self.variables_table.setModel(self.variables_model)
         self.variables_table.horizontalHeader().setStretchLastSection(True)
         layout.addWidget(self.variables_table)
         
@@ -73,30 +140,32 @@ class StageVariablesWidget(QWidget):
         """Set the USD stage"""
         if stage:
             self.variable_manager = StageVariableManager(stage)
+            self.variables_model.variable_manager = self.variable_manager
             self.refresh()
         else:
             self.variable_manager = None
-            self.variables_table.setRowCount(0)
+            self.variables_model.variable_manager = None
+            self.variables_model.set_variables({})
     
     def refresh(self):
         """Refresh variables table"""
-        self.variables_table.setRowCount(0)
-        
         if not self.variable_manager:
+            self.variables_model.set_variables({})
             return
         
-        variables = self.variable_manager.get_stage_variables()
-        self.variables_table.setRowCount(len(variables))
-        
-        row = 0
-        for name, value in variables.items():
-            name_item = QTableWidgetItem(name)
-            name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.variables_table.setItem(row, 0, name_item)
-            
-            value_item = QTableWidgetItem(str(value))
-            self.variables_table.setItem(row, 1, value_item)
-            row += 1
+        # One model reset; the view only pulls the rows it shows
+        self.variables_model.set_variables(self.variable_manager.get_stage_variables())
+    
+    def _schedule_refresh(self):
+        """Refresh once the event loop is idle, coalescing repeated requests"""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._do_refresh)
+    
+    def _do_refresh(self):
+        """Run a scheduled refresh"""
+        self._refresh_pending = False
+        self.refresh()
     
     def add_variable(self):
         """Add or update a variable"""
@@ -111,7 +180,7 @@ class StageVariablesWidget(QWidget):
             return
         
         if self.variable_manager.set_stage_variable(name, value):
-            self.refresh()
+            self._schedule_refresh()
             self.var_name_edit.clear()
             self.var_value_edit.clear()
         else:
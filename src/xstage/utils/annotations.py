@@ -54,6 +54,9 @@ class AnnotationManager:
         self.stage = stage
         self.annotations: List[Annotation] = []
         self.next_id = 1
+        # Bumped on every change made through the manager; edit annotations via
+        # set_visible()/update_annotation() rather than in place so it stays current
+        self.version = 0
     
     def add_annotation(self, annotation: Annotation) -> str:
         """Add an annotation"""
@@ -62,6 +65,7 @@ class AnnotationManager:
             self.next_id += 1
         
         self.annotations.append(annotation)
+        self.version += 1
         return annotation.id
     
     def add_text_annotation(self, text: str, position: Tuple[float, float, float],
@@ -139,9 +143,38 @@ class AnnotationManager:
         for i, ann in enumerate(self.annotations):
             if ann.id == annotation_id:
                 self.annotations.pop(i)
+                self.version += 1
                 return True
         return False
     
+    def clear_annotations(self):
+        """Remove all annotations"""
+        self.annotations.clear()
+        self.version += 1
+    
+    def get_annotation(self, annotation_id: str) -> Optional[Annotation]:
+        """Get an annotation by id"""
+        for ann in self.annotations:
+            if ann.id == annotation_id:
+                return ann
+        return None
+    
+    def update_annotation(self, annotation_id: str, **changes) -> bool:
+        """Change fields of an annotation (e.g. text, color, visible)"""
+        ann = self.get_annotation(annotation_id)
+        if ann is None or 'id' in changes:
+            return False
+        if not all(hasattr(ann, name) for name in changes):
+            return False
+        for name, value in changes.items():
+            setattr(ann, name, value)
+        self.version += 1
+        return True
+    
+    def set_visible(self, annotation_id: str, visible: bool) -> bool:
+        """Show or hide an annotation"""
+        return self.update_annotation(annotation_id, visible=visible)
+    
     def get_annotations_for_prim(self, prim_path: str) -> List[Annotation]:
         """Get all annotations for a specific prim"""
         return [ann for ann in self.annotations if ann.prim_path == prim_path]
@@ -190,6 +223,7 @@ class AnnotationManager:
                 data = json.load(f)
             
             self.annotations.clear()
+            self.version += 1
             
             for ann_data in data.get('annotations', []):
                 annotation = Annotation(
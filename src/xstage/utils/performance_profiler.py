@@ -3,11 +3,14 @@ Performance Profiling
 Track performance metrics for optimization
 """
 
+import sys
 import time
+import weakref
+from functools import lru_cache
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 try:
-    from pxr import Usd, UsdGeom, UsdLux, UsdShade
+    from pxr import Tf, Usd, UsdGeom, UsdLux, UsdShade
     USD_AVAILABLE = True
 except ImportError:
     USD_AVAILABLE = False
@@ -16,16 +19,54 @@ except ImportError:
     UsdShade = None
 
 
-@dataclass
+def _derived_type_names(schema_class) -> List[str]:
+    """typeNames of a schema class and every schema derived from it"""
+    schema_type = Tf.Type.Find(schema_class)
+    types = [schema_type] + list(schema_type.GetAllDerivedTypes())
+    names = (Usd.SchemaRegistry.GetSchemaTypeName(t) for t in types)
+    return [name for name in names if name]
+
+
+@lru_cache(maxsize=None)
+def _get_type_counters() -> Dict[str, str]:
+    """Prim typeName -> get_stage_statistics() counter, built once per process"""
+    if UsdLux is None:
+        light_classes = []
+    elif hasattr(UsdLux, "Light"):
+        light_classes = [UsdLux.Light]
+    else:
+        # UsdLux.Light was split into these bases in newer USD releases
+        light_classes = [UsdLux.BoundableLightBase, UsdLux.NonboundableLightBase]
+    
+    counters: Dict[str, str] = {}
+    # Reverse of the old if/elif order: later groups overwrite earlier ones
+    groups = [
+        ([UsdShade.Material], 'material_count'),
+        (light_classes, 'light_count'),
+        ([UsdGeom.Camera], 'camera_count'),
+        ([UsdGeom.Mesh], 'mesh_count'),
+    ]
+    for schema_classes, key in groups:
+        for schema_class in schema_classes:
+            for name in _derived_type_names(schema_class):
+                counters[name] = key
+    return counters
+
+
+# Slotted dataclasses need Python 3.10+; fall back to regular ones on 3.9
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class PerformanceMetric:
     """Single performance metric"""
     name: str
     value: float
     unit: str = "ms"
-    timestamp: float = field(default_factory=time.time)
+    timestamp: float = 0.0  # Wall-clock time; only set with record_timestamps
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PerformanceReport:
     """Performance report with multiple metrics"""
     stage_load_time: float = 0.0
@@ -40,24 +81,33 @@ class PerformanceReport:
 class PerformanceProfiler:
     """Profiles USD operations for performance analysis"""
     
-    def __init__(self):
+    def __init__(self, record_timestamps: bool = False):
         self.metrics: List[PerformanceMetric] = []
-        self.start_times: Dict[str, float] = {}
+        self.record_timestamps = record_timestamps
+        self.start_times: Dict[str, int] = {}  # perf_counter_ns() at start
+        # Counts from the last traversal, reused by generate_report() only for
+        # that same stage object and only until it is resynced
+        self._last_stats: Dict[str, int] = {}
+        self._last_stage: Optional[weakref.ref] = None
+        self._stats_listener = None
     
     def start_timer(self, operation_name: str):
         """Start timing an operation"""
-        self.start_times[operation_name] = time.time()
+        self.start_times[operation_name] = time.perf_counter_ns()
     
     def end_timer(self, operation_name: str) -> float:
         """End timing and return elapsed time"""
-        if operation_name in self.start_times:
-            elapsed = (time.time() - self.start_times[operation_name]) * 1000  # Convert to ms
-            del self.start_times[operation_name]
-            
-            metric = PerformanceMetric(operation_name, elapsed)
-            self.metrics.append(metric)
-            return elapsed
-        return 0.0
+        end = time.perf_counter_ns()
+        start = self.start_times.pop(operation_name, None)
+        if start is None:
+            return 0.0
+        
+        elapsed = (end - start) / 1e6  # Convert to ms
+        metric = PerformanceMetric(operation_name, elapsed)
+        if self.record_timestamps:
+            metric.timestamp = time.time()
+        self.metrics.append(metric)
+        return elapsed
     
     def profile_stage_load(self, filepath: str) -> float:
         """Profile stage loading"""
@@ -81,13 +131,15 @@ class PerformanceProfiler:
         self.start_timer("geometry_extraction")
         
         try:
-            # Count prims
-            prim_count = sum(1 for _ in stage.Traverse())
-            
-            # Count meshes
-            if UsdGeom:
-                mesh_count = sum(1 for prim in stage.Traverse() 
-                               if prim.IsA(UsdGeom.Mesh))
+            # Count prims and meshes in a single pass
+            prim_count = 0
+            mesh_count = 0
+            Mesh = UsdGeom.Mesh
+            for prim in stage.Traverse():
+                prim_count += 1
+                if prim.IsA(Mesh):
+                    mesh_count += 1
+            self._remember_stats(stage, {'prim_count': prim_count, 'mesh_count': mesh_count})
             
             elapsed = self.end_timer("geometry_extraction")
             return elapsed
@@ -108,18 +160,23 @@ class PerformanceProfiler:
             'material_count': 0,
         }
         
+        type_counters = _get_type_counters()
+        # Newer USD marks lights with LightAPI; catch it on otherwise unknown types
+        light_api = None
+        if UsdLux and not hasattr(UsdLux, "Light"):
+            light_api = UsdLux.LightAPI
+        
         for prim in stage.Traverse():
             stats['prim_count'] += 1
             
-            if UsdGeom and prim.IsA(UsdGeom.Mesh):
-                stats['mesh_count'] += 1
-            elif UsdGeom and prim.IsA(UsdGeom.Camera):
-                stats['camera_count'] += 1
-            elif UsdLux and prim.IsA(UsdLux.Light):
-                stats['light_count'] += 1
-            elif UsdShade and prim.IsA(UsdShade.Material):
-                stats['material_count'] += 1
+            key = type_counters.get(prim.GetTypeName())
+            if key is None:
+                if light_api is not None and prim.HasAPI(light_api):
+                    stats['light_count'] += 1
+            else:
+                stats[key] += 1
         
+        self._remember_stats(stage, stats)
         return stats
     
     def generate_report(self, stage: Usd.Stage = None) -> PerformanceReport:
@@ -137,9 +194,12 @@ class PerformanceProfiler:
         
         report.metrics = self.metrics
         
-        # Get stage statistics
+        # Get stage statistics, re-traversing only if the cached ones are stale
         if stage:
-            stats = self.get_stage_statistics(stage)
+            if self._has_stats_for(stage):
+                stats = self._last_stats
+            else:
+                stats = self.get_stage_statistics(stage)
             report.prim_count = stats.get('prim_count', 0)
             report.mesh_count = stats.get('mesh_count', 0)
         
@@ -149,4 +209,30 @@ class PerformanceProfiler:
         """Clear all metrics"""
         self.metrics.clear()
         self.start_times.clear()
+        self.invalidate_stats()
+    
+    def invalidate_stats(self):
+        """Forget cached stage counts, e.g. after the stage was edited"""
+        self._last_stats = {}
+        self._last_stage = None
+        if self._stats_listener is not None:
+            self._stats_listener.Revoke()
+            self._stats_listener = None
+    
+    def _remember_stats(self, stage: Usd.Stage, stats: Dict[str, int]):
+        """Cache counts for stage and drop them once its prims are resynced"""
+        self.invalidate_stats()
+        self._last_stats = stats
+        self._last_stage = weakref.ref(stage)
+        self._stats_listener = Tf.Notice.Register(
+            Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+    
+    def _has_stats_for(self, stage: Usd.Stage) -> bool:
+        """Whether the cached counts belong to this exact, unchanged stage"""
+        return self._last_stage is not None and self._last_stage() is stage
+    
+    def _on_objects_changed(self, notice, sender):
+        """Prim counts only change on resyncs"""
+        if notice.GetResyncedPaths():
+            self.invalidate_stats()
 
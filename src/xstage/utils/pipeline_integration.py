@@ -3,18 +3,24 @@ Pipeline Integration
 Easy integration with VFX pipelines (ShotGrid, Nuke, Houdini, etc.)
 """
 
-from typing import Optional, Dict, List
-from pathlib import Path
+from typing import Optional, Dict, List, Tuple
+import copy
 import json
+import os
 
 try:
-    from pxr import Usd, UsdGeom
+    from pxr import Usd, UsdGeom, Sdf
     USD_AVAILABLE = True
 except ImportError:
     USD_AVAILABLE = False
     UsdGeom = None
 
 
+# Parsed configs keyed by path, tagged with the file's (mtime_ns, size).
+# Never handed out directly; each instance gets its own copy.
+_CFG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+
+
 class PipelineIntegration:
     """Manages pipeline integration"""
     
@@ -22,10 +28,19 @@ class PipelineIntegration:
         self.pipeline_config = {}
     
     def load_config(self, config_path: str) -> bool:
-        """Load pipeline configuration"""
+        """Load pipeline configuration (re-parsed only when the file changes)"""
         try:
+            st = os.stat(config_path)
+            file_key = (st.st_mtime_ns, st.st_size)
+            cached = _CFG_CACHE.get(config_path)
+            if cached is not None and cached[0] == file_key:
+                self.pipeline_config = copy.deepcopy(cached[1])
+                return True
+            
             with open(config_path, 'r') as f:
-                self.pipeline_config = json.load(f)
+                config = json.load(f)
+            _CFG_CACHE[config_path] = (file_key, config)
+            self.pipeline_config = copy.deepcopy(config)
             return True
         except Exception as e:
             print(f"Error loading pipeline config: {e}")
@@ -37,7 +52,7 @@ class PipelineIntegration:
             asset_paths = self.pipeline_config['asset_paths']
             if asset_type in asset_paths:
                 base_path = asset_paths[asset_type]
-                return str(Path(base_path) / asset_name)
+                return os.path.join(base_path, asset_name)
         return None
     
     def get_render_output_path(self, shot_name: str, render_name: str) -> Optional[str]:
@@ -45,7 +60,7 @@ class PipelineIntegration:
         if 'render_outputs' in self.pipeline_config:
             render_outputs = self.pipeline_config['render_outputs']
             base_path = render_outputs.get('base_path', '')
-            return str(Path(base_path) / shot_name / render_name)
+            return os.path.join(base_path, shot_name, render_name)
         return None
     
     def create_shot_stage(self, shot_name: str, output_path: str) -> Optional[Usd.Stage]:
@@ -54,24 +69,22 @@ class PipelineIntegration:
             return None
         
         try:
-            stage = Usd.Stage.CreateNew(output_path)
+            # Author the structure as layer specs, so no stage composes until it is opened
+            root_layer = Sdf.Layer.CreateNew(output_path)
             
             # Create standard shot structure
-            root = UsdGeom.Xform.Define(stage, '/World')
-            stage.SetDefaultPrim(root.GetPrim())
+            root = Sdf.PrimSpec(root_layer, 'World', Sdf.SpecifierDef, 'Xform')
+            root_layer.defaultPrim = root.name
             
             # Create standard prims
-            UsdGeom.Xform.Define(stage, '/World/geo')
-            UsdGeom.Xform.Define(stage, '/World/lights')
-            UsdGeom.Xform.Define(stage, '/World/cameras')
-            UsdGeom.Xform.Define(stage, '/World/props')
+            for name in ('geo', 'lights', 'cameras', 'props'):
+                Sdf.PrimSpec(root, name, Sdf.SpecifierDef, 'Xform')
             
             # Set metadata
-            root_layer = stage.GetRootLayer()
             root_layer.comment = f"Shot: {shot_name}"
             
-            stage.GetRootLayer().Save()
-            return stage
+            root_layer.Save()
+            return Usd.Stage.Open(root_layer)
         except Exception as e:
             print(f"Error creating shot stage: {e}")
             return None
@@ -139,3 +139,103 @@ def test_layer_composition_manager():
     finally:
         Path(stage_path).unlink()
 
+
+
+def test_selection_set_manager_indices():
+    """Test SelectionSetManager lookup indices stay consistent"""
+    pytest.importorskip("pxr")
+    
+    from xstage.managers import SelectionSetManager
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_path = str(Path(tmp_dir) / "selection_sets.json")
+        manager = SelectionSetManager(config_path=config_path)
+        
+        manager.create_selection_set("hero", ["/World/hero"], tags=["chars"])
+        manager.create_selection_set("props", ["/World/cup"], tags=["props"])
+        assert manager.get_selection_set("hero").prim_paths == ("/World/hero",)
+        
+        # Re-tagging moves the set between tag buckets
+        manager.update_selection_set("hero", tags=["props"])
+        assert manager.get_selection_sets_by_tag("chars") == []
+        assert [s.name for s in manager.get_selection_sets_by_tag("props")] == ["props", "hero"]
+        
+        # Re-creating a name replaces the old set
+        manager.create_selection_set("hero", ["/World/hero2"])
+        assert len(manager.selection_sets) == 2
+        assert manager.get_selection_sets_by_tag("props")[0].name == "props"
+        
+        assert manager.delete_selection_set("props")
+        assert manager.get_selection_set("props") is None
+        assert [s.name for s in manager.get_selection_sets_for_stage(None)] == ["hero"]
+        
+        # Indices are rebuilt on load
+        manager.flush()
+        reloaded = SelectionSetManager(config_path=config_path)
+        assert reloaded.get_selection_set("hero").prim_paths == ("/World/hero2",)
+
+
+def test_namespace_editor_batch_applies_every_edit():
+    """Test renames inside a batch are all applied, not just the last one"""
+    pytest.importorskip("pxr")
+    
+    from xstage.managers import NamespaceEditor
+    from pxr import Usd
+    
+    stage = Usd.Stage.CreateInMemory()
+    for path in ("/a", "/a/child", "/b", "/c"):
+        stage.DefinePrim(path)
+    
+    editor = NamespaceEditor(stage)
+    with editor.batch():
+        assert editor.rename_prim("/a", "a2")
+        assert editor.rename_prim("/b", "b2")
+        # Depends on the rename above, so the batch must recompose first
+        assert editor.rename_prim("/a2/child", "child2")
+    
+    paths = sorted(prim.GetPath().pathString for prim in stage.Traverse())
+    assert paths == ["/a2", "/a2/child2", "/b2", "/c"]
+    assert not editor.can_rename("/missing", "x")
+    assert editor.can_rename("/c", "c2")
+    assert stage.GetPrimAtPath("/c")
+
+
+def test_set_prim_transform_keeps_animation():
+    """Test setting a transform on an animated prim keeps its other keys"""
+    pytest.importorskip("pxr")
+    
+    from xstage.managers import PrimSelectionManager
+    from pxr import Usd, UsdGeom, Gf
+    
+    stage = Usd.Stage.CreateInMemory()
+    xform = UsdGeom.Xform.Define(stage, "/animated")
+    translate_op = xform.AddTranslateOp()
+    translate_op.Set(Gf.Vec3d(1, 0, 0), 1)
+    translate_op.Set(Gf.Vec3d(10, 0, 0), 10)
+    
+    manager = PrimSelectionManager(stage)
+    target = Gf.Matrix4d().SetTranslate(Gf.Vec3d(5, 0, 0))
+    assert manager.set_prim_transform(xform.GetPrim(), target, 5)
+    
+    def translation_at(time):
+        return xform.GetLocalTransformation(time).ExtractTranslation()
+    
+    assert translation_at(1) == Gf.Vec3d(1, 0, 0)
+    assert translation_at(5) == Gf.Vec3d(5, 0, 0)
+    assert translation_at(10) == Gf.Vec3d(10, 0, 0)
+    assert sorted(xform.GetTimeSamples()) == [1.0, 5.0, 10.0]
+
+
+def test_find_all_coordinate_systems_skips_plain_prims():
+    """Test scanning a populated stage without coordinate systems"""
+    pytest.importorskip("pxr")
+    
+    from xstage.managers import CoordinateSystemManager
+    from pxr import Usd, UsdGeom
+    
+    stage = Usd.Stage.CreateInMemory()
+    UsdGeom.Xform.Define(stage, "/World")
+    UsdGeom.Mesh.Define(stage, "/World/mesh")
+    
+    manager = CoordinateSystemManager(stage)
+    assert manager.find_all_coordinate_systems() == []